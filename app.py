@@ -4,11 +4,26 @@ Simple web interface for fact-checking and propaganda detection
 """
 
 import streamlit as st
+import base64
+import hashlib
 import json
+import re
+import time
+import traceback
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Final
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from news_analyzer import NewsAnalyzer
+from news_analyzer import NewsAnalyzer, ResponseCache, SYSTEM_MESSAGE, PROMPT_CACHE_KEY, ANALYSIS_CACHE_TTL, extract_json
+
+# Optional faster JSON parser (accepts bytes directly)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # App Version
 APP_VERSION = "1.2.0"
@@ -23,7 +38,7 @@ st.set_page_config(
 )
 
 # Custom CSS for modern, clean styling (matching HTML template)
-st.markdown("""
+APP_CSS = """
     <style>
     /* Main Layout */
     .main .block-container {
@@ -249,46 +264,488 @@ st.markdown("""
         background: #5568d3;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_data
+def get_app_css():
+    """Get the app stylesheet (built once per server process)"""
+    return APP_CSS
+
+# Streamlit drops elements that are not re-emitted on a rerun, so the
+# stylesheet is written every run; only the string itself is cached.
+st.markdown(get_app_css(), unsafe_allow_html=True)
 
 # Initialize session state
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = None
 if 'last_result' not in st.session_state:
     st.session_state.last_result = None
 
-@st.cache_resource
+@st.cache_resource(show_spinner="Initializing analyzer...")
 def get_analyzer():
-    """Get or create analyzer instance"""
+    """Get the analyzer shared by all sessions (a failed init is not cached, so it is retried)"""
+    return NewsAnalyzer()
+
+class AnalysisFailed(Exception):
+    """Carries a failed analysis result out of the cache so it is not stored"""
+    def __init__(self, result):
+        super().__init__(result.get("error", "Analysis failed"))
+        self.result = result
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _analyze_news_cached(url):
+    """Run the full analysis for a URL (successful results only are cached)"""
+    result = get_analyzer().analyze_news(url)
+    if not result.get("success"):
+        raise AnalysisFailed(result)
+    return result
+
+def analyze_url(url):
+    """Analyze a URL, reusing the result if it was analyzed in the last hour"""
     try:
-        return NewsAnalyzer()
-    except Exception as e:
-        st.error(f"Error initializing analyzer: {str(e)}")
-        return None
-
-def format_score_color(score, max_score):
-    """Get color based on score percentage"""
-    percentage = (score / max_score) * 100
-    if percentage >= 70:
-        return "🟢"
-    elif percentage >= 50:
-        return "🟡"
-    else:
-        return "🔴"
+        return _analyze_news_cached(url)
+    except AnalysisFailed as e:
+        return e.result
+
+# Minimum seconds between redraws of the streamed response
+STREAM_REFRESH_SECONDS = 0.075
+
+def stream_analysis(prompt, temperature, max_tokens):
+    """Stream the model's analysis, showing the response as it arrives"""
+    analyzer = get_analyzer()
+    request = {
+        "model": analyzer.model,
+        "messages": [
+            SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "extra_body": {"prompt_cache_key": PROMPT_CACHE_KEY}
+    }
+    
+    # Identical requests are answered from disk (survives restarts and reruns)
+    cache = analyzer.response_cache
+    cache_key = ResponseCache.make_key(**request)
+    cached = cache.get(cache_key, max_age=ANALYSIS_CACHE_TTL)
+    if cached is not None:
+        return cached
+    
+    stream = analyzer.client.chat.completions.create(**request, stream=True)
+    
+    placeholder = st.empty()
+    parts = []
+    last_update = time.monotonic()
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        parts.append(delta)
+        now = time.monotonic()
+        if now - last_update >= STREAM_REFRESH_SECONDS:
+            placeholder.code("".join(parts), language="json")
+            last_update = now
+    placeholder.empty()
+    
+    analysis_text = "".join(parts)
+    if analysis_text:
+        cache.set(cache_key, analysis_text)
+    return analysis_text
+
+@st.cache_resource
+def get_rules():
+    """Load the analysis rules once per server process"""
+    return get_analyzer().load_rules()
+
+def content_key(content):
+    """Short digest of the article text, used as its cache key"""
+    return hashlib.blake2b(content.encode('utf-8', 'ignore'), digest_size=16).hexdigest()
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _build_analysis_result(title, url, content_hash, text_hash, _content, _analysis_text):
+    """Parse the model's reply into a result (cached on the digests; no UI calls in here,
+    since Streamlit would record and replay them with every cache hit)"""
+    analyzer = get_analyzer()
+    article_data = {
+        "success": True,
+        "title": title,
+        "content": _content,
+        "url": url
+    }
+    
+    # Parse JSON
+    try:
+        analysis_json = extract_json(_analysis_text)
+        analysis_json = analyzer.refine_category_based_on_scores(analysis_json, article_data)
+    except json.JSONDecodeError:
+        analysis_json = {"raw_response": _analysis_text}
+    
+    return {
+        "success": True,
+        "url": url,
+        "article": article_data,
+        "analysis": analysis_json
+    }
 
+def run_analysis(title, content, url):
+    """Analyze pasted or extension-supplied article text (repeat requests come from the response cache)"""
+    article_data = {
+        "success": True,
+        "title": title,
+        "content": content,
+        "url": url
+    }
+    prompt = get_analyzer().create_analysis_prompt(article_data, get_rules())
+    # Streamed here, outside any cached function, so the live preview isn't stored
+    analysis_text = stream_analysis(prompt, temperature=0.5, max_tokens=6000)
+    return _build_analysis_result(title, url, content_key(content), content_key(analysis_text),
+                                  content, analysis_text)
+
+# Score band boundaries (<50, 50-69, >=70)
+SCORE_THRESHOLDS: Final = (50, 70)
+
+def _top5(d, key):
+    """Get an iterator over the first five items of a list field, or None if it is missing/empty"""
+    items = d.get(key)
+    return islice(items, 5) if items else None
+
+# verdict-box color classes matching st.error / st.warning / st.info / st.success
+ALERT_CLASSES = {
+    "error": "propaganda",
+    "warning": "misinformation",
+    "info": "opinion",
+    "success": "factual",
+}
+
+def alert_html(kind, label, text):
+    """Build a colored alert box (like st.error etc.) that can be batched with others"""
+    return f'<div class="verdict-box {ALERT_CLASSES[kind]}"><strong>{label}</strong> {text}</div>'
+
+def _bullets(items):
+    """Build a "• item" list as one markdown string (one element instead of one per item)"""
+    # The bullet lives in the separator, so no per-item string is built
+    return "• " + "\n\n• ".join(map(str, items))
+
+def _numbered(items):
+    """Build a numbered markdown list ("**1.** ...") as one string"""
+    return "\n\n".join([f"**{i}.** {item}" for i, item in enumerate(items, 1)])
+
+def feature_list_html(icon, label, items):
+    """Build one feature-card block with a numbered feature-item per entry"""
+    rows = "".join(
+        f'<div class="feature-item"><div class="feature-icon">{icon}</div>'
+        f'<div class="feature-content"><div class="feature-title">{label} {i}</div>'
+        f'<div class="feature-desc">{item}</div></div></div>'
+        for i, item in enumerate(items, 1)
+    )
+    return f'<div class="feature-card">{rows}</div>'
+
+# Static layouts for the world-class comparison charts
+CHART_LAYOUTS = {
+    'comparison': dict(
+        title='📊 Reporting Quality: This Article vs World-Class Standards',
+        xaxis_title='Categories',
+        yaxis_title='Score (0-100)',
+        barmode='group',
+        height=500,
+        xaxis={'tickangle': -45},
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    ),
+    'gap': dict(
+        title='📉 Gap Analysis: How Far Behind/Ahead of World-Class Standards',
+        xaxis_title='Categories',
+        yaxis_title='Gap (This Article - World Standard)',
+        height=400,
+        xaxis={'tickangle': -45},
+        shapes=[dict(type='line', yref='y', y0=0, y1=0, xref='paper', x0=0, x1=1,
+                     line=dict(color='gray', width=2, dash='dash'))]
+    ),
+    'radar': dict(
+        polar=dict(
+            radialaxis=dict(visible=True, range=[0, 100])
+        ),
+        title='🎯 Radar Chart: Comprehensive Quality Comparison',
+        height=500
+    ),
+}
+
+@st.cache_resource
+def get_chart_layout(chart):
+    """Get the validated Plotly layout for a chart (go.Figure copies it on use)"""
+    return go.Layout(**CHART_LAYOUTS[chart])
+
+# CSS class for each category keyword (refined categories are descriptive,
+# e.g. "Severe Misinformation - False Claims", so the keyword can be anywhere).
+# Listed in priority order: if a category names several, the earliest entry here wins
+_CATEGORY_STYLES: Final = MappingProxyType({
+    "factual": "factual",
+    "propaganda": "propaganda",
+    "misinformation": "misinformation",
+    "opinion": "opinion",
+    "analysis": "opinion",
+})
+_CATEGORY_RE: Final = re.compile("|".join(_CATEGORY_STYLES), re.IGNORECASE)
+
+@lru_cache(maxsize=64)
 def get_category_style(category):
     """Get CSS class for category"""
-    category_lower = category.lower()
-    if "factual" in category_lower:
-        return "factual"
-    elif "propaganda" in category_lower:
-        return "propaganda"
-    elif "misinformation" in category_lower:
-        return "misinformation"
-    elif "opinion" in category_lower or "analysis" in category_lower:
-        return "opinion"
+    found = {keyword.lower() for keyword in _CATEGORY_RE.findall(category or "")}
+    for keyword, style in _CATEGORY_STYLES.items():
+        if keyword in found:
+            return style
     return ""
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_comparison_figures(category_names, article_scores, world_standards, gaps):
+    """Build the four world-class comparison charts as Plotly figure dicts (cached per input)"""
+    # Imported here so renders without this section skip the import cost
+    import plotly.express as px
+
+    # Array views shared by the radar and distribution charts
+    scores_arr = np.asarray(article_scores, dtype=float)
+    standards_arr = np.asarray(world_standards, dtype=float)
+    labels_arr = np.asarray(category_names, dtype=object)
+    radar_theta = np.concatenate([labels_arr, labels_arr[:1]])  # Close the loop
+
+    # Bar chart comparing scores
+    fig = go.Figure(layout=get_chart_layout('comparison'))
+    fig.add_trace(go.Bar(
+        name='This Article',
+        x=category_names,
+        y=article_scores,
+        marker_color='#ff6b6b',
+        text=[f'{score}' for score in article_scores],
+        textposition='auto',
+    ))
+    fig.add_trace(go.Bar(
+        name='World-Class Standard',
+        x=category_names,
+        y=world_standards,
+        marker_color='#4ecdc4',
+        text=[f'{std}' for std in world_standards],
+        textposition='auto',
+    ))
+
+    # Gap analysis chart
+    fig2 = go.Figure(layout=get_chart_layout('gap'))
+    colors = ['#ff6b6b' if gap < 0 else '#4ecdc4' for gap in gaps]
+    fig2.add_trace(go.Bar(
+        x=category_names,
+        y=gaps,
+        marker_color=colors,
+        text=[f'{gap:+.0f}' for gap in gaps],
+        textposition='auto',
+    ))
+
+    # Radar chart for overall comparison
+    fig3 = go.Figure(layout=get_chart_layout('radar'))
+    fig3.add_trace(go.Scatterpolar(
+        r=np.concatenate([scores_arr, scores_arr[:1]]),
+        theta=radar_theta,
+        fill='toself',
+        name='This Article',
+        line_color='#ff6b6b'
+    ))
+    fig3.add_trace(go.Scatterpolar(
+        r=np.concatenate([standards_arr, standards_arr[:1]]),
+        theta=radar_theta,
+        fill='toself',
+        name='World-Class Standard',
+        line_color='#4ecdc4'
+    ))
+
+    # Impact Summary Chart - bucket all scores in one pass (<50, 50-69, >=70)
+    impact_buckets = np.bincount(np.digitize(scores_arr, SCORE_THRESHOLDS), minlength=3)
+    impact_data = {
+        'High Impact': int(impact_buckets[2]),
+        'Medium Impact': int(impact_buckets[1]),
+        'Low Impact': int(impact_buckets[0])
+    }
+
+    fig4 = px.pie(
+        values=list(impact_data.values()),
+        names=list(impact_data.keys()),
+        title='📊 Quality Distribution: How Many Categories Meet Standards',
+        color_discrete_map={'High Impact': '#4ecdc4', 'Medium Impact': '#ffe66d', 'Low Impact': '#ff6b6b'}
+    )
+
+    return fig.to_dict(), fig2.to_dict(), fig3.to_dict(), fig4.to_dict()
+
+@st.fragment
+def render_world_class_comparison(wcc):
+    """Render the world-class comparison section (reruns independently of the page)"""
+    st.markdown("---\n## 🌍 WORLD-CLASS REPORTING COMPARISON\n### How This Article Compares to World's Best News Organizations")
+
+    # Overall Rating
+    overall_rating = wcc.get("overall_rating_vs_world_class", 0)
+    st.metric("📊 Overall Rating vs World-Class Standards", f"{overall_rating}/100")
+
+    # Create comparison chart
+    if "comparison_categories" in wcc:
+        categories = wcc["comparison_categories"]
+
+        # Prepare data for visualization - one row per category
+        rows = [
+            (cat_name.replace("_", " ").title(),
+             cat_data.get("this_article_score", 0),
+             cat_data.get("world_class_standard", 85),
+             cat_data.get("gap", 0))
+            for cat_name, cat_data in categories.items()
+            if isinstance(cat_data, dict)
+        ]
+
+        # Create comparison charts
+        if rows:
+            category_names, article_scores, world_standards, gaps = zip(*rows)
+            figures = build_comparison_figures(category_names, article_scores, world_standards, gaps)
+            chart_labels = ["📊 View Comparison Chart", "📉 View Gap Analysis", "🎯 View Radar Chart", "📊 View Quality Distribution"]
+            for label, figure in zip(chart_labels, figures):
+                with st.expander(label, expanded=False):
+                    st.plotly_chart(figure, use_container_width=True)
+
+        # Detailed category assessments
+        st.markdown("#### 📋 Detailed Category Assessments")
+        for cat_name, cat_data in categories.items():
+            if isinstance(cat_data, dict):
+                cat_display = cat_name.replace("_", " ").title()
+                with st.expander(f"🔍 {cat_display}"):
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("This Article", f"{cat_data.get('this_article_score', 0)}/100")
+                    with col2:
+                        st.metric("World Standard", f"{cat_data.get('world_class_standard', 85)}/100")
+                    with col3:
+                        gap = cat_data.get('gap', 0)
+                        st.metric("Gap", f"{gap:+.0f}", delta=f"{abs(gap)} points")
+                    st.markdown(f"**Assessment:** {cat_data.get('assessment', 'N/A')}")
+
+    # World-class benchmarks comparison
+    if "world_class_benchmarks" in wcc:
+        st.markdown("#### 🏆 Comparison with Specific News Organizations")
+        benchmarks = wcc["world_class_benchmarks"]
+
+        orgs = ["BBC", "Reuters", "The Guardian", "New York Times"]
+        org_data = {}
+        for org in orgs:
+            key = f"{org.lower().replace(' ', '_').replace('the_', '')}_standard"
+            if key in benchmarks:
+                org_data[org] = benchmarks[key]
+
+        if org_data:
+            st.markdown("\n\n".join([f"**{org}:** {assessment}" for org, assessment in org_data.items()]))
+
+    # Strengths and improvements
+    col1, col2 = st.columns(2)
+    with col1:
+        strengths = wcc.get("strengths")
+        if strengths:
+            st.markdown("#### ✅ Strengths (Matches World-Class)")
+            st.success(_bullets(strengths))
+
+    with col2:
+        improvement_needed = wcc.get("improvement_needed")
+        if improvement_needed:
+            st.markdown("#### ⚠️ Areas Needing Improvement")
+            st.error(_bullets(improvement_needed))
+
+    if "overall_assessment" in wcc.get("world_class_benchmarks", {}):
+        st.markdown("#### 🌐 Overall World-Class Assessment")
+        st.info(wcc["world_class_benchmarks"]["overall_assessment"])
+
+# (field, heading, Streamlit call) for the beneficiary lists in each column
+BENEFICIARY_SECTIONS = (
+    (
+        ("direct_beneficiaries", "#### ✅ Direct Beneficiaries", st.success),
+        ("indirect_beneficiaries", "#### 🔗 Indirect Beneficiaries", st.warning),
+    ),
+    (
+        ("political_beneficiaries", "#### 🏛️ Political Beneficiaries", st.markdown),
+        ("economic_beneficiaries", "#### 💵 Economic Beneficiaries", st.markdown),
+        ("who_loses", "#### ❌ Who Stands to Lose", st.error),
+    ),
+)
+
+# (field, heading) for the three connection columns (top five items each)
+CONNECTION_SECTIONS = (
+    ("media_connections", "**📺 Media Connections:**"),
+    ("business_relationships", "**💼 Business Relationships:**"),
+    ("political_affiliations", "**🏛️ Political Affiliations:**"),
+)
+
+@st.fragment
+def render_beneficiary_analysis(ba):
+    """Render the beneficiary & hidden agenda section (reruns independently of the page)"""
+    st.markdown("---\n## 💰 BENEFICIARY & HIDDEN AGENDA ANALYSIS\n### Who Benefits? What's Being Hidden?")
+
+    # Critical findings first (most important) - written as one block
+    alerts = []
+    real_news_hidden = ba.get("real_news_hidden")
+    if real_news_hidden:
+        alerts.append(alert_html("error", "🔍 Real News Being Hidden:", real_news_hidden))
+
+    agenda_masking = ba.get("agenda_masking")
+    if agenda_masking:
+        alerts.append(alert_html("warning", "🎭 Agenda Masking:", agenda_masking))
+
+    distraction_purpose = ba.get("distraction_purpose")
+    if distraction_purpose:
+        alerts.append(alert_html("warning", "🎪 Distraction Purpose:", distraction_purpose))
+
+    timing_analysis = ba.get("timing_analysis")
+    if timing_analysis:
+        alerts.append(alert_html("info", "⏰ Timing Analysis:", timing_analysis))
+
+    if alerts:
+        st.markdown("".join(alerts), unsafe_allow_html=True)
+
+    # People, beneficiaries, connections and conflicts each get their own tab
+    tab_people, tab_beneficiaries, tab_connections, tab_conflicts = st.tabs(
+        ["👥 People", "💰 Beneficiaries", "🔗 Connections", "⚠️ Conflicts"]
+    )
+
+    with tab_people:
+        people_involved = ba.get("people_involved")
+        if people_involved:
+            st.markdown("#### 👥 People/Entities Involved\n\n" + _bullets(people_involved))
+        else:
+            st.caption("No people or entities identified.")
+
+    with tab_beneficiaries:
+        for col, sections in zip(st.columns(2), BENEFICIARY_SECTIONS):
+            with col:
+                for key, heading, render in sections:
+                    items = ba.get(key)
+                    if items:
+                        st.markdown(heading)
+                        render(_bullets(items))
+
+    with tab_connections:
+        connections = ba.get("connections_and_relationships")
+        if connections:
+            st.markdown("#### 🔗 Connections & Relationships")
+            for col, (key, heading) in zip(st.columns(3), CONNECTION_SECTIONS):
+                items = _top5(connections, key)
+                if items:
+                    with col:
+                        st.markdown(heading)
+                        st.caption(_bullets(items))
+
+            undisclosed_relationships = connections.get("undisclosed_relationships")
+            if undisclosed_relationships:
+                st.markdown("---\n**⚠️ Undisclosed Relationships:**")
+                st.error(_bullets(undisclosed_relationships))
+        else:
+            st.caption("No connections or relationships identified.")
+
+    with tab_conflicts:
+        conflict_of_interest = ba.get("conflict_of_interest")
+        if conflict_of_interest:
+            st.markdown("#### ⚠️ Conflicts of Interest")
+            st.error(_bullets(conflict_of_interest))
+        else:
+            st.caption("No conflicts of interest identified.")
+
 def display_analysis_result(result):
     """Display the analysis result in a formatted way"""
     if not result or not result.get("success"):
@@ -322,30 +779,29 @@ def display_analysis_result(result):
     """, unsafe_allow_html=True)
     
     # Category reasoning and keywords - In cards
-    if "category_reasoning" in analysis and analysis.get("category_reasoning") or "category_keywords" in analysis and analysis.get("category_keywords"):
+    category_reasoning = analysis.get("category_reasoning")
+    category_keywords = _top5(analysis, "category_keywords")
+    if category_reasoning or category_keywords:
         col_reason, col_keywords = st.columns(2)
         with col_reason:
-            if "category_reasoning" in analysis and analysis.get("category_reasoning"):
+            if category_reasoning:
                 st.markdown(f"""
                 <div class="info-card" style="border-left-color: #17a2b8;">
                     <div style="font-weight: 600; color: #17a2b8; margin-bottom: 8px;">📝 Category Reasoning</div>
-                    <div style="color: #555; line-height: 1.6; font-size: 14px;">{analysis.get('category_reasoning')}</div>
+                    <div style="color: #555; line-height: 1.6; font-size: 14px;">{category_reasoning}</div>
                 </div>
                 """, unsafe_allow_html=True)
         with col_keywords:
-            if "category_keywords" in analysis and analysis.get("category_keywords"):
-                keywords = analysis.get("category_keywords", [])
-                if keywords:
-                    st.markdown(f"""
-                    <div class="info-card" style="border-left-color: #ffc107;">
-                        <div style="font-weight: 600; color: #ff9800; margin-bottom: 8px;">🔑 Key Terms</div>
-                        <div style="color: #555; line-height: 1.6; font-size: 14px;">{', '.join(keywords[:5])}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+            if category_keywords:
+                st.markdown(f"""
+                <div class="info-card" style="border-left-color: #ffc107;">
+                    <div style="font-weight: 600; color: #ff9800; margin-bottom: 8px;">🔑 Key Terms</div>
+                    <div style="color: #555; line-height: 1.6; font-size: 14px;">{', '.join(category_keywords)}</div>
+                </div>
+                """, unsafe_allow_html=True)
     
     # Score breakdown - Modern Gradient Cards
-    st.markdown("---")
-    st.markdown('<div class="section-header">📈 Detailed Scoring</div>', unsafe_allow_html=True)
+    st.markdown('---\n<div class="section-header">📈 Detailed Scoring</div>', unsafe_allow_html=True)
     
     # Collect all scores
     scores_data = []
@@ -417,15 +873,17 @@ def display_analysis_result(result):
     # Display scores in gradient cards (3 columns)
     if scores_data:
         cols = st.columns(min(len(scores_data), 3))
-        for idx, score_data in enumerate(scores_data):
-            with cols[idx % 3]:
-                st.markdown(f"""
-                <div class="score-card">
-                    <div class="stat-number">{score_data['percentage']}%</div>
-                    <div class="stat-label">{score_data['icon']} {score_data['name']}</div>
-                    <div style="font-size: 12px; opacity: 0.9; margin-top: 8px;">{score_data['score']}/{score_data['max']}</div>
-                </div>
-                """, unsafe_allow_html=True)
+        for col_idx, col in enumerate(cols):
+            with col:
+                # One markdown element per column holding all of its cards
+                st.markdown("".join(
+                    f'<div class="score-card">'
+                    f'<div class="stat-number">{score_data["percentage"]}%</div>'
+                    f'<div class="stat-label">{score_data["icon"]} {score_data["name"]}</div>'
+                    f'<div style="font-size: 12px; opacity: 0.9; margin-top: 8px;">{score_data["score"]}/{score_data["max"]}</div>'
+                    f'</div>'
+                    for score_data in scores_data[col_idx::len(cols)]
+                ), unsafe_allow_html=True)
         
         # Show detailed reasoning in expandable section
         with st.expander("📋 View Detailed Reasoning", expanded=False):
@@ -436,8 +894,7 @@ def display_analysis_result(result):
     
     # India-Specific Analysis - Modern Card Layout
     if "india_specific_analysis" in analysis:
-        st.markdown("---")
-        st.markdown('<div class="section-header">🇮🇳 India-Specific Analysis</div>', unsafe_allow_html=True)
+        st.markdown('---\n<div class="section-header">🇮🇳 India-Specific Analysis</div>', unsafe_allow_html=True)
         isa = analysis["india_specific_analysis"]
         
         col1, col2 = st.columns(2)
@@ -473,8 +930,7 @@ def display_analysis_result(result):
     
     # Comprehensive Verdict - Modern Card
     if "verdict" in analysis:
-        st.markdown("---")
-        st.markdown('<div class="section-header">📋 Comprehensive Verdict</div>', unsafe_allow_html=True)
+        st.markdown('---\n<div class="section-header">📋 Comprehensive Verdict</div>', unsafe_allow_html=True)
         st.markdown(f"""
         <div class="info-card" style="border-left-color: #667eea; background: #f8f9ff;">
             <div style="color: #555; line-height: 1.8; font-size: 15px;">{analysis.get("verdict", "N/A")}</div>
@@ -483,22 +939,10 @@ def display_analysis_result(result):
     
     # Key Findings - Feature List Style
     if "key_findings" in analysis:
-        st.markdown("---")
-        st.markdown('<div class="section-header">🔍 Key Findings</div>', unsafe_allow_html=True)
+        st.markdown('---\n<div class="section-header">🔍 Key Findings</div>', unsafe_allow_html=True)
         findings = analysis["key_findings"]
         if isinstance(findings, list):
-            st.markdown('<div class="feature-card">', unsafe_allow_html=True)
-            for i, finding in enumerate(findings, 1):
-                st.markdown(f"""
-                <div class="feature-item">
-                    <div class="feature-icon">🔍</div>
-                    <div class="feature-content">
-                        <div class="feature-title">Finding {i}</div>
-                        <div class="feature-desc">{finding}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown(feature_list_html("🔍", "Finding", findings), unsafe_allow_html=True)
         else:
             st.markdown(f"""
             <div class="info-card">
@@ -508,296 +952,105 @@ def display_analysis_result(result):
     
     # Critical Questions & Opposition Viewpoint - Feature Card Style
     if "critical_questions" in analysis:
-        st.markdown("---")
-        st.markdown('<div class="section-header">❓ Critical Questions & Opposition Viewpoint</div>', unsafe_allow_html=True)
+        st.markdown('---\n<div class="section-header">❓ Critical Questions & Opposition Viewpoint</div>', unsafe_allow_html=True)
         cq = analysis["critical_questions"]
         
-        if "questions_raised" in cq and cq.get("questions_raised"):
-            st.markdown('<div class="feature-card">', unsafe_allow_html=True)
+        questions_raised = _top5(cq, "questions_raised")
+        if questions_raised:
             st.markdown("#### Questions That Should Be Asked:")
-            for i, q in enumerate(cq["questions_raised"][:5], 1):
-                st.markdown(f"""
-                <div class="feature-item">
-                    <div class="feature-icon">❓</div>
-                    <div class="feature-content">
-                        <div class="feature-title">Question {i}</div>
-                        <div class="feature-desc">{q}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown(feature_list_html("❓", "Question", questions_raised), unsafe_allow_html=True)
     
     # Opposition Viewpoint - Info Card
-    if "opposition_viewpoint" in analysis and analysis.get("opposition_viewpoint"):
-        st.markdown("---")
-        st.markdown('<div class="section-header">🗣️ Opposition Viewpoint</div>', unsafe_allow_html=True)
+    opposition_viewpoint = analysis.get("opposition_viewpoint")
+    if opposition_viewpoint:
+        st.markdown('---\n<div class="section-header">🗣️ Opposition Viewpoint</div>', unsafe_allow_html=True)
         st.markdown(f"""
         <div class="info-card" style="border-left-color: #dc3545; background: #fff5f5;">
             <div style="font-weight: 600; color: #dc3545; margin-bottom: 12px;">📖 Opposition Analysis</div>
-            <div style="color: #555; line-height: 1.8;">{analysis.get("opposition_viewpoint")}</div>
+            <div style="color: #555; line-height: 1.8;">{opposition_viewpoint}</div>
         </div>
         """, unsafe_allow_html=True)
     
     # Citizen Accountability Section
     if "citizen_accountability" in analysis:
-        st.markdown("---")
-        st.markdown("## 👥 CITIZEN ACCOUNTABILITY")
-        st.markdown("### What Should Have Been Reported for Indian Citizens")
+        st.markdown("---\n## 👥 CITIZEN ACCOUNTABILITY\n### What Should Have Been Reported for Indian Citizens")
         
         ca = analysis["citizen_accountability"]
         
         # Important highlights first
-        if "real_citizen_impact" in ca and ca.get("real_citizen_impact"):
-            st.error(f"**💡 Real Impact on Citizens (Not Covered):** {ca.get('real_citizen_impact')}")
+        real_citizen_impact = ca.get("real_citizen_impact")
+        if real_citizen_impact:
+            st.error(f"**💡 Real Impact on Citizens (Not Covered):** {real_citizen_impact}")
         
-        if "citizen_right_to_know" in ca and ca.get("citizen_right_to_know"):
-            st.warning(f"**📜 Citizen's Right to Know:** {ca.get('citizen_right_to_know')}")
+        citizen_right_to_know = ca.get("citizen_right_to_know")
+        if citizen_right_to_know:
+            st.warning(f"**📜 Citizen's Right to Know:** {citizen_right_to_know}")
         
-        if "democratic_accountability" in ca and ca.get("democratic_accountability"):
-            st.info(f"**🗳️ Democratic Accountability:** {ca.get('democratic_accountability')}")
+        democratic_accountability = ca.get("democratic_accountability")
+        if democratic_accountability:
+            st.info(f"**🗳️ Democratic Accountability:** {democratic_accountability}")
         
         st.markdown("---")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            if "questions_citizens_should_ask" in ca and ca["questions_citizens_should_ask"]:
+            questions_citizens_should_ask = _top5(ca, "questions_citizens_should_ask")
+            if questions_citizens_should_ask:
                 st.markdown("#### ❓ Questions Citizens Should Ask")
-                for i, q in enumerate(ca["questions_citizens_should_ask"][:5], 1):
-                    st.markdown(f"**{i}.** {q}")
+                st.markdown(_numbered(questions_citizens_should_ask))
             
-            if "topics_should_have_covered" in ca and ca["topics_should_have_covered"]:
+            topics_should_have_covered = _top5(ca, "topics_should_have_covered")
+            if topics_should_have_covered:
                 st.markdown("#### 📋 Topics Article Should Have Covered")
-                for i, topic in enumerate(ca["topics_should_have_covered"][:5], 1):
-                    st.markdown(f"**{i}.** {topic}")
+                st.markdown(_numbered(topics_should_have_covered))
         
         with col2:
-            if "information_citizens_need" in ca and ca["information_citizens_need"]:
+            information_citizens_need = _top5(ca, "information_citizens_need")
+            if information_citizens_need:
                 st.markdown("#### 📰 Information Citizens Need (Missing)")
-                for i, info in enumerate(ca["information_citizens_need"][:5], 1):
-                    st.markdown(f"**{i}.** {info}")
+                st.markdown(_numbered(information_citizens_need))
             
-            if "accountability_gaps" in ca and ca["accountability_gaps"]:
+            accountability_gaps = _top5(ca, "accountability_gaps")
+            if accountability_gaps:
                 st.markdown("#### ⚖️ Accountability Gaps")
-                for i, gap in enumerate(ca["accountability_gaps"][:5], 1):
-                    st.markdown(f"**{i}.** {gap}")
+                st.markdown(_numbered(accountability_gaps))
         
-        if "transparency_issues" in ca and ca["transparency_issues"]:
-            st.markdown("---")
-            st.markdown("#### 🔍 Transparency Issues")
-            for i, issue in enumerate(ca["transparency_issues"][:5], 1):
-                st.markdown(f"**{i}.** {issue}")
+        transparency_issues = _top5(ca, "transparency_issues")
+        if transparency_issues:
+            st.markdown("---\n#### 🔍 Transparency Issues")
+            st.markdown(_numbered(transparency_issues))
         
-        if "what_should_have_been_investigated" in ca and ca["what_should_have_been_investigated"]:
-            st.markdown("---")
-            st.markdown("#### 🔎 What Should Have Been Investigated")
-            for i, inv in enumerate(ca["what_should_have_been_investigated"][:5], 1):
-                st.markdown(f"**{i}.** {inv}")
+        what_should_have_been_investigated = _top5(ca, "what_should_have_been_investigated")
+        if what_should_have_been_investigated:
+            st.markdown("---\n#### 🔎 What Should Have Been Investigated")
+            st.markdown(_numbered(what_should_have_been_investigated))
     
     # World-Class Comparison Section with Visualizations
     if "world_class_comparison" in analysis:
-        st.markdown("---")
-        st.markdown("## 🌍 WORLD-CLASS REPORTING COMPARISON")
-        st.markdown("### How This Article Compares to World's Best News Organizations")
-        
-        wcc = analysis["world_class_comparison"]
-        
-        # Overall Rating
-        overall_rating = wcc.get("overall_rating_vs_world_class", 0)
-        st.metric("📊 Overall Rating vs World-Class Standards", f"{overall_rating}/100")
-        
-        # Create comparison chart
-        if "comparison_categories" in wcc:
-            categories = wcc["comparison_categories"]
-            
-            # Prepare data for visualization
-            category_names = []
-            article_scores = []
-            world_standards = []
-            gaps = []
-            
-            for cat_name, cat_data in categories.items():
-                if isinstance(cat_data, dict):
-                    cat_display = cat_name.replace("_", " ").title()
-                    category_names.append(cat_display)
-                    article_scores.append(cat_data.get("this_article_score", 0))
-                    world_standards.append(cat_data.get("world_class_standard", 85))
-                    gaps.append(cat_data.get("gap", 0))
-            
-            # Create comparison bar chart
-            if category_names:
-                df = pd.DataFrame({
-                    'Category': category_names,
-                    'This Article': article_scores,
-                    'World-Class Standard': world_standards
-                })
-                
-                # Bar chart comparing scores
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    name='This Article',
-                    x=category_names,
-                    y=article_scores,
-                    marker_color='#ff6b6b',
-                    text=[f'{score}' for score in article_scores],
-                    textposition='auto',
-                ))
-                fig.add_trace(go.Bar(
-                    name='World-Class Standard',
-                    x=category_names,
-                    y=world_standards,
-                    marker_color='#4ecdc4',
-                    text=[f'{std}' for std in world_standards],
-                    textposition='auto',
-                ))
-                
-                fig.update_layout(
-                    title='📊 Reporting Quality: This Article vs World-Class Standards',
-                    xaxis_title='Categories',
-                    yaxis_title='Score (0-100)',
-                    barmode='group',
-                    height=500,
-                    xaxis={'tickangle': -45},
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Gap analysis chart
-                gap_df = pd.DataFrame({
-                    'Category': category_names,
-                    'Gap': gaps
-                })
-                
-                fig2 = go.Figure()
-                colors = ['#ff6b6b' if gap < 0 else '#4ecdc4' for gap in gaps]
-                fig2.add_trace(go.Bar(
-                    x=category_names,
-                    y=gaps,
-                    marker_color=colors,
-                    text=[f'{gap:+.0f}' for gap in gaps],
-                    textposition='auto',
-                ))
-                fig2.update_layout(
-                    title='📉 Gap Analysis: How Far Behind/Ahead of World-Class Standards',
-                    xaxis_title='Categories',
-                    yaxis_title='Gap (This Article - World Standard)',
-                    height=400,
-                    xaxis={'tickangle': -45},
-                    shapes=[dict(type='line', yref='y', y0=0, y1=0, xref='paper', x0=0, x1=1, 
-                                line=dict(color='gray', width=2, dash='dash'))]
-                )
-                st.plotly_chart(fig2, use_container_width=True)
-                
-                # Radar chart for overall comparison
-                fig3 = go.Figure()
-                fig3.add_trace(go.Scatterpolar(
-                    r=article_scores + [article_scores[0]],  # Close the loop
-                    theta=category_names + [category_names[0]],
-                    fill='toself',
-                    name='This Article',
-                    line_color='#ff6b6b'
-                ))
-                fig3.add_trace(go.Scatterpolar(
-                    r=world_standards + [world_standards[0]],
-                    theta=category_names + [category_names[0]],
-                    fill='toself',
-                    name='World-Class Standard',
-                    line_color='#4ecdc4'
-                ))
-                fig3.update_layout(
-                    polar=dict(
-                        radialaxis=dict(visible=True, range=[0, 100])
-                    ),
-                    title='🎯 Radar Chart: Comprehensive Quality Comparison',
-                    height=500
-                )
-                st.plotly_chart(fig3, use_container_width=True)
-                
-                # Impact Summary Chart
-                impact_data = {
-                    'High Impact': sum(1 for score in article_scores if score >= 70),
-                    'Medium Impact': sum(1 for score in article_scores if 50 <= score < 70),
-                    'Low Impact': sum(1 for score in article_scores if score < 50)
-                }
-                
-                fig4 = px.pie(
-                    values=list(impact_data.values()),
-                    names=list(impact_data.keys()),
-                    title='📊 Quality Distribution: How Many Categories Meet Standards',
-                    color_discrete_map={'High Impact': '#4ecdc4', 'Medium Impact': '#ffe66d', 'Low Impact': '#ff6b6b'}
-                )
-                st.plotly_chart(fig4, use_container_width=True)
-            
-            # Detailed category assessments
-            st.markdown("#### 📋 Detailed Category Assessments")
-            for cat_name, cat_data in categories.items():
-                if isinstance(cat_data, dict):
-                    cat_display = cat_name.replace("_", " ").title()
-                    with st.expander(f"🔍 {cat_display}"):
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("This Article", f"{cat_data.get('this_article_score', 0)}/100")
-                        with col2:
-                            st.metric("World Standard", f"{cat_data.get('world_class_standard', 85)}/100")
-                        with col3:
-                            gap = cat_data.get('gap', 0)
-                            st.metric("Gap", f"{gap:+.0f}", delta=f"{abs(gap)} points")
-                        st.markdown(f"**Assessment:** {cat_data.get('assessment', 'N/A')}")
-        
-        # World-class benchmarks comparison
-        if "world_class_benchmarks" in wcc:
-            st.markdown("#### 🏆 Comparison with Specific News Organizations")
-            benchmarks = wcc["world_class_benchmarks"]
-            
-            orgs = ["BBC", "Reuters", "The Guardian", "New York Times"]
-            org_data = {}
-            for org in orgs:
-                key = f"{org.lower().replace(' ', '_').replace('the_', '')}_standard"
-                if key in benchmarks:
-                    org_data[org] = benchmarks[key]
-            
-            if org_data:
-                for org, assessment in org_data.items():
-                    st.markdown(f"**{org}:** {assessment}")
-        
-        # Strengths and improvements
-        col1, col2 = st.columns(2)
-        with col1:
-            if "strengths" in wcc and wcc.get("strengths"):
-                st.markdown("#### ✅ Strengths (Matches World-Class)")
-                for strength in wcc["strengths"]:
-                    st.success(f"• {strength}")
-        
-        with col2:
-            if "improvement_needed" in wcc and wcc.get("improvement_needed"):
-                st.markdown("#### ⚠️ Areas Needing Improvement")
-                for improvement in wcc["improvement_needed"]:
-                    st.error(f"• {improvement}")
-        
-        if "overall_assessment" in wcc.get("world_class_benchmarks", {}):
-            st.markdown("#### 🌐 Overall World-Class Assessment")
-            st.info(wcc["world_class_benchmarks"]["overall_assessment"])
+        render_world_class_comparison(analysis["world_class_comparison"])
     
     # True Report Section - Most Important
     if "true_report" in analysis:
-        st.markdown("---")
-        st.markdown("## 📰 TRUE REPORT - How This Should Have Been Reported")
-        st.markdown("### Complete, Unbiased Report for Indian Citizens")
+        st.markdown("---\n## 📰 TRUE REPORT - How This Should Have Been Reported\n### Complete, Unbiased Report for Indian Citizens")
         
         tr = analysis["true_report"]
         
-        if "title" in tr and tr.get("title"):
+        title = tr.get("title")
+        if title:
             st.markdown(f"#### 📌 Proper Title")
-            st.success(tr.get("title"))
+            st.success(title)
         
-        if "lead_paragraph" in tr and tr.get("lead_paragraph"):
+        lead_paragraph = tr.get("lead_paragraph")
+        if lead_paragraph:
             st.markdown(f"#### 📝 Lead Paragraph")
-            st.info(tr.get("lead_paragraph"))
+            st.info(lead_paragraph)
         
-        if "full_report" in tr and tr.get("full_report"):
+        full_report = tr.get("full_report")
+        if full_report:
             st.markdown("#### 📄 Complete Report")
             with st.expander("📖 Read Full Report", expanded=True):
-                st.markdown(tr.get("full_report"))
+                st.markdown(full_report)
         
         if "sections" in tr:
             st.markdown("#### 📋 Report Sections")
@@ -809,40 +1062,50 @@ def display_analysis_result(result):
             ])
             
             with section_tabs[0]:
-                if "background_context" in sections and sections.get("background_context"):
-                    st.markdown(sections["background_context"])
-                if "historical_context" in sections and sections.get("historical_context"):
+                background_context = sections.get("background_context")
+                if background_context:
+                    st.markdown(background_context)
+                historical_context = sections.get("historical_context")
+                if historical_context:
                     st.markdown("**Historical Context:**")
-                    st.markdown(sections["historical_context"])
+                    st.markdown(historical_context)
             
             with section_tabs[1]:
-                if "multiple_perspectives" in sections and sections.get("multiple_perspectives"):
-                    st.markdown(sections["multiple_perspectives"])
+                multiple_perspectives = sections.get("multiple_perspectives")
+                if multiple_perspectives:
+                    st.markdown(multiple_perspectives)
             
             with section_tabs[2]:
-                if "citizen_impact_analysis" in sections and sections.get("citizen_impact_analysis"):
-                    st.markdown(sections["citizen_impact_analysis"])
-                if "citizen_rights_impact" in sections and sections.get("citizen_rights_impact"):
+                citizen_impact_analysis = sections.get("citizen_impact_analysis")
+                if citizen_impact_analysis:
+                    st.markdown(citizen_impact_analysis)
+                citizen_rights_impact = sections.get("citizen_rights_impact")
+                if citizen_rights_impact:
                     st.markdown("**Citizen Rights Impact:**")
-                    st.markdown(sections["citizen_rights_impact"])
+                    st.markdown(citizen_rights_impact)
             
             with section_tabs[3]:
-                if "accountability_questions" in sections and sections.get("accountability_questions"):
-                    st.markdown(sections["accountability_questions"])
-                if "transparency_issues" in sections and sections.get("transparency_issues"):
+                accountability_questions = sections.get("accountability_questions")
+                if accountability_questions:
+                    st.markdown(accountability_questions)
+                transparency_issues = sections.get("transparency_issues")
+                if transparency_issues:
                     st.markdown("**Transparency Issues:**")
-                    st.markdown(sections["transparency_issues"])
-                if "policy_implications" in sections and sections.get("policy_implications"):
+                    st.markdown(transparency_issues)
+                policy_implications = sections.get("policy_implications")
+                if policy_implications:
                     st.markdown("**Policy Implications:**")
-                    st.markdown(sections["policy_implications"])
+                    st.markdown(policy_implications)
             
             with section_tabs[4]:
-                if "data_and_evidence" in sections and sections.get("data_and_evidence"):
-                    st.markdown(sections["data_and_evidence"])
+                data_and_evidence = sections.get("data_and_evidence")
+                if data_and_evidence:
+                    st.markdown(data_and_evidence)
             
             with section_tabs[5]:
-                if "expert_opinions" in sections and sections.get("expert_opinions"):
-                    st.markdown(sections["expert_opinions"])
+                expert_opinions = sections.get("expert_opinions")
+                if expert_opinions:
+                    st.markdown(expert_opinions)
         
         if "sources_and_references" in tr:
             st.markdown("#### 📚 Sources & References (What Should Have Been Used)")
@@ -851,58 +1114,54 @@ def display_analysis_result(result):
             col1, col2 = st.columns(2)
             
             with col1:
-                if "primary_sources" in sources and sources.get("primary_sources"):
-                    st.markdown("**📄 Primary Sources:**")
-                    for src in sources["primary_sources"][:5]:
-                        st.markdown(f"• {src}")
+                primary_sources = _top5(sources, "primary_sources")
+                if primary_sources:
+                    st.markdown("**📄 Primary Sources:**\n\n" + _bullets(primary_sources))
                 
-                if "official_sources" in sources and sources.get("official_sources"):
-                    st.markdown("**🏛️ Official Sources:**")
-                    for src in sources["official_sources"][:5]:
-                        st.markdown(f"• {src}")
+                official_sources = _top5(sources, "official_sources")
+                if official_sources:
+                    st.markdown("**🏛️ Official Sources:**\n\n" + _bullets(official_sources))
                 
-                if "data_sources" in sources and sources.get("data_sources"):
-                    st.markdown("**📊 Data Sources:**")
-                    for src in sources["data_sources"][:5]:
-                        st.markdown(f"• {src}")
+                data_sources = _top5(sources, "data_sources")
+                if data_sources:
+                    st.markdown("**📊 Data Sources:**\n\n" + _bullets(data_sources))
             
             with col2:
-                if "expert_sources" in sources and sources.get("expert_sources"):
-                    st.markdown("**👨‍🔬 Expert Sources:**")
-                    for src in sources["expert_sources"][:5]:
-                        st.markdown(f"• {src}")
+                expert_sources = _top5(sources, "expert_sources")
+                if expert_sources:
+                    st.markdown("**👨‍🔬 Expert Sources:**\n\n" + _bullets(expert_sources))
                 
-                if "independent_sources" in sources and sources.get("independent_sources"):
-                    st.markdown("**🔍 Independent Sources:**")
-                    for src in sources["independent_sources"][:5]:
-                        st.markdown(f"• {src}")
+                independent_sources = _top5(sources, "independent_sources")
+                if independent_sources:
+                    st.markdown("**🔍 Independent Sources:**\n\n" + _bullets(independent_sources))
                 
-                if "opposition_perspectives" in sources and sources.get("opposition_perspectives"):
-                    st.markdown("**⚖️ Opposition Perspectives:**")
-                    for src in sources["opposition_perspectives"][:5]:
-                        st.markdown(f"• {src}")
+                opposition_perspectives = _top5(sources, "opposition_perspectives")
+                if opposition_perspectives:
+                    st.markdown("**⚖️ Opposition Perspectives:**\n\n" + _bullets(opposition_perspectives))
         
         if "reporting_standards" in tr:
             st.markdown("#### 📋 Reporting Standards")
             standards = tr["reporting_standards"]
             
-            if "what_was_missing" in standards and standards.get("what_was_missing"):
-                st.error(f"**❌ What Was Missing:** {standards.get('what_was_missing')}")
+            what_was_missing = standards.get("what_was_missing")
+            if what_was_missing:
+                st.error(f"**❌ What Was Missing:** {what_was_missing}")
             
-            if "how_to_improve" in standards and standards.get("how_to_improve"):
-                st.info(f"**✅ How to Improve:** {standards.get('how_to_improve')}")
+            how_to_improve = standards.get("how_to_improve")
+            if how_to_improve:
+                st.info(f"**✅ How to Improve:** {how_to_improve}")
             
-            if "journalistic_standards" in standards and standards.get("journalistic_standards"):
-                st.warning(f"**📰 Journalistic Standards:** {standards.get('journalistic_standards')}")
+            journalistic_standards = standards.get("journalistic_standards")
+            if journalistic_standards:
+                st.warning(f"**📰 Journalistic Standards:** {journalistic_standards}")
             
-            if "citizen_focus" in standards and standards.get("citizen_focus"):
-                st.success(f"**👥 Citizen Focus:** {standards.get('citizen_focus')}")
+            citizen_focus = standards.get("citizen_focus")
+            if citizen_focus:
+                st.success(f"**👥 Citizen Focus:** {citizen_focus}")
     
     # Related Articles Section
     if "related_articles" in result:
-        st.markdown("---")
-        st.markdown("## 🔗 RELATED ARTICLES & THEIR RELEVANCE")
-        st.markdown("### Comparison with Other Articles on Same Website")
+        st.markdown("---\n## 🔗 RELATED ARTICLES & THEIR RELEVANCE\n### Comparison with Other Articles on Same Website")
         
         ra = result["related_articles"]
         if ra.get("related_articles_found"):
@@ -923,135 +1182,83 @@ def display_analysis_result(result):
                         with col1:
                             if comparison.get("common_topics"):
                                 st.markdown("**🔄 Common Topics:**")
-                                st.write(", ".join(comparison['common_topics'][:5]))
+                                st.write(", ".join(islice(comparison['common_topics'], 5)))
                             
                             if comparison.get("topics_in_related_not_in_current"):
                                 st.markdown("**➕ Topics in Related (Missing in Current):**")
-                                st.write(", ".join(comparison['topics_in_related_not_in_current'][:5]))
+                                st.write(", ".join(islice(comparison['topics_in_related_not_in_current'], 5)))
                         
                         with col2:
                             if comparison.get("topics_in_current_not_in_related"):
                                 st.markdown("**➖ Topics in Current (Not in Related):**")
-                                st.write(", ".join(comparison['topics_in_current_not_in_related'][:5]))
+                                st.write(", ".join(islice(comparison['topics_in_current_not_in_related'], 5)))
                         
                         if comparison.get("information_in_related_not_in_current"):
                             st.markdown("**⚠️ Information in Related Article (NOT in Current Article):**")
-                            for info in comparison["information_in_related_not_in_current"]:
-                                st.warning(f"• {info[:200]}...")
+                            st.warning(_bullets(f"{info[:200]}..." for info in comparison["information_in_related_not_in_current"]))
         else:
             st.info(f"ℹ️ {ra.get('message', 'No related articles found on the same website')}")
     
     # Fact Check Notes
-    if "fact_check_notes" in analysis and analysis["fact_check_notes"]:
-        st.markdown("---")
-        st.markdown("### ⚠️ Fact-Check Notes")
-        st.warning(analysis["fact_check_notes"])
+    fact_check_notes = analysis.get("fact_check_notes")
+    if fact_check_notes:
+        st.markdown("---\n### ⚠️ Fact-Check Notes")
+        st.warning(fact_check_notes)
     
     # Beneficiary Analysis Section - MOVED TO LAST
     if "beneficiary_analysis" in analysis:
-        st.markdown("---")
-        st.markdown("## 💰 BENEFICIARY & HIDDEN AGENDA ANALYSIS")
-        st.markdown("### Who Benefits? What's Being Hidden?")
-        
-        ba = analysis["beneficiary_analysis"]
-        
-        # Critical findings first (most important)
-        if "real_news_hidden" in ba and ba.get("real_news_hidden"):
-            st.error(f"**🔍 Real News Being Hidden:** {ba.get('real_news_hidden')}")
-        
-        if "agenda_masking" in ba and ba.get("agenda_masking"):
-            st.warning(f"**🎭 Agenda Masking:** {ba.get('agenda_masking')}")
-        
-        if "distraction_purpose" in ba and ba.get("distraction_purpose"):
-            st.warning(f"**🎪 Distraction Purpose:** {ba.get('distraction_purpose')}")
-        
-        if "timing_analysis" in ba and ba.get("timing_analysis"):
-            st.info(f"**⏰ Timing Analysis:** {ba.get('timing_analysis')}")
-        
-        st.markdown("---")
-        
-        # People and Beneficiaries in organized columns
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if "people_involved" in ba and ba.get("people_involved"):
-                with st.container():
-                    st.markdown("#### 👥 People/Entities Involved")
-                    for person in ba["people_involved"]:
-                        st.markdown(f"• {person}")
-                    st.markdown("")
-            
-            if "direct_beneficiaries" in ba and ba.get("direct_beneficiaries"):
-                with st.container():
-                    st.markdown("#### ✅ Direct Beneficiaries")
-                    for beneficiary in ba["direct_beneficiaries"]:
-                        st.success(f"• {beneficiary}")
-                    st.markdown("")
-            
-            if "indirect_beneficiaries" in ba and ba.get("indirect_beneficiaries"):
-                with st.container():
-                    st.markdown("#### 🔗 Indirect Beneficiaries")
-                    for beneficiary in ba["indirect_beneficiaries"]:
-                        st.warning(f"• {beneficiary}")
-        
-        with col2:
-            if "political_beneficiaries" in ba and ba.get("political_beneficiaries"):
-                with st.container():
-                    st.markdown("#### 🏛️ Political Beneficiaries")
-                    for beneficiary in ba["political_beneficiaries"]:
-                        st.markdown(f"• {beneficiary}")
-                    st.markdown("")
-            
-            if "economic_beneficiaries" in ba and ba.get("economic_beneficiaries"):
-                with st.container():
-                    st.markdown("#### 💵 Economic Beneficiaries")
-                    for beneficiary in ba["economic_beneficiaries"]:
-                        st.markdown(f"• {beneficiary}")
-                    st.markdown("")
-            
-            if "who_loses" in ba and ba.get("who_loses"):
-                with st.container():
-                    st.markdown("#### ❌ Who Stands to Lose")
-                    for entity in ba["who_loses"]:
-                        st.error(f"• {entity}")
-        
-        # Connections section
-        if "connections_and_relationships" in ba:
-            st.markdown("---")
-            st.markdown("#### 🔗 Connections & Relationships")
-            connections = ba["connections_and_relationships"]
-            
-            conn_cols = st.columns(3)
-            with conn_cols[0]:
-                if "media_connections" in connections and connections.get("media_connections"):
-                    st.markdown("**📺 Media Connections:**")
-                    for conn in connections["media_connections"][:5]:
-                        st.caption(f"• {conn}")
-            
-            with conn_cols[1]:
-                if "business_relationships" in connections and connections.get("business_relationships"):
-                    st.markdown("**💼 Business Relationships:**")
-                    for conn in connections["business_relationships"][:5]:
-                        st.caption(f"• {conn}")
-            
-            with conn_cols[2]:
-                if "political_affiliations" in connections and connections.get("political_affiliations"):
-                    st.markdown("**🏛️ Political Affiliations:**")
-                    for conn in connections["political_affiliations"][:5]:
-                        st.caption(f"• {conn}")
-            
-            if "undisclosed_relationships" in connections and connections.get("undisclosed_relationships"):
-                st.markdown("---")
-                st.markdown("**⚠️ Undisclosed Relationships:**")
-                for conn in connections["undisclosed_relationships"]:
-                    st.error(f"• {conn}")
-        
-        # Conflicts of Interest
-        if "conflict_of_interest" in ba and ba.get("conflict_of_interest"):
-            st.markdown("---")
-            st.markdown("#### ⚠️ Conflicts of Interest")
-            for conflict in ba["conflict_of_interest"]:
-                st.error(f"• {conflict}")
+        render_beneficiary_analysis(analysis["beneficiary_analysis"])
+
+def has_min_content(text, min_chars=50):
+    """Check that pasted text is at least min_chars long once trimmed"""
+    # Short input can never pass, so skip the strip (and its copy) for it
+    if not text or len(text) < min_chars:
+        return False
+    return len(text.strip()) >= min_chars
+
+@st.fragment
+def render_error_details(error, key):
+    """Error details panel; the traceback is only formatted when the user asks for it"""
+    with st.expander("🔍 Error Details"):
+        if st.toggle("Show traceback", key=f"traceback_{key}"):
+            st.code("".join(traceback.format_exception(type(error), error, error.__traceback__)))
+
+@st.fragment
+def render_paste_fallback(url_input, key_suffix, content_help):
+    """Manual paste panel shown when fetching fails (typing here reruns only this panel)"""
+    manual_title_fallback = st.text_input(
+        "📰 Article Title (Optional)",
+        key=f"fallback_title{key_suffix}",
+        placeholder="Enter the article title",
+        help="Title of the news article"
+    )
+    manual_content_fallback = st.text_area(
+        "📝 Paste Article Content Here",
+        key=f"fallback_content{key_suffix}",
+        placeholder="Copy and paste the full article text here...",
+        height=300,
+        help=content_help
+    )
+    
+    if st.button("🔍 Analyze Pasted Content", type="primary", key=f"fallback_analyze{key_suffix}"):
+        if has_min_content(manual_content_fallback):
+            with st.spinner("🧠 Analyzing pasted content... This may take 30-60 seconds."):
+                try:
+                    result = run_analysis(
+                        manual_title_fallback or "Manually Entered Article",
+                        manual_content_fallback,
+                        url_input or "manual-input"
+                    )
+                    
+                    st.session_state.last_result = result
+                    st.success("✅ Analysis complete!")
+                    display_analysis_result(result)
+                    
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
+                    render_error_details(e, f"fallback{key_suffix}")
+        else:
+            st.warning("⚠️ Please paste article content (at least 50 characters)")
 
 # Main UI - Modern Header
 col_header1, col_header2, col_header3 = st.columns([1, 2, 1])
@@ -1064,18 +1271,15 @@ with st.sidebar:
     st.header("⚙️ Settings")
     
     # Initialize analyzer
-    if st.session_state.analyzer is None:
-        with st.spinner("Initializing analyzer..."):
-            st.session_state.analyzer = get_analyzer()
-    
-    if st.session_state.analyzer:
+    try:
+        get_analyzer()
         st.success("✅ Analyzer Ready")
-    else:
+    except Exception as e:
+        st.error(f"Error initializing analyzer: {str(e)}")
         st.error("❌ Analyzer not initialized")
         st.stop()
     
-    st.markdown("---")
-    st.markdown("### 📖 About")
+    st.markdown("---\n### 📖 About")
     st.markdown("""
     This tool analyzes news articles to:
     - ✅ Verify factual accuracy
@@ -1085,8 +1289,7 @@ with st.sidebar:
     - 📊 Provide comprehensive scoring
     """)
     
-    st.markdown("---")
-    st.markdown("### 💡 How to Use")
+    st.markdown("---\n### 💡 How to Use")
     st.markdown("""
     1. Enter a news article URL
     2. Click "Analyze News"
@@ -1094,33 +1297,38 @@ with st.sidebar:
     4. Check scores and verdict
     """)
     
-    st.markdown("---")
-    st.markdown("### 📌 Version")
+    st.markdown("---\n### 📌 Version")
     st.caption(f"**v{APP_VERSION}**")
     st.caption(f"Updated: {VERSION_DATE}")
 
 # Main content area
 st.markdown("---")
 
+# Read the query parameters once per run
+query_params = st.query_params
+content_param = query_params.get("content", None)
+url_param = query_params.get("url", None)
+
 # Check for content parameter (from Chrome extension - NEW METHOD)
-content_param = st.query_params.get("content", None)
 if content_param:
     try:
-        import base64
-        import json
-        
-        # Decode base64 content from extension (Unicode-safe)
-        try:
-            # Decode URL encoding first
-            decoded_param = content_param
-            # Decode base64
-            decoded_bytes = base64.b64decode(decoded_param)
-            # Decode UTF-8
-            decoded = decoded_bytes.decode('utf-8')
-            article_data = json.loads(decoded)
-        except Exception as e:
-            st.error(f"❌ Error decoding content: {str(e)}")
-            raise
+        # Every widget interaction reruns the script, so only decode when the parameter changes
+        param_hash = hashlib.blake2b(content_param.encode(), digest_size=8).hexdigest()
+        if st.session_state.get('content_param_hash') == param_hash:
+            article_data = st.session_state.content_article_data
+        else:
+            # Decode base64 content from extension (Unicode-safe)
+            try:
+                # Decode base64 (query_params is already URL-decoded; the URL-safe
+                # decoder also accepts the standard alphabet the extension sends)
+                decoded_bytes = base64.urlsafe_b64decode(content_param)
+                # Parse the UTF-8 JSON bytes directly
+                article_data = json_loads(decoded_bytes)
+            except Exception as e:
+                st.error(f"❌ Error decoding content: {str(e)}")
+                raise
+            st.session_state.content_param_hash = param_hash
+            st.session_state.content_article_data = article_data
         
         st.info(f"📰 Article content received from extension: {article_data.get('title', 'Untitled')[:60]}...")
         
@@ -1129,83 +1337,33 @@ if content_param:
             st.session_state.auto_analyzed = True
             with st.spinner("🧠 Analyzing article content... This may take 30-60 seconds."):
                 try:
-                    # Use the content directly - no fetching needed!
-                    article_data_structured = {
-                        "success": True,
-                        "title": article_data.get('title', 'No title found'),
-                        "content": article_data.get('content', ''),
-                        "url": article_data.get('url', 'extension-input')
-                    }
-                    
-                    # Load rules and create prompt
-                    rules = st.session_state.analyzer.load_rules()
-                    prompt = st.session_state.analyzer.create_analysis_prompt(article_data_structured, rules)
-                    
-                    # Call OpenAI API
-                    response = st.session_state.analyzer.client.chat.completions.create(
-                        model=st.session_state.analyzer.model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is to QUESTION EVERYTHING, identify what's MISSING, challenge claims, and demand answers that Indian citizens deserve. Don't accept reports at face value - be skeptical, ask hard questions, and judge based on what answers the report provides."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=0.5,
-                        max_tokens=6000
+                    result = run_analysis(
+                        article_data.get('title', 'No title found'),
+                        article_data.get('content', ''),
+                        article_data.get('url', 'extension-input')
                     )
                     
-                    analysis_text = response.choices[0].message.content
-                    
-                    # Parse JSON
-                    try:
-                        if "```json" in analysis_text:
-                            json_start = analysis_text.find("```json") + 7
-                            json_end = analysis_text.find("```", json_start)
-                            analysis_text = analysis_text[json_start:json_end].strip()
-                        elif "```" in analysis_text:
-                            json_start = analysis_text.find("```") + 3
-                            json_end = analysis_text.find("```", json_start)
-                            analysis_text = analysis_text[json_start:json_end].strip()
-                        
-                        analysis_json = json.loads(analysis_text)
-                        analysis_json = st.session_state.analyzer.refine_category_based_on_scores(analysis_json, article_data_structured)
-                    except json.JSONDecodeError:
-                        analysis_json = {"raw_response": analysis_text}
-                    
-                    result = {
-                        "success": True,
-                        "url": article_data.get('url', 'extension-input'),
-                        "article": article_data_structured,
-                        "analysis": analysis_json
-                    }
-                    
                     st.session_state.last_result = result
                     st.success("✅ Analysis complete! (Content extracted directly from page - no fetching needed)")
                     display_analysis_result(result)
                     
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
-                    import traceback
-                    with st.expander("🔍 Error Details"):
-                        st.code(traceback.format_exc())
+                    render_error_details(e, "content")
     except Exception as e:
         st.warning(f"⚠️ Could not decode content parameter: {e}. Falling back to URL method...")
         content_param = None
 
 # Check for URL parameter (from Chrome extension or direct link - FALLBACK METHOD)
-url_param = st.query_params.get("url", None)
 if url_param and not content_param:
     st.info(f"📰 Article URL received: {url_param[:80]}...")
-    # Auto-analyze if URL parameter is present
+    # Auto-analyze once per session - the flag is shared with the content branch,
+    # so an article that arrived as content is never re-analyzed through its URL
     if 'auto_analyzed' not in st.session_state:
         st.session_state.auto_analyzed = True
         with st.spinner("🔍 Fetching and analyzing article... This may take 30-60 seconds."):
             try:
-                result = st.session_state.analyzer.analyze_news(url_param)
+                result = analyze_url(url_param)
                 st.session_state.last_result = result
                 
                 if result.get("success"):
@@ -1220,9 +1378,7 @@ if url_param and not content_param:
                         st.info(f"💡 {result.get('suggestion')}")
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
-                import traceback
-                with st.expander("🔍 Error Details"):
-                    st.code(traceback.format_exc())
+                render_error_details(e, "url_param")
 
 # Input method selection
 input_method = st.radio(
@@ -1277,7 +1433,7 @@ if analyze_button:
         else:
             with st.spinner("🔍 Fetching and analyzing article... This may take 30-60 seconds."):
                 try:
-                    result = st.session_state.analyzer.analyze_news(url_input)
+                    result = analyze_url(url_input)
                     st.session_state.last_result = result
                     
                     if result.get("success"):
@@ -1311,88 +1467,9 @@ if analyze_button:
                             """)
                             
                             # Show the manual paste section prominently
-                            st.markdown("---")
-                            st.markdown("### 📝 Quick Fix: Paste Article Content Below")
-                            
-                            manual_title_fallback = st.text_input(
-                                "📰 Article Title (Optional)",
-                                key="fallback_title",
-                                placeholder="Enter the article title",
-                                help="Title of the news article"
-                            )
-                            manual_content_fallback = st.text_area(
-                                "📝 Paste Article Content Here",
-                                key="fallback_content",
-                                placeholder="Copy and paste the full article text here...",
-                                height=300,
-                                help="This works when URL fetching fails"
-                            )
+                            st.markdown("---\n### 📝 Quick Fix: Paste Article Content Below")
                             
-                            if st.button("🔍 Analyze Pasted Content", type="primary", key="fallback_analyze"):
-                                if manual_content_fallback and len(manual_content_fallback.strip()) >= 50:
-                                    with st.spinner("🧠 Analyzing pasted content... This may take 30-60 seconds."):
-                                        try:
-                                            article_data = {
-                                                "success": True,
-                                                "title": manual_title_fallback or "Manually Entered Article",
-                                                "content": manual_content_fallback,
-                                                "url": url_input or "manual-input"
-                                            }
-                                            
-                                            rules = st.session_state.analyzer.load_rules()
-                                            prompt = st.session_state.analyzer.create_analysis_prompt(article_data, rules)
-                                            
-                                            response = st.session_state.analyzer.client.chat.completions.create(
-                                                model=st.session_state.analyzer.model,
-                                                messages=[
-                                                    {
-                                                        "role": "system",
-                                                        "content": "You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is to QUESTION EVERYTHING, identify what's MISSING, challenge claims, and demand answers that Indian citizens deserve. Don't accept reports at face value - be skeptical, ask hard questions, and judge based on what answers the report provides."
-                                                    },
-                                                    {
-                                                        "role": "user",
-                                                        "content": prompt
-                                                    }
-                                                ],
-                                                temperature=0.4,
-                                                max_tokens=4000
-                                            )
-                                            
-                                            analysis_text = response.choices[0].message.content
-                                            
-                                            try:
-                                                if "```json" in analysis_text:
-                                                    json_start = analysis_text.find("```json") + 7
-                                                    json_end = analysis_text.find("```", json_start)
-                                                    analysis_text = analysis_text[json_start:json_end].strip()
-                                                elif "```" in analysis_text:
-                                                    json_start = analysis_text.find("```") + 3
-                                                    json_end = analysis_text.find("```", json_start)
-                                                    analysis_text = analysis_text[json_start:json_end].strip()
-                                                
-                                                analysis_json = json.loads(analysis_text)
-                                                analysis_json = st.session_state.analyzer.refine_category_based_on_scores(analysis_json, article_data)
-                                            except json.JSONDecodeError:
-                                                analysis_json = {"raw_response": analysis_text}
-                                            
-                                            result = {
-                                                "success": True,
-                                                "url": url_input or "manual-input",
-                                                "article": article_data,
-                                                "analysis": analysis_json
-                                            }
-                                            
-                                            st.session_state.last_result = result
-                                            st.success("✅ Analysis complete!")
-                                            display_analysis_result(result)
-                                            
-                                        except Exception as e:
-                                            st.error(f"❌ Error: {str(e)}")
-                                            import traceback
-                                            with st.expander("🔍 Error Details"):
-                                                st.code(traceback.format_exc())
-                                else:
-                                    st.warning("⚠️ Please paste article content (at least 50 characters)")
+                            render_paste_fallback(url_input, "", "This works when URL fetching fails")
                         else:
                             # Check if it's a 403/401 error - show prominent manual paste
                             if "403" in error_msg or "401" in error_msg or "Forbidden" in error_msg or "block" in error_msg.lower():
@@ -1411,88 +1488,9 @@ if analyze_button:
                                 This method works 100% of the time and is often faster than automated fetching!
                                 """)
                                 
-                                st.markdown("---")
-                                st.markdown("### 📝 Quick Fix: Paste Article Content Below")
-                                
-                                manual_title_fallback = st.text_input(
-                                    "📰 Article Title (Optional)",
-                                    key="fallback_title_403",
-                                    placeholder="Enter the article title",
-                                    help="Title of the news article"
-                                )
-                                manual_content_fallback = st.text_area(
-                                    "📝 Paste Article Content Here",
-                                    key="fallback_content_403",
-                                    placeholder="Copy and paste the full article text here...",
-                                    height=300,
-                                    help="This works when websites block automated access"
-                                )
+                                st.markdown("---\n### 📝 Quick Fix: Paste Article Content Below")
                                 
-                                if st.button("🔍 Analyze Pasted Content", type="primary", key="fallback_analyze_403"):
-                                    if manual_content_fallback and len(manual_content_fallback.strip()) >= 50:
-                                        with st.spinner("🧠 Analyzing pasted content... This may take 30-60 seconds."):
-                                            try:
-                                                article_data = {
-                                                    "success": True,
-                                                    "title": manual_title_fallback or "Manually Entered Article",
-                                                    "content": manual_content_fallback,
-                                                    "url": url_input or "manual-input"
-                                                }
-                                                
-                                                rules = st.session_state.analyzer.load_rules()
-                                                prompt = st.session_state.analyzer.create_analysis_prompt(article_data, rules)
-                                                
-                                                response = st.session_state.analyzer.client.chat.completions.create(
-                                                    model=st.session_state.analyzer.model,
-                                                    messages=[
-                                                        {
-                                                            "role": "system",
-                                                            "content": "You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is to QUESTION EVERYTHING, identify what's MISSING, challenge claims, and demand answers that Indian citizens deserve. Don't accept reports at face value - be skeptical, ask hard questions, and judge based on what answers the report provides."
-                                                        },
-                                                        {
-                                                            "role": "user",
-                                                            "content": prompt
-                                                        }
-                                                    ],
-                                                    temperature=0.4,
-                                                    max_tokens=4000
-                                                )
-                                                
-                                                analysis_text = response.choices[0].message.content
-                                                
-                                                try:
-                                                    if "```json" in analysis_text:
-                                                        json_start = analysis_text.find("```json") + 7
-                                                        json_end = analysis_text.find("```", json_start)
-                                                        analysis_text = analysis_text[json_start:json_end].strip()
-                                                    elif "```" in analysis_text:
-                                                        json_start = analysis_text.find("```") + 3
-                                                        json_end = analysis_text.find("```", json_start)
-                                                        analysis_text = analysis_text[json_start:json_end].strip()
-                                                    
-                                                    analysis_json = json.loads(analysis_text)
-                                                    analysis_json = st.session_state.analyzer.refine_category_based_on_scores(analysis_json, article_data)
-                                                except json.JSONDecodeError:
-                                                    analysis_json = {"raw_response": analysis_text}
-                                                
-                                                result = {
-                                                    "success": True,
-                                                    "url": url_input or "manual-input",
-                                                    "article": article_data,
-                                                    "analysis": analysis_json
-                                                }
-                                                
-                                                st.session_state.last_result = result
-                                                st.success("✅ Analysis complete!")
-                                                display_analysis_result(result)
-                                                
-                                            except Exception as e:
-                                                st.error(f"❌ Error: {str(e)}")
-                                                import traceback
-                                                with st.expander("🔍 Error Details"):
-                                                    st.code(traceback.format_exc())
-                                    else:
-                                        st.warning("⚠️ Please paste article content (at least 50 characters)")
+                                render_paste_fallback(url_input, "_403", "This works when websites block automated access")
                             else:
                                 # Other types of errors
                                 st.error(f"❌ Analysis failed: {error_msg}")
@@ -1532,78 +1530,27 @@ if analyze_button:
             
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
-                    import traceback
-                    with st.expander("🔍 Error Details"):
-                        st.code(traceback.format_exc())
+                    render_error_details(e, "url_input")
     
     else:  # Manual content input
-        if not manual_content or len(manual_content.strip()) < 50:
+        if not has_min_content(manual_content):
             st.warning("⚠️ Please paste article content (at least 50 characters)")
         else:
             with st.spinner("🧠 Analyzing article content... This may take 30-60 seconds."):
                 try:
-                    # Create article data structure
-                    article_data = {
-                        "success": True,
-                        "title": manual_title or "Manually Entered Article",
-                        "content": manual_content,
-                        "url": "manual-input"
-                    }
-                    
-                    # Load rules and create prompt
-                    rules = st.session_state.analyzer.load_rules()
-                    prompt = st.session_state.analyzer.create_analysis_prompt(article_data, rules)
-                    
-                    # Call OpenAI API
-                    response = st.session_state.analyzer.client.chat.completions.create(
-                        model=st.session_state.analyzer.model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is to QUESTION EVERYTHING, identify what's MISSING, challenge claims, and demand answers that Indian citizens deserve. Don't accept reports at face value - be skeptical, ask hard questions, and judge based on what answers the report provides."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=0.5,
-                        max_tokens=6000
+                    result = run_analysis(
+                        manual_title or "Manually Entered Article",
+                        manual_content,
+                        "manual-input"
                     )
                     
-                    analysis_text = response.choices[0].message.content
-                    
-                    # Parse JSON
-                    try:
-                        if "```json" in analysis_text:
-                            json_start = analysis_text.find("```json") + 7
-                            json_end = analysis_text.find("```", json_start)
-                            analysis_text = analysis_text[json_start:json_end].strip()
-                        elif "```" in analysis_text:
-                            json_start = analysis_text.find("```") + 3
-                            json_end = analysis_text.find("```", json_start)
-                            analysis_text = analysis_text[json_start:json_end].strip()
-                        
-                        analysis_json = json.loads(analysis_text)
-                    except json.JSONDecodeError:
-                        analysis_json = {"raw_response": analysis_text}
-                    
-                    result = {
-                        "success": True,
-                        "url": "manual-input",
-                        "article": article_data,
-                        "analysis": analysis_json
-                    }
-                    
                     st.session_state.last_result = result
                     st.success("✅ Analysis complete!")
                     display_analysis_result(result)
                     
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
-                    import traceback
-                    with st.expander("🔍 Error Details"):
-                        st.code(traceback.format_exc())
+                    render_error_details(e, "manual")
 
 # Show last result if requested
 if st.session_state.get('show_last', False) and st.session_state.last_result:
@@ -2,7 +2,7 @@
 Demo test with a sample article to show full analysis capabilities
 """
 
-from news_analyzer import NewsAnalyzer
+from news_analyzer import NewsAnalyzer, ResponseCache
 import json
 
 def demo_test():
@@ -80,9 +80,9 @@ def demo_test():
         
         # For demo, we'll manually call the API with our sample article
         try:
-            response = analyzer.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
+            request = {
+                "model": "gpt-4o",
+                "messages": [
                     {
                         "role": "system",
                         "content": "You are an expert news analyst and fact-checker specializing in Indian news. You provide detailed, objective analysis based on comprehensive rules and guidelines."
@@ -92,12 +92,21 @@ def demo_test():
                         "content": prompt
                     }
                 ],
-                temperature=0.3,
-                max_tokens=3000
-            )
+                "temperature": 0.3,
+                "max_tokens": 3000
+            }
             
-            analysis_text = response.choices[0].message.content
-            print("   ✅ Analysis received from OpenAI")
+            # Reuse the response from an earlier identical run if there is one
+            cache = ResponseCache()
+            cache_key = ResponseCache.make_key(**request)
+            analysis_text = cache.get(cache_key)
+            if analysis_text is not None:
+                print("   ✅ Analysis loaded from response cache")
+            else:
+                response = analyzer.client.chat.completions.create(**request)
+                analysis_text = response.choices[0].message.content
+                cache.set(cache_key, analysis_text)
+                print("   ✅ Analysis received from OpenAI")
             
             # Try to parse JSON
             try:
@@ -6,13 +6,23 @@ Uses OpenAI API to analyze news articles based on comprehensive rules
 import os
 import json
 import re
-from typing import Dict, Any, Optional, List
+import hashlib
+import sqlite3
+import threading
+import importlib.util
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dotenv import load_dotenv
 from openai import OpenAI
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from bs4 import BeautifulSoup
-import feedparser
+import soupsieve as sv
+from lxml import etree
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from urllib.parse import urlparse, urljoin
 
 # Optional imports for advanced scraping
@@ -33,966 +43,152 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# newspaper3k and trafilatura are slow to import (NLTK, justext, ...), so they are only
+# looked up here and imported the first time an extraction actually needs them (a
+# failed import then clears the flag)
+NEWSPAPER_AVAILABLE = importlib.util.find_spec("newspaper") is not None
+TRAFILATURA_AVAILABLE = importlib.util.find_spec("trafilatura") is not None
+
+# Optional faster JSON parser (raises a subclass of json.JSONDecodeError)
 try:
-    from newspaper import Article
-    NEWSPAPER_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
 except ImportError:
-    NEWSPAPER_AVAILABLE = False
+    json_loads = json.loads
 
 # Load environment variables
 load_dotenv()
 
-class NewsAnalyzer:
-    """Main class for analyzing news articles"""
-    
-    def __init__(self):
-        """Initialize the analyzer with OpenAI client"""
-        # Try to get API key from Streamlit secrets first (for Streamlit Cloud)
-        # Then fall back to environment variable (for local development)
-        try:
-            import streamlit as st
-            api_key = st.secrets.get("OPEN_AI_API", "")
-        except:
-            api_key = os.getenv("OPEN_AI_API", "").strip('"')
-        
-        if not api_key:
-            raise ValueError("OPENAI_API key not found. Please set OPEN_AI_API in Streamlit secrets or .env file")
-        
-        self.client = OpenAI(api_key=api_key)
-        self.rules_path = "NEWS_ANALYSIS_RULES.md"
-        self.model = "gpt-4o"  # Default model, will be updated by test_api_key
-        
-    def test_api_key(self) -> bool:
-        """Test if the OpenAI API key is working"""
-        # Try different models in order of preference
-        models_to_try = ["gpt-4o", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"]
-        
-        for model in models_to_try:
-            try:
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "user", "content": "Say OK"}
-                    ],
-                    max_tokens=5
-                )
-                self.model = model  # Store working model
-                return True  # If we got a response, API key works
-            except Exception as e:
-                if model == models_to_try[-1]:  # Last model
-                    print(f"API Key Test Failed with all models. Last error: {str(e)}")
-                continue
-        return False
-    
-    def _filter_news_content(self, text: str) -> str:
-        """Filter out non-news content from extracted text"""
-        if not text:
-            return ""
-        
-        lines = text.split('\n')
-        filtered_lines = []
-        
-        # Common non-news patterns to filter
-        skip_patterns = [
-            'cookie', 'privacy policy', 'terms of service', 'subscribe',
-            'newsletter', 'follow us', 'share on', 'like us', 'follow @',
-            'advertisement', 'sponsored', 'promoted', 'trending now',
-            'you may also like', 'related articles', 'recommended for you',
-            'sign up', 'log in', 'register', 'create account',
-            '©', 'copyright', 'all rights reserved', 'terms & conditions',
-            'menu', 'navigation', 'home', 'about', 'contact',
-            'skip to', 'jump to', 'back to top', 'scroll to top'
-        ]
-        
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 10:
-                continue
-            
-            # Skip very short lines (likely navigation)
-            if len(line) < 15 and line.isupper():
-                continue
-            
-            # Skip lines matching skip patterns
-            line_lower = line.lower()
-            should_skip = False
-            for pattern in skip_patterns:
-                if pattern in line_lower:
-                    should_skip = True
-                    break
-            
-            if should_skip:
-                continue
-            
-            # Skip lines that are mostly punctuation or numbers
-            if len([c for c in line if c.isalnum()]) < len(line) * 0.3:
-                continue
-            
-            filtered_lines.append(line)
-        
-        return '\n'.join(filtered_lines)
-    
-    def fetch_with_newspaper3k(self, url: str) -> Dict[str, Any]:
-        """Try fetching using newspaper3k library (handles many news sites)"""
-        if not NEWSPAPER_AVAILABLE:
-            return {"success": False, "error": "newspaper3k not installed"}
-        
-        try:
-            article = Article(url, language='en')
-            # Set longer timeout for Streamlit Cloud
-            article.config.request_timeout = 20
-            article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            
-            article.download()
-            article.parse()
-            
-            # Lower threshold - accept if we have any reasonable content
-            if article.text and len(article.text.strip()) > 50:
-                return {
-                    "success": True,
-                    "title": article.title or "No title found",
-                    "content": article.text.strip(),
-                    "url": url,
-                    "method": "newspaper3k"
-                }
-        except Exception as e:
-            # Don't return error immediately - might still work with other methods
-            pass
-        return {"success": False, "error": "newspaper3k failed to extract content"}
-    
-    def fetch_with_selenium(self, url: str) -> Dict[str, Any]:
-        """Try fetching using Selenium (handles JavaScript-heavy sites)"""
-        if not SELENIUM_AVAILABLE:
-            return {"success": False, "error": "selenium not installed"}
-        
-        driver = None
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(url)
-            
-            # Wait for content to load
-            time.sleep(3)
-            
-            # Try to find and close cookie/consent banners
-            try:
-                close_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Close') or contains(text(), '×')]")
-                for btn in close_buttons[:3]:  # Try first 3
-                    try:
-                        btn.click()
-                        time.sleep(1)
-                    except:
-                        pass
-            except:
-                pass
-            
-            # Get page source
-            page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Extract title
-            title = driver.title or soup.find('title')
-            title_text = title if isinstance(title, str) else (title.get_text().strip() if title else "No title found")
-            
-            # Extract content
-            for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                script.decompose()
-            
-            article_content = None
-            content_selectors = ['article', '[role="article"]', '.article-content', '.article-body', 'main']
-            for selector in content_selectors:
-                article = soup.select_one(selector)
-                if article:
-                    article_content = article.get_text(separator='\n', strip=True)
-                    if len(article_content) > 200:
-                        break
-            
-            if not article_content:
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    article_content = '\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-            
-            if article_content and len(article_content) > 100:
-                return {
-                    "success": True,
-                    "title": title_text,
-                    "content": article_content[:5000],  # Limit content
-                    "url": url,
-                    "method": "selenium"
-                }
-        except Exception as e:
-            return {"success": False, "error": f"selenium error: {str(e)}"}
-        finally:
-            if driver:
-                driver.quit()
-        return {"success": False, "error": "selenium failed to extract content"}
-    
-    def fetch_with_playwright(self, url: str) -> Dict[str, Any]:
-        """Try fetching using Playwright (modern headless browser)"""
-        if not PLAYWRIGHT_AVAILABLE:
-            return {"success": False, "error": "playwright not installed"}
-        
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                page = context.new_page()
-                page.goto(url, wait_until='networkidle', timeout=30000)
-                
-                # Wait a bit for dynamic content
-                page.wait_for_timeout(2000)
-                
-                # Get content
-                title = page.title()
-                content = page.content()
-                
-                browser.close()
-                
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(content, 'html.parser')
-                for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                    script.decompose()
-                
-                article_content = None
-                content_selectors = ['article', '[role="article"]', '.article-content', '.article-body', 'main']
-                for selector in content_selectors:
-                    article = soup.select_one(selector)
-                    if article:
-                        article_content = article.get_text(separator='\n', strip=True)
-                        if len(article_content) > 200:
-                            break
-                
-                if not article_content:
-                    paragraphs = soup.find_all('p')
-                    if paragraphs:
-                        article_content = '\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-                
-                if article_content and len(article_content) > 100:
-                    return {
-                        "success": True,
-                        "title": title or "No title found",
-                        "content": article_content[:5000],
-                        "url": url,
-                        "method": "playwright"
-                    }
-        except Exception as e:
-            return {"success": False, "error": f"playwright error: {str(e)}"}
-        return {"success": False, "error": "playwright failed to extract content"}
-    
-    def try_rss_feed(self, url: str) -> Dict[str, Any]:
-        """Try to find and parse RSS feed for the article"""
-        # Extract base domain
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            
-            # Common RSS feed paths
-            rss_paths = ['/feed', '/rss', '/feeds/all.rss', '/rss.xml', '/feed.xml']
-            
-            for path in rss_paths:
-                try:
-                    feed_url = base_url + path
-                    feed = feedparser.parse(feed_url)
-                    
-                    if feed.entries:
-                        # Try to find matching article
-                        for entry in feed.entries[:10]:  # Check first 10 entries
-                            if url in entry.get('link', '') or entry.get('link', '') in url:
-                                return {
-                                    "success": True,
-                                    "title": entry.get('title', 'No title'),
-                                    "content": entry.get('summary', '') or entry.get('description', ''),
-                                    "url": url,
-                                    "method": "rss_feed"
-                                }
-                except:
-                    continue
-        except Exception as e:
-            pass
-        return {"success": False, "error": "RSS feed not found or doesn't contain article"}
-    
-    def find_related_articles(self, url: str, current_title: str, current_content: str, max_articles: int = 5) -> List[Dict[str, Any]]:
-        """Find related articles from the same website"""
-        try:
-            
-            parsed = urlparse(url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            related_articles = []
-            
-            # Extract keywords from title and content
-            title_words = set(re.findall(r'\b\w{4,}\b', current_title.lower()))
-            content_words = set(re.findall(r'\b\w{5,}\b', current_content.lower()[:500]))
-            keywords = list(title_words.union(content_words))[:10]  # Top 10 keywords
-            
-            # Try to find related articles via RSS feed
-            try:
-                rss_paths = ['/feed', '/rss', '/feeds/all.rss', '/rss.xml', '/feed.xml']
-                for path in rss_paths:
-                    try:
-                        feed_url = base_url + path
-                        feed = feedparser.parse(feed_url)
-                        
-                        if feed.entries:
-                            for entry in feed.entries[:20]:  # Check more entries
-                                entry_url = entry.get('link', '')
-                                entry_title = entry.get('title', '').lower()
-                                entry_summary = (entry.get('summary', '') or entry.get('description', '')).lower()
-                                
-                                # Skip if it's the same article
-                                if entry_url == url or url in entry_url:
-                                    continue
-                                
-                                # Check relevance by keyword matching
-                                relevance_score = 0
-                                entry_text = entry_title + " " + entry_summary
-                                
-                                for keyword in keywords:
-                                    if keyword in entry_text:
-                                        relevance_score += 1
-                                
-                                # Also check for common topics (India, Modi, Putin, etc.)
-                                common_topics = ['india', 'modi', 'putin', 'russia', 'diplomatic', 'visit', 'policy']
-                                for topic in common_topics:
-                                    if topic in entry_text and topic in current_content.lower():
-                                        relevance_score += 2
-                                
-                                if relevance_score >= 2:  # Minimum relevance threshold
-                                    related_articles.append({
-                                        "url": entry_url,
-                                        "title": entry.get('title', 'No title'),
-                                        "summary": entry.get('summary', '') or entry.get('description', ''),
-                                        "relevance_score": relevance_score,
-                                        "published": entry.get('published', ''),
-                                        "source": "rss_feed"
-                                    })
-                                    
-                                    if len(related_articles) >= max_articles:
-                                        break
-                        
-                        if len(related_articles) >= max_articles:
-                            break
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Try to fetch related articles from the same page (if article page has "related articles" section)
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                }
-                response = requests.get(url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Look for related articles links
-                    related_selectors = [
-                        'a[href*="related"]',
-                        '.related-articles a',
-                        '.more-articles a',
-                        '.similar-articles a',
-                        '[class*="related"] a',
-                        '[class*="similar"] a'
-                    ]
-                    
-                    for selector in related_selectors:
-                        links = soup.select(selector)
-                        for link in links[:10]:
-                            href = link.get('href', '')
-                            if href:
-                                if not href.startswith('http'):
-                                    href = urljoin(base_url, href)
-                                
-                                if href != url and base_url in href:
-                                    title = link.get_text(strip=True)
-                                    if title and len(title) > 10:
-                                        # Check relevance
-                                        title_lower = title.lower()
-                                        relevance = sum(1 for kw in keywords if kw in title_lower)
-                                        
-                                        if relevance >= 1:
-                                            related_articles.append({
-                                                "url": href,
-                                                "title": title,
-                                                "summary": "",
-                                                "relevance_score": relevance,
-                                                "source": "page_links"
-                                            })
-                                            
-                                            if len(related_articles) >= max_articles:
-                                                break
-                        
-                        if len(related_articles) >= max_articles:
-                            break
-            except:
-                pass
-            
-            # Sort by relevance score and return top articles
-            related_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-            return related_articles[:max_articles]
-            
-        except Exception as e:
-            return []
-    
-    def analyze_related_articles(self, current_article: Dict[str, Any], related_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze related articles and compare with current article"""
-        if not related_articles:
-            return {
-                "related_articles_found": False,
-                "message": "No related articles found on the same website"
-            }
-        
-        analysis = {
-            "related_articles_found": True,
-            "total_found": len(related_articles),
-            "articles": []
-        }
-        
-        current_title = current_article.get('title', '').lower()
-        current_content = current_article.get('content', '').lower()
-        
-        for article in related_articles:
-            article_analysis = {
-                "url": article.get('url', ''),
-                "title": article.get('title', ''),
-                "relevance_score": article.get('relevance_score', 0),
-                "summary": article.get('summary', '')[:200] if article.get('summary') else "",
-                "comparison": {}
-            }
-            
-            article_title = article.get('title', '').lower()
-            article_summary = (article.get('summary', '') or '').lower()
-            
-            # Compare topics
-            current_topics = set(re.findall(r'\b\w{5,}\b', current_content[:1000]))
-            article_topics = set(re.findall(r'\b\w{5,}\b', article_summary[:1000]))
-            
-            common_topics = current_topics.intersection(article_topics)
-            unique_to_current = current_topics - article_topics
-            unique_to_related = article_topics - current_topics
-            
-            article_analysis["comparison"] = {
-                "common_topics": list(common_topics)[:5],
-                "topics_in_related_not_in_current": list(unique_to_related)[:5],
-                "topics_in_current_not_in_related": list(unique_to_current)[:5]
-            }
-            
-            # Try to fetch full content for deeper analysis
-            try:
-                fetched = self.fetch_article_content(article.get('url', ''), use_fallbacks=False)
-                if fetched.get('success'):
-                    article_analysis["full_content_available"] = True
-                    article_analysis["content_length"] = len(fetched.get('content', ''))
-                    
-                    # More detailed comparison
-                    related_content = fetched.get('content', '').lower()
-                    
-                    # Find what's in related article but missing in current
-                    related_sentences = [s.strip() for s in related_content.split('.') if len(s.strip()) > 50]
-                    current_sentences = [s.strip() for s in current_content.split('.') if len(s.strip()) > 50]
-                    
-                    # Find unique information in related article
-                    unique_info = []
-                    for rel_sent in related_sentences[:20]:
-                        if not any(rel_sent[:50] in curr_sent for curr_sent in current_sentences):
-                            # Check if it contains important keywords
-                            if any(kw in rel_sent for kw in ['policy', 'security', 'impact', 'citizen', 'government', 'cost', 'benefit']):
-                                unique_info.append(rel_sent[:150])
-                                if len(unique_info) >= 3:
-                                    break
-                    
-                    article_analysis["comparison"]["information_in_related_not_in_current"] = unique_info
-                else:
-                    article_analysis["full_content_available"] = False
-            except:
-                article_analysis["full_content_available"] = False
-            
-            analysis["articles"].append(article_analysis)
-        
-        return analysis
-    
-    def fetch_article_content(self, url: str, use_fallbacks: bool = True) -> Dict[str, Any]:
-        """
-        Fetch article content with multiple fallback strategies.
-        Tries newspaper3k first (works better on Streamlit Cloud), then requests, then other methods.
-        """
-        """Fetch and extract content from a news URL with multiple fallback methods"""
-        
-        # Try newspaper3k FIRST (works better on Streamlit Cloud for many sites)
-        if use_fallbacks:
-            print("   Trying newspaper3k first (best for Streamlit Cloud)...")
-            newspaper_result = self.fetch_with_newspaper3k(url)
-            if newspaper_result.get("success") and len(newspaper_result.get("content", "")) > 100:
-                return newspaper_result
-        
-        # Comprehensive headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'DNT': '1',
-        }
-        
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        try:
-            # Try with session first
-            response = session.get(url, timeout=20, allow_redirects=True)
-            
-            # Handle common error codes
-            if response.status_code == 401:
-                # Try fallback methods for 401 errors
-                if use_fallbacks:
-                    print(f"   401 Forbidden - trying fallback methods...")
-                    fallback_methods = [
-                        ("newspaper3k", self.fetch_with_newspaper3k),
-                        ("RSS feed", self.try_rss_feed),
-                    ]
-                    
-                    for method_name, method_func in fallback_methods:
-                        print(f"   Trying: {method_name}...")
-                        result = method_func(url)
-                        if result.get("success"):
-                            return result
-                
-                return {
-                    "success": False,
-                    "error": f"401 Forbidden: This website requires authentication or blocks automated access.",
-                    "url": url,
-                    "suggestion": "Options: 1) Use browser automation (Selenium/Playwright), 2) Try newspaper3k library, 3) Check RSS feed, 4) Copy article content manually."
-                }
-            elif response.status_code == 403:
-                # Try fallback methods for 403 errors
-                if use_fallbacks:
-                    print(f"   403 Forbidden - trying fallback methods...")
-                    fallback_methods = [
-                        ("newspaper3k", self.fetch_with_newspaper3k),
-                        ("RSS feed", self.try_rss_feed),
-                    ]
-                    
-                    # Only try browser automation if other methods fail (slower)
-                    for method_name, method_func in fallback_methods:
-                        print(f"   Trying: {method_name}...")
-                        result = method_func(url)
-                        if result.get("success"):
-                            return result
-                
-                return {
-                    "success": False,
-                    "error": f"403 Forbidden: Access denied. This website may block automated requests.",
-                    "url": url,
-                    "suggestion": "This site blocks automated access. Options: 1) Use browser automation (Selenium/Playwright), 2) Try newspaper3k library, 3) Check for RSS feed, 4) Copy article content manually."
-                }
-            elif response.status_code == 404:
-                return {
-                    "success": False,
-                    "error": f"404 Not Found: The article URL doesn't exist or has been removed.",
-                    "url": url
-                }
-            
-            response.raise_for_status()
-            
-            # Try to detect encoding
-            if response.encoding is None or response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding or 'utf-8'
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove non-content elements more aggressively
-            for element in soup(["script", "style", "nav", "header", "footer", "aside", 
-                               "iframe", "embed", "object", "form", "button", "input",
-                               "select", "textarea", "noscript", "svg", "canvas"]):
-                element.decompose()
-            
-            # Remove common non-content classes/IDs
-            unwanted_selectors = [
-                '[class*="nav"]', '[class*="menu"]', '[class*="sidebar"]',
-                '[class*="ad"]', '[class*="advertisement"]', '[class*="promo"]',
-                '[class*="social"]', '[class*="share"]', '[class*="comment"]',
-                '[class*="related"]', '[class*="recommended"]', '[class*="trending"]',
-                '[id*="nav"]', '[id*="menu"]', '[id*="sidebar"]',
-                '[id*="ad"]', '[id*="advertisement"]', '[id*="promo"]',
-                '[id*="social"]', '[id*="share"]', '[id*="comment"]',
-                '[role="navigation"]', '[role="banner"]', '[role="complementary"]',
-                '[role="contentinfo"]', '[role="search"]'
-            ]
-            
-            for selector in unwanted_selectors:
-                try:
-                    for elem in soup.select(selector):
-                        elem.decompose()
-                except:
-                    pass
-            
-            # Extract title (try multiple methods)
-            title_text = "No title found"
-            title_selectors = [
-                ('meta', {'property': 'og:title'}),
-                ('meta', {'name': 'twitter:title'}),
-                ('h1', {}),
-                ('title', {})
-            ]
-            
-            for tag, attrs in title_selectors:
-                element = soup.find(tag, attrs) if attrs else soup.find(tag)
-                if element:
-                    title_text = element.get('content') or element.get_text()
-                    if title_text and title_text.strip():
-                        title_text = title_text.strip()
-                        break
-            
-            # Extract main content (try common article selectors - EXPANDED LIST)
-            article_content = None
-            content_selectors = [
-                'article',
-                '[role="article"]',
-                '.article-content',
-                '.article-body',
-                '.post-content',
-                '.story-body',
-                '.content-body',
-                '.entry-content',
-                '.post-body',
-                '.article-text',
-                '.article-main',
-                '.story-content',
-                '.article-wrapper',
-                '.content-wrapper',
-                '.article-detail',
-                '.article-full',
-                '.article-main-content',
-                '.story-detail',
-                '.news-content',
-                '.news-body',
-                '[class*="article"]',
-                '[class*="story"]',
-                '[class*="content"]',
-                '[class*="post"]',
-                '[class*="entry"]',
-                '[class*="news"]',
-                'main',
-                '.main-content',
-                '#main-content',
-                '#article-content',
-                '#story-content',
-                '#news-content',
-                '[id*="article"]',
-                '[id*="content"]',
-                '[id*="story"]',
-                '[id*="news"]'
-            ]
-            
-            best_content = None
-            best_length = 0
-            
-            for selector in content_selectors:
-                try:
-                    article = soup.select_one(selector)
-                    if article:
-                        # Get text but preserve some structure
-                        content = article.get_text(separator='\n', strip=True)
-                        # Filter out very short or likely non-content text
-                        content = self._filter_news_content(content)
-                        
-                        # Keep the longest/best content found
-                        if len(content) > best_length and len(content) > 100:
-                            best_content = content
-                            best_length = len(content)
-                            if len(content) > 300:  # Good enough, use it
-                                article_content = content
-                                break
-                except:
-                    continue
-            
-            # Use best content found if we didn't break early
-            if not article_content and best_content:
-                article_content = best_content
-            
-            if not article_content or len(article_content) < 150:
-                # Try multiple paragraph extraction strategies
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    para_texts = []
-                    for p in paragraphs:
-                        text = p.get_text(strip=True)
-                        # Filter paragraphs - must be substantial and not navigation
-                        if text and len(text) > 20:
-                            # Skip paragraphs that look like navigation/menu items
-                            text_lower = text.lower()
-                            if not any(skip in text_lower for skip in ['cookie', 'subscribe', 'newsletter', 'follow us', 'menu', 'navigation']):
-                                # Skip if it's mostly links or very short
-                                if len([c for c in text if c.isalnum()]) > len(text) * 0.5:
-                                    para_texts.append(text)
-                    
-                    if para_texts:
-                        # Filter the combined content
-                        combined = '\n'.join(para_texts)
-                        article_content = self._filter_news_content(combined)
-            
-            if not article_content or len(article_content) < 100:
-                # Try divs with text content - more targeted search
-                div_candidates = []
-                
-                # Find divs with content-related classes/IDs
-                for div in soup.find_all('div'):
-                    classes = ' '.join(div.get('class', [])).lower()
-                    div_id = (div.get('id') or '').lower()
-                    
-                    # Check if div looks like content
-                    if any(keyword in classes or keyword in div_id for keyword in 
-                          ['content', 'article', 'story', 'post', 'entry', 'news', 'main']):
-                        text = div.get_text(separator='\n', strip=True)
-                        text = self._filter_news_content(text)
-                        if len(text) > 100:
-                            div_candidates.append((len(text), text))
-                
-                if div_candidates:
-                    # Use the longest, most substantial div
-                    div_candidates.sort(reverse=True)
-                    article_content = div_candidates[0][1]
-            
-            if not article_content or len(article_content) < 80:
-                # Last resort: get body text but filter out navigation/menu items
-                body = soup.find('body')
-                if body:
-                    # Remove common non-content elements more aggressively
-                    for elem in body.find_all(['nav', 'header', 'footer', 'aside', 'script', 'style',
-                                              'form', 'button', 'input', 'select', 'iframe']):
-                        elem.decompose()
-                    
-                    # Remove elements with navigation-related classes/IDs
-                    for elem in body.find_all(class_=lambda x: x and any(
-                        keyword in ' '.join(x).lower() for keyword in 
-                        ['nav', 'menu', 'sidebar', 'ad', 'social', 'share', 'comment']
-                    )):
-                        elem.decompose()
-                    
-                    raw_content = body.get_text(separator='\n', strip=True)
-                    article_content = self._filter_news_content(raw_content)
-            
-            # Lower threshold - accept content if we have at least 80 characters
-            if not article_content or len(article_content) < 80:
-                # Try fallback methods if enabled (more aggressively)
-                if use_fallbacks:
-                    fallback_methods = [
-                        ("newspaper3k", self.fetch_with_newspaper3k),
-                        ("RSS feed", self.try_rss_feed),
-                    ]
-                    
-                    for method_name, method_func in fallback_methods:
-                        print(f"   Trying fallback: {method_name}...")
-                        result = method_func(url)
-                        if result.get("success"):
-                            # Accept even if content is shorter than ideal
-                            content = result.get("content", "")
-                            if content and len(content) > 50:
-                                return result
-                
-                # If we got SOME content but it's short, still return it
-                if article_content and len(article_content) >= 50:
-                    # Clean up the content
-                    lines = [line.strip() for line in article_content.split('\n') if line.strip() and len(line.strip()) > 10]
-                    article_content = '\n'.join(lines[:100])  # Limit to first 100 paragraphs
-                    
-                    return {
-                        "success": True,
-                        "title": title_text,
-                        "content": article_content,
-                        "url": url,
-                        "content_length": len(article_content),
-                        "method": "requests (partial extraction)",
-                        "warning": "Content may be incomplete - consider manual paste for full article"
-                    }
-                
-                return {
-                    "success": False,
-                    "error": "Could not extract sufficient content from the article. The page structure may not be supported.",
-                    "url": url,
-                    "suggestion": "Try copying the article content manually, use browser automation (Selenium/Playwright), or use a different news source."
-                }
-            
-            # Clean up the content - be more lenient with filtering
-            lines = [line.strip() for line in article_content.split('\n') if line.strip() and len(line.strip()) > 5]
-            # Remove very short lines that are likely navigation/menu items
-            filtered_lines = []
-            for line in lines:
-                # Skip lines that look like navigation (short, all caps, or common menu items)
-                if len(line) > 8 and not (line.isupper() and len(line) < 30):
-                    filtered_lines.append(line)
-            
-            article_content = '\n'.join(filtered_lines[:200])  # Limit to first 200 paragraphs
-            
-            # If content is still substantial, return success
-            if len(article_content) >= 80:
-                return {
-                    "success": True,
-                    "title": title_text,
-                    "content": article_content,
-                    "url": url,
-                    "content_length": len(article_content),
-                    "method": "requests"
-                }
-            else:
-                # Content too short, try fallbacks
-                if use_fallbacks:
-                    fallback_methods = [
-                        ("newspaper3k", self.fetch_with_newspaper3k),
-                        ("RSS feed", self.try_rss_feed),
-                    ]
-                    
-                    for method_name, method_func in fallback_methods:
-                        print(f"   Trying fallback: {method_name}...")
-                        result = method_func(url)
-                        if result.get("success"):
-                            content = result.get("content", "")
-                            if content and len(content) > 50:
-                                return result
-                
-                # Return partial content if we have something
-                if article_content and len(article_content) >= 50:
-                    return {
-                        "success": True,
-                        "title": title_text,
-                        "content": article_content,
-                        "url": url,
-                        "content_length": len(article_content),
-                        "method": "requests (partial)",
-                        "warning": "Content may be incomplete"
-                    }
-            
-        except requests.exceptions.Timeout:
-            return {
-                "success": False,
-                "error": "Request timed out. The website may be slow or unreachable.",
-                "url": url
-            }
-        except requests.exceptions.ConnectionError:
-            return {
-                "success": False,
-                "error": "Connection error. Please check your internet connection.",
-                "url": url
-            }
-        except requests.exceptions.HTTPError as e:
-            return {
-                "success": False,
-                "error": f"HTTP Error {e.response.status_code}: {str(e)}",
-                "url": url,
-                "status_code": e.response.status_code
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error fetching article: {str(e)}",
-                "url": url
-            }
-    
-    def load_rules(self) -> str:
-        """Load the news analysis rules document"""
-        try:
-            with open(self.rules_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            print(f"Warning: Could not load rules file: {e}")
-            return ""
-    
-    def refine_category_based_on_scores(self, analysis: Dict[str, Any], article_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Refine category based on individual section scores and article keywords"""
-        if not isinstance(analysis, dict):
-            return analysis
-        
-        # Extract scores
-        fa_score = analysis.get("factual_accuracy", {}).get("score", 0)
-        sc_score = analysis.get("source_credibility", {}).get("score", 0)
-        bl_score = analysis.get("bias_level", {}).get("score", 0)
-        pi_score = analysis.get("propaganda_indicators", {}).get("score", 0)
-        ir_score = analysis.get("india_relevance", {}).get("score", 0)
-        overall_score = analysis.get("overall_score", 0)
-        
-        # Extract keywords from article
-        article_title = article_data.get("title", "").lower()
-        article_content = article_data.get("content", "").lower()
-        
-        # Find key terms
-        key_terms = []
-        important_terms = ['modi', 'putin', 'russia', 'diplomatic', 'security', 'policy', 'economic', 
-                          'government', 'citizen', 'india', 'visit', 'meeting', 'agreement', 'deal']
-        for term in important_terms:
-            if term in article_title or term in article_content[:500]:
-                key_terms.append(term.title())
-        
-        # Determine category based on scores
-        category = analysis.get("category", "UNKNOWN")
-        category_keywords = analysis.get("category_keywords", key_terms[:3])
-        category_reasoning = analysis.get("category_reasoning", "")
-        
-        # Refine category logic
-        if fa_score < 15 and sc_score < 10:
-            if pi_score < 8 or bl_score < 8:
-                if overall_score < 45:
-                    category = f"Propaganda - {category_keywords[0] if category_keywords else 'Agenda-Driven'} Content" if category_keywords else "PROPAGANDA"
-                else:
-                    category = f"Misinformation - {category_keywords[0] if category_keywords else 'Unverified'} Claims" if category_keywords else "MISINFORMATION"
-            else:
-                category = f"Incomplete Reporting - Missing {category_keywords[0] if category_keywords else 'Critical'} Information" if category_keywords else "MISINFORMATION"
-        elif fa_score >= 20 and sc_score >= 15:
-            if pi_score >= 12 and bl_score >= 10:
-                category = f"Factual News - {category_keywords[0] if category_keywords else 'Verified'} Reporting" if category_keywords else "FACTUAL NEWS"
-            else:
-                category = f"Factual but {category_keywords[0] if category_keywords else 'Biased'} - Needs Balance" if category_keywords else "FACTUAL NEWS"
-        elif overall_score >= 60 and fa_score >= 15:
-            category = f"Likely Factual - {category_keywords[0] if category_keywords else 'Verified'} with Gaps" if category_keywords else "FACTUAL NEWS"
-        elif overall_score < 60 and overall_score >= 45:
-            category = f"Questionable - {category_keywords[0] if category_keywords else 'Unverified'} Information" if category_keywords else "MISINFORMATION"
-        elif overall_score < 45:
-            if pi_score < 8:
-                category = f"Propaganda - {category_keywords[0] if category_keywords else 'Manipulative'} Content" if category_keywords else "PROPAGANDA"
-            else:
-                category = f"Severe Misinformation - {category_keywords[0] if category_keywords else 'False'} Claims" if category_keywords else "MISINFORMATION"
-        
-        # Update category reasoning if not provided
-        if not category_reasoning:
-            reasons = []
-            if fa_score < 15:
-                reasons.append("low factual accuracy")
-            if sc_score < 10:
-                reasons.append("poor source credibility")
-            if pi_score < 8:
-                reasons.append("propaganda indicators")
-            if bl_score < 8:
-                reasons.append("high bias")
-            category_reasoning = f"Category determined by: {', '.join(reasons) if reasons else 'overall assessment'}"
-        
-        # Update analysis
-        analysis["category"] = category
-        analysis["category_keywords"] = category_keywords
-        analysis["category_reasoning"] = category_reasoning
-        
-        return analysis
-    
-    def create_condensed_rules(self, full_rules: str) -> str:
-        """Create a condensed version of rules focusing on key criteria"""
-        # Extract key sections from the rules
-        condensed = """
+# System prompt for every analysis call - kept as one constant so all callers
+# send an identical prefix (which also lets OpenAI reuse its prompt cache)
+SYSTEM_PROMPT = "You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is to QUESTION EVERYTHING, identify what's MISSING, challenge claims, and demand answers that Indian citizens deserve. Don't accept reports at face value - be skeptical, ask hard questions, and judge based on what answers the report provides. Act like an adversarial journalist who wants the truth, not just what's being told."
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Sent with every analysis request so OpenAI routes them to the same prompt cache
+PROMPT_CACHE_KEY = "news_analyzer_v1"
+
+# Browser-like request headers (some news sites block obvious scripts)
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Only the codecs urllib3 can decode here (br / zstd once brotli / zstandard are installed)
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1',
+}
+
+# Words of 4+ / 5+ characters, used for keyword and topic extraction
+WORD4_RE = re.compile(r'\b\w{4,}\b')
+WORD5_RE = re.compile(r'\b\w{5,}\b')
+
+# Keywords that make a sentence from a related article worth surfacing
+IMPORTANT_KEYWORDS = frozenset({'policy', 'security', 'impact', 'citizen', 'government', 'cost', 'benefit'})
+
+# Recurring topics that make two stories related when both mention them
+COMMON_TOPICS = frozenset({'india', 'modi', 'putin', 'russia', 'diplomatic', 'visit', 'policy'})
+
+# Terms that become category keywords when they appear near the top of an article;
+# the lookahead finds every (even overlapping) occurrence in one regex pass
+IMPORTANT_TERMS = ('modi', 'putin', 'russia', 'diplomatic', 'security', 'policy', 'economic',
+                   'government', 'citizen', 'india', 'visit', 'meeting', 'agreement', 'deal')
+IMPORTANT_TERMS_RE = re.compile('(?=(' + '|'.join(IMPORTANT_TERMS) + '))')
+
+# Category refinement table, checked in order: (test on the factual-accuracy,
+# source-credibility, bias, propaganda and overall scores, label built from the
+# first category keyword, label when there are no keywords)
+CATEGORY_RULES = (
+    (lambda fa, sc, bl, pi, overall: fa < 15 and sc < 10 and (pi < 8 or bl < 8) and overall < 45,
+     "Propaganda - {} Content", "PROPAGANDA"),
+    (lambda fa, sc, bl, pi, overall: fa < 15 and sc < 10 and (pi < 8 or bl < 8),
+     "Misinformation - {} Claims", "MISINFORMATION"),
+    (lambda fa, sc, bl, pi, overall: fa < 15 and sc < 10,
+     "Incomplete Reporting - Missing {} Information", "MISINFORMATION"),
+    (lambda fa, sc, bl, pi, overall: fa >= 20 and sc >= 15 and pi >= 12 and bl >= 10,
+     "Factual News - {} Reporting", "FACTUAL NEWS"),
+    (lambda fa, sc, bl, pi, overall: fa >= 20 and sc >= 15,
+     "Factual but {} - Needs Balance", "FACTUAL NEWS"),
+    (lambda fa, sc, bl, pi, overall: overall >= 60 and fa >= 15,
+     "Likely Factual - {} with Gaps", "FACTUAL NEWS"),
+    (lambda fa, sc, bl, pi, overall: 45 <= overall < 60,
+     "Questionable - {} Information", "MISINFORMATION"),
+    (lambda fa, sc, bl, pi, overall: overall < 45 and pi < 8,
+     "Propaganda - {} Content", "PROPAGANDA"),
+    (lambda fa, sc, bl, pi, overall: overall < 45,
+     "Severe Misinformation - {} Claims", "MISINFORMATION"),
+)
+
+# Common RSS feed paths probed on a news site
+RSS_PATHS = ['/feed', '/rss', '/feeds/all.rss', '/rss.xml', '/feed.xml']
+
+# Containers that usually hold the article body, most specific first
+ARTICLE_CONTENT_SELECTORS = (
+    'article', '[role="article"]', '.article-content', '.article-body',
+    '.post-content', '.story-body', '.content-body', '.entry-content',
+    '.post-body', '.article-text', '.article-main', '.story-content',
+    '.article-wrapper', '.content-wrapper', '.article-detail', '.article-full',
+    '.article-main-content', '.story-detail', '.news-content', '.news-body',
+    '[class*="article"]', '[class*="story"]', '[class*="content"]', '[class*="post"]',
+    '[class*="entry"]', '[class*="news"]', 'main', '.main-content',
+    '#main-content', '#article-content', '#story-content', '#news-content',
+    '[id*="article"]', '[id*="content"]', '[id*="story"]', '[id*="news"]',
+)
+ARTICLE_CONTENT_SELECTOR = ', '.join(ARTICLE_CONTENT_SELECTORS)
+
+# Tags that never hold article text, dropped right after parsing
+NON_CONTENT_BLOCK_TAGS = ["script", "style", "svg"]
+
+# One stripped, non-blank line of text (what line.strip() leaves of it)
+TEXT_LINE_RE = re.compile(r'\S(?:[^\n]*\S)?')
+
+# Class/id hints for content-bearing <div>s and for navigation-like page furniture
+CONTENT_HINT_RE = re.compile(r'content|article|story|post|entry|news|main', re.I)
+NAV_CLASS_RE = re.compile(r'nav|menu|sidebar|ad|social|share|comment', re.I)
+
+# Tags dropped from <body> before the last-resort text extraction
+NAV_TAGS = frozenset({'nav', 'header', 'footer', 'aside', 'script', 'style',
+                      'form', 'button', 'input', 'select', 'iframe'})
+
+# CSS selectors are compiled once here rather than re-parsed for every page
+ARTICLE_CONTENT_PATTERN = sv.compile(ARTICLE_CONTENT_SELECTOR)
+ARTICLE_CONTENT_PATTERNS = tuple(sv.compile(selector) for selector in ARTICLE_CONTENT_SELECTORS)
+
+# Article containers in browser-rendered pages, most specific first
+RENDERED_CONTENT_PATTERNS = tuple(sv.compile(selector) for selector in (
+    'article', '[role="article"]', '.article-content', '.article-body', 'main'
+))
+
+# Navigation, ads, share bars and other page furniture stripped before extraction
+UNWANTED_PATTERN = sv.compile(', '.join([
+    '[class*="nav"]', '[class*="menu"]', '[class*="sidebar"]',
+    '[class*="ad"]', '[class*="advertisement"]', '[class*="promo"]',
+    '[class*="social"]', '[class*="share"]', '[class*="comment"]',
+    '[class*="related"]', '[class*="recommended"]', '[class*="trending"]',
+    '[id*="nav"]', '[id*="menu"]', '[id*="sidebar"]',
+    '[id*="ad"]', '[id*="advertisement"]', '[id*="promo"]',
+    '[id*="social"]', '[id*="share"]', '[id*="comment"]',
+    '[role="navigation"]', '[role="banner"]', '[role="complementary"]',
+    '[role="contentinfo"]', '[role="search"]'
+]))
+
+# Links in "related articles" sections of an article page
+RELATED_LINK_PATTERNS = tuple(sv.compile(selector) for selector in (
+    'a[href*="related"]',
+    '.related-articles a',
+    '.more-articles a',
+    '.similar-articles a',
+    '[class*="related"] a',
+    '[class*="similar"] a'
+))
+
+# Condensed rules used when the full rules document is too long for the prompt
+CONDENSED_RULES = """
 # NEWS ANALYSIS RULES - KEY CRITERIA
 
 ## PROPAGANDA INDICATORS
@@ -1032,15 +228,10 @@ No Relevance (0): No connection to India
 ## ANALYSIS REQUIREMENTS
 Provide detailed reasoning with specific examples from the article for each score.
 """
-        return condensed
-    
-    def create_analysis_prompt(self, article_data: Dict[str, Any], rules: str, use_condensed: bool = True) -> str:
-        """Create the prompt for OpenAI analysis with critical questioning approach"""
-        # Use condensed rules if the full rules are too long
-        if use_condensed and len(rules) > 10000:
-            rules = self.create_condensed_rules(rules)
-        
-        prompt = f"""You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is NOT to accept what's reported at face value, but to QUESTION EVERYTHING, identify what's MISSING, and demand ANSWERS that Indian citizens deserve.
+
+# Fixed instructions of every analysis prompt. The rules document goes between the
+# two and the article comes last, so everything before it is a cacheable prefix
+ANALYSIS_PROMPT_HEAD = """You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is NOT to accept what's reported at face value, but to QUESTION EVERYTHING, identify what's MISSING, and demand ANSWERS that Indian citizens deserve.
 
 CRITICAL ANALYSIS FRAMEWORK:
 1. DON'T just report what the article says - QUESTION it
@@ -1052,17 +243,9 @@ CRITICAL ANALYSIS FRAMEWORK:
 
 Use the following rules document for reference:
 
-{rules}
-
----
-
-NEWS ARTICLE TO ANALYZE:
-
-Title: {article_data.get('title', 'N/A')}
-URL: {article_data.get('url', 'N/A')}
+"""
 
-Content:
-{article_data.get('content', 'N/A')}
+ANALYSIS_PROMPT_TAIL = """
 
 ---
 
@@ -1226,28 +409,28 @@ SCORING WITH CRITICAL LENS:
 ---
 
 Provide your CRITICAL ANALYSIS in the following JSON format:
-{{
-    "critical_questions": {{
+{
+    "critical_questions": {
         "questions_raised": ["<list of critical questions that should be asked>"],
         "questions_answered": ["<list of questions the report DOES answer>"],
         "questions_unanswered": ["<list of questions the report FAILS to answer>"],
         "missing_perspectives": ["<what perspectives/voices are missing>"],
         "hidden_agenda": "<what agenda might be behind this report>"
-    }},
-    "beneficiary_analysis": {{
+    },
+    "beneficiary_analysis": {
         "people_involved": ["<list of all people, organizations, companies, parties mentioned>"],
         "direct_beneficiaries": ["<who directly benefits from this news being reported this way>"],
         "indirect_beneficiaries": ["<who indirectly benefits (not mentioned but gains)>"],
         "political_beneficiaries": ["<who gains politically from this narrative>"],
         "economic_beneficiaries": ["<who gains financially from this news>"],
         "reputational_beneficiaries": ["<whose image/reputation is improved>"],
-        "connections_and_relationships": {{
+        "connections_and_relationships": {
             "media_connections": ["<connections between news subjects and media owners>"],
             "business_relationships": ["<business connections between people involved>"],
             "political_affiliations": ["<political party connections>"],
             "financial_interests": ["<financial stakes and investments>"],
             "undisclosed_relationships": ["<hidden connections that should be disclosed>"]
-        }},
+        },
         "conflict_of_interest": ["<conflicts of interest that exist but aren't disclosed>"],
         "real_news_hidden": "<what important news is being obscured or hidden by this story>",
         "agenda_masking": "<what bigger story or issue is this masking/distracting from>",
@@ -1255,38 +438,38 @@ Provide your CRITICAL ANALYSIS in the following JSON format:
         "distraction_purpose": "<what is this news distracting citizens from?>",
         "hidden_beneficiaries": ["<beneficiaries that are not mentioned in the article>"],
         "who_loses": ["<who stands to lose if the real story comes out>"]
-    }},
-    "factual_accuracy": {{
+    },
+    "factual_accuracy": {
         "score": <0-30>,
         "reasoning": "<CRITICAL assessment - what CAN be verified vs. what CAN'T>",
         "verifiable_claims": ["<claims that CAN be verified from the report>"],
         "unverified_claims": ["<claims presented as fact but CANNOT be verified>"],
         "missing_evidence": ["<what evidence is missing that should be there>"]
-    }},
-    "source_credibility": {{
+    },
+    "source_credibility": {
         "score": <0-20>,
         "reasoning": "<CRITICAL assessment - question the sources>",
         "sources_found": ["<list of sources mentioned>"],
         "sources_missing": ["<what sources SHOULD have been included but weren't>"],
         "credibility_assessment": "<are sources independent? credible? agenda-driven?>",
         "one_sided": "<yes/no - are opposing views included?>"
-    }},
-    "bias_level": {{
+    },
+    "bias_level": {
         "score": <0-15>,
         "reasoning": "<CRITICAL assessment - what bias is present>",
         "bias_types": ["<list of bias types detected>"],
         "examples": ["<specific examples of bias>"],
         "missing_balance": "<what would balance this report?>"
-    }},
-    "propaganda_indicators": {{
+    },
+    "propaganda_indicators": {
         "score": <0-15>,
         "reasoning": "<CRITICAL assessment - detect manipulation>",
         "indicators_found": ["<list of propaganda indicators>"],
         "emotional_manipulation": "<yes/no with specific examples>",
         "agenda_detected": "<what agenda is being pushed?>",
         "distraction_tactic": "<is this distracting from real issues?>"
-    }},
-    "india_relevance": {{
+    },
+    "india_relevance": {
         "score": <0-20>,
         "reasoning": "<CRITICAL assessment - REAL impact on citizens>",
         "claimed_relevance": "<what the report claims is relevant>",
@@ -1295,23 +478,23 @@ Provide your CRITICAL ANALYSIS in the following JSON format:
         "relevance_level": "<high/medium/low/none>",
         "how_affects_india": "<REAL impact, not claimed impact>",
         "citizen_concerns": ["<what should citizens be concerned about>"]
-    }},
+    },
     "overall_score": <0-100>,
     "category": "<DETERMINE BASED ON SCORES - Use specific descriptive category with keywords from article>",
     "category_keywords": ["<list of key terms from article that define its nature>"],
     "category_reasoning": "<explain why this category based on individual scores>",
     "verdict": "<CRITICAL verdict - don't accept at face value, question everything>",
-    "india_specific_analysis": {{
+    "india_specific_analysis": {
         "relevance_to_india": "<CRITICAL - what's the REAL relevance, not claimed>",
         "potential_impact": "<REAL impact on Indian citizens, not claimed>",
         "harm_assessment": "<what harm could this cause? what's being hidden?>",
         "citizen_rights": "<does this serve citizens' right to information?>",
         "recommendation": "<what should citizens do? what should they question?>"
-    }},
+    },
     "critical_findings": ["<CRITICAL findings - what's wrong, what's missing, what should be questioned>"],
     "fact_check_notes": "<CRITICAL fact-checking - what can't be verified, what's suspicious>",
     "opposition_viewpoint": "<what would an opposition reporter say about this?>",
-    "citizen_accountability": {{
+    "citizen_accountability": {
         "questions_citizens_should_ask": ["<list of questions Indian citizens should be asking>"],
         "topics_should_have_covered": ["<list of topics the article SHOULD have covered for accountability>"],
         "information_citizens_need": ["<what information do citizens NEED that the article doesn't provide>"],
@@ -1321,86 +504,86 @@ Provide your CRITICAL ANALYSIS in the following JSON format:
         "what_should_have_been_investigated": ["<what should the article have investigated or questioned>"],
         "democratic_accountability": "<how should this have been reported to serve democratic accountability>",
         "citizen_right_to_know": "<what should citizens know that they don't from this article>"
-    }},
-    "world_class_comparison": {{
+    },
+    "world_class_comparison": {
         "overall_rating_vs_world_class": <0-100, where 100 = matches world-class standards>,
-        "comparison_categories": {{
-            "factual_accuracy": {{
+        "comparison_categories": {
+            "factual_accuracy": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 90,
                 "gap": <difference>,
                 "assessment": "<how this compares to BBC/Reuters standards>"
-            }},
-            "source_diversity": {{
+            },
+            "source_diversity": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 85,
                 "gap": <difference>,
                 "assessment": "<how this compares to world-class source diversity>"
-            }},
-            "investigative_depth": {{
+            },
+            "investigative_depth": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 88,
                 "gap": <difference>,
                 "assessment": "<depth comparison with investigative journalism standards>"
-            }},
-            "balance_and_perspectives": {{
+            },
+            "balance_and_perspectives": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 87,
                 "gap": <difference>,
                 "assessment": "<how balanced this is vs world-class reporting>"
-            }},
-            "transparency": {{
+            },
+            "transparency": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 90,
                 "gap": <difference>,
                 "assessment": "<transparency comparison>"
-            }},
-            "citizen_focus": {{
+            },
+            "citizen_focus": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 85,
                 "gap": <difference>,
                 "assessment": "<how well it serves citizens vs world-class standards>"
-            }},
-            "context_and_background": {{
+            },
+            "context_and_background": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 88,
                 "gap": <difference>,
                 "assessment": "<context provided vs world-class standards>"
-            }},
-            "data_and_evidence": {{
+            },
+            "data_and_evidence": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 87,
                 "gap": <difference>,
                 "assessment": "<data usage vs world-class standards>"
-            }},
-            "expert_consultation": {{
+            },
+            "expert_consultation": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 85,
                 "gap": <difference>,
                 "assessment": "<expert input vs world-class standards>"
-            }},
-            "independence": {{
+            },
+            "independence": {
                 "this_article_score": <0-100>,
                 "world_class_standard": 90,
                 "gap": <difference>,
                 "assessment": "<independence from agenda vs world-class standards>"
-            }}
-        }},
-        "world_class_benchmarks": {{
+            }
+        },
+        "world_class_benchmarks": {
             "bbc_standard": "<how this compares to BBC reporting standards>",
             "reuters_standard": "<how this compares to Reuters standards>",
             "guardian_standard": "<how this compares to The Guardian standards>",
             "nyt_standard": "<how this compares to New York Times standards>",
             "overall_assessment": "<comprehensive comparison with world's best>"
-        }},
+        },
         "improvement_needed": ["<specific areas where this falls short of world-class standards>"],
         "strengths": ["<areas where this matches or exceeds world-class standards>"]
-    }},
-    "true_report": {{
+    },
+    "true_report": {
         "title": "<how the article SHOULD have been titled - comprehensive and accurate>",
         "lead_paragraph": "<opening paragraph that captures the real story for Indian citizens>",
         "full_report": "<WRITE A COMPLETE NEWS ARTICLE (800-1500 words). This is NOT a description or instruction - it is the ACTUAL FULL NEWS REPORT that should have been written. Start writing the article immediately. Include: 1) A proper news lead that answers who/what/when/where/why, 2) Background context and history, 3) Multiple perspectives (quote government, opposition, experts, citizens), 4) Answers to ALL questions from questions_citizens_should_ask, 5) Coverage of ALL topics from topics_should_have_covered, 6) ALL information from information_citizens_need, 7) Data, statistics, and verifiable facts, 8) Real citizen impact analysis, 9) Policy implications, 10) Accountability questions answered, 11) Transparency issues addressed, 12) Expert opinions and analysis, 13) Historical context, 14) What should have been investigated. Write this as a REAL, PUBLISHABLE news article with proper paragraphs, quotes, and journalistic structure. Do NOT write instructions or descriptions - write the actual article.>",
-        "sections": {{
+        "sections": {
             "background_context": "<necessary background and context missing from original>",
             "multiple_perspectives": "<different viewpoints that should have been included>",
             "citizen_impact_analysis": "<detailed analysis of real impact on Indian citizens>",
@@ -1411,40 +594,1393 @@ Provide your CRITICAL ANALYSIS in the following JSON format:
             "historical_context": "<historical context and precedents relevant to Indian citizens>",
             "policy_implications": "<policy implications and government accountability aspects>",
             "citizen_rights_impact": "<how this affects citizens' rights, interests, and democratic participation>"
-        }},
-        "sources_and_references": {{
+        },
+        "sources_and_references": {
             "primary_sources": ["<what primary sources should have been consulted>"],
             "expert_sources": ["<what experts should have been quoted>"],
             "official_sources": ["<what official/government sources should have been accessed>"],
             "data_sources": ["<what data sources and statistics should have been referenced>"],
             "independent_sources": ["<what independent verification sources should have been used>"],
             "opposition_perspectives": ["<what opposition or alternative perspectives should have been included>"]
-        }},
-        "reporting_standards": {{
+        },
+        "reporting_standards": {
             "what_was_missing": "<summary of what was missing in original report>",
             "how_to_improve": "<how the reporting should have been improved>",
             "journalistic_standards": "<what journalistic standards should have been followed>",
             "citizen_focus": "<how the report should have focused on citizen interests>"
-        }}
-    }}
-}}
+        }
+    }
+}
+
+BE CRITICAL. QUESTION EVERYTHING. DON'T ACCEPT AT FACE VALUE. 
+Act like an opposition reporter demanding answers. 
+"Roast" the report with questions, then judge it based on what answers it provides.
+Focus on what Indian citizens NEED to know vs. what's being reported.
+Be harsh but fair - if it's good reporting, say so. If it's propaganda, call it out.
+
+CRITICAL INSTRUCTION FOR "true_report.full_report":
+- This MUST be a REAL, COMPLETE NEWS ARTICLE (800-1500 words)
+- DO NOT write instructions, descriptions, or meta-commentary
+- DO NOT say "The report should include..." or "This article should cover..."
+- WRITE THE ACTUAL ARTICLE as if you are a journalist publishing it
+- Start with a news lead, include quotes, data, multiple perspectives
+- Write in journalistic style with proper paragraphs and structure
+- Make it ready to publish - a real news article, not a description of one"""
+
+# (connect, read) timeouts in seconds: an unreachable host fails fast, while a slow but
+# responding one still gets time to send the page
+ARTICLE_TIMEOUT = (5, 15)
+FEED_TIMEOUT = (5, 10)
+
+# Most article characters sent to the model; longer articles are cut with a note
+MAX_PROMPT_CONTENT_CHARS = 12000
+
+# First JSON object inside a ```json (or bare ```) fence in the model's reply
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+JSON_DECODER = json.JSONDecoder()
+
+def extract_json(text: str) -> Any:
+    """Parse the JSON object from the model's reply, fenced or not"""
+    match = JSON_FENCE_RE.search(text)
+    if match:
+        try:
+            return json_loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+    # No (valid) fence, or it was never closed - decode from the first brace,
+    # ignoring any trailing text
+    start = text.find("{")
+    if start == -1:
+        raise json.JSONDecodeError("No JSON object found", text, 0)
+    return JSON_DECODER.raw_decode(text, start)[0]
+
+# Streamed chunks (roughly tokens) of the model's reply per progress dot printed
+STREAM_PROGRESS_CHUNKS = 50
+
+# Longest wait for the related-articles search and comparison, in seconds
+RELATED_SEARCH_TIMEOUT = 30
+
+# How long a fetched article stays valid in the on-disk article cache (seconds)
+ARTICLE_CACHE_TTL = 24 * 3600
+
+# How long a stored analysis is reused for the same article text (seconds)
+ANALYSIS_CACHE_TTL = 24 * 3600
+
+# Browser fallbacks identify as desktop Chrome and wait for the article container
+ARTICLE_READY_SELECTOR = 'article, main, [role="article"]'
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+class ResponseCache:
+    """SQLite-backed cache of response texts (OpenAI responses, fetched articles), keyed on the full request"""
+    
+    def __init__(self, path: str = ".llm_cache.sqlite3"):
+        """Open (or create) the cache database"""
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+            )
+    
+    @staticmethod
+    def make_key(**request: Any) -> str:
+        """Hash a request (model, messages, temperature, ...) into a cache key"""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Get a cached response, or None if missing (or older than max_age seconds)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return row[0]
+    
+    def purge(self, max_age: float) -> None:
+        """Delete responses older than max_age seconds"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - max_age,))
+    
+    def set(self, key: str, response: str) -> None:
+        """Store a response"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
 
-BE CRITICAL. QUESTION EVERYTHING. DON'T ACCEPT AT FACE VALUE. 
-Act like an opposition reporter demanding answers. 
-"Roast" the report with questions, then judge it based on what answers it provides.
-Focus on what Indian citizens NEED to know vs. what's being reported.
-Be harsh but fair - if it's good reporting, say so. If it's propaganda, call it out.
+class TTLCache:
+    """Small thread-safe in-memory cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a live entry (None if missing or expired)"""
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self.data[key]
+                return None
+            self.data.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store an entry, evicting the least recently used one when full"""
+        with self.lock:
+            self.data[key] = (time.monotonic(), value)
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
 
-CRITICAL INSTRUCTION FOR "true_report.full_report":
-- This MUST be a REAL, COMPLETE NEWS ARTICLE (800-1500 words)
-- DO NOT write instructions, descriptions, or meta-commentary
-- DO NOT say "The report should include..." or "This article should cover..."
-- WRITE THE ACTUAL ARTICLE as if you are a journalist publishing it
-- Start with a news lead, include quotes, data, multiple perspectives
-- Write in journalistic style with proper paragraphs and structure
-- Make it ready to publish - a real news article, not a description of one"""
+class NewsAnalyzer:
+    """Main class for analyzing news articles"""
+    
+    # Model known to work for each API key (by hash), shared by every instance in
+    # the process so a new analyzer doesn't re-probe the models over the network
+    _working_models: Dict[str, str] = {}
+    
+    def __init__(self):
+        """Initialize the analyzer with OpenAI client"""
+        # Try to get API key from Streamlit secrets first (for Streamlit Cloud)
+        # Then fall back to environment variable (for local development)
+        try:
+            import streamlit as st
+            api_key = st.secrets.get("OPEN_AI_API", "")
+        except:
+            api_key = os.getenv("OPEN_AI_API", "").strip('"')
+        
+        if not api_key:
+            raise ValueError("OPENAI_API key not found. Please set OPEN_AI_API in Streamlit secrets or .env file")
+        
+        self.client = OpenAI(api_key=api_key)
+        self.rules_path = "NEWS_ANALYSIS_RULES.md"
+        self._rules_cache = None  # ((path, mtime), text) of the last rules file read
+        self._api_key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        # Default model, will be updated by test_api_key
+        self.model = self._working_models.get(self._api_key_id, "gpt-4o")
+        
+        # One pooled session for all page/feed requests, so repeat requests to a
+        # site reuse the open (keep-alive) connection instead of a new TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(BROWSER_HEADERS)
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Repeat analyses of a URL skip the scrape (successful fetches only) and
+        # identical OpenAI requests are answered from the on-disk response cache
+        self.fetch_cache = TTLCache(maxsize=256, ttl=3600)
+        self.response_cache = ResponseCache()
+        self.response_cache.purge(ANALYSIS_CACHE_TTL)  # expired responses are never read again
+        # Extracted articles also persist on disk, so a restart doesn't re-scrape them
+        self.article_cache = ResponseCache(".article_cache.sqlite3")
+        self.article_cache.purge(ARTICLE_CACHE_TTL)  # expired articles are never read again
+        
+        # Headless Chromium is launched on first use and then reused across fetches. Sync
+        # Playwright objects only work on the thread that created them, so the browser
+        # lives on one dedicated worker thread and every render is handed to it
+        self._playwright = None
+        self._browser = None
+        self._browser_worker = None
+        self._browser_lock = threading.Lock()
+        
+        # Sites whose pages only render their article in a browser (learned per netloc)
+        self._needs_browser = set()
+    
+    def close(self):
+        """Close the pooled HTTP connections and any running browser"""
+        self.session.close()
+        self.close_playwright()
+    
+    def close_playwright(self):
+        """Shut down the shared Playwright browser and its worker thread, if started"""
+        with self._browser_lock:
+            worker, self._browser_worker = self._browser_worker, None
+        if worker is not None:
+            worker.submit(self._stop_browser)
+            worker.shutdown(wait=True)
+    
+    def _stop_browser(self):
+        """Close the browser and Playwright driver (runs on the browser worker thread)"""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        except Exception:
+            pass
+        self._playwright = None
+        self._browser = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
+    def test_api_key(self) -> bool:
+        """Test if the OpenAI API key is working"""
+        # Already confirmed in this process (by a probe or a real completion)
+        known_model = self._working_models.get(self._api_key_id)
+        if known_model:
+            self.model = known_model
+            return True
+        
+        # Try different models in order of preference
+        models_to_try = ["gpt-4o", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"]
+        
+        def probe(model: str):
+            return self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "user", "content": "Say OK"}
+                ],
+                max_tokens=5
+            )
+        
+        def accept(model: str) -> bool:
+            self.model = model  # Store working model
+            self._working_models[self._api_key_id] = model
+            return True  # If we got a response, API key works
+        
+        # A valid key usually works with the preferred model, so that costs one call
+        try:
+            probe(models_to_try[0])
+            return accept(models_to_try[0])
+        except Exception:
+            pass
+        
+        # Only then probe the rest at once (one round-trip instead of three); results
+        # are still read in preference order to pick the model
+        fallback_models = models_to_try[1:]
+        executor = ThreadPoolExecutor(max_workers=len(fallback_models))
+        try:
+            futures = [executor.submit(probe, model) for model in fallback_models]
+            for model, future in zip(fallback_models, futures):
+                try:
+                    future.result()
+                    return accept(model)
+                except Exception as e:
+                    if model == fallback_models[-1]:  # Last model
+                        print(f"API Key Test Failed with all models. Last error: {str(e)}")
+                    continue
+        finally:
+            # Don't wait on slower, less preferred probes once a model is chosen
+            executor.shutdown(wait=False, cancel_futures=True)
+        return False
+    
+    def _filter_news_content(self, text: str) -> str:
+        """Filter out non-news content from extracted text"""
+        if not text:
+            return ""
+        
+        lines = text.split('\n')
+        filtered_lines = []
+        
+        # Common non-news patterns to filter
+        skip_patterns = [
+            'cookie', 'privacy policy', 'terms of service', 'subscribe',
+            'newsletter', 'follow us', 'share on', 'like us', 'follow @',
+            'advertisement', 'sponsored', 'promoted', 'trending now',
+            'you may also like', 'related articles', 'recommended for you',
+            'sign up', 'log in', 'register', 'create account',
+            '©', 'copyright', 'all rights reserved', 'terms & conditions',
+            'menu', 'navigation', 'home', 'about', 'contact',
+            'skip to', 'jump to', 'back to top', 'scroll to top'
+        ]
+        
+        for line in lines:
+            line = line.strip()
+            if not line or len(line) < 10:
+                continue
+            
+            # Skip very short lines (likely navigation)
+            if len(line) < 15 and line.isupper():
+                continue
+            
+            # Skip lines matching skip patterns
+            line_lower = line.lower()
+            should_skip = False
+            for pattern in skip_patterns:
+                if pattern in line_lower:
+                    should_skip = True
+                    break
+            
+            if should_skip:
+                continue
+            
+            # Skip lines that are mostly punctuation or numbers
+            if len([c for c in line if c.isalnum()]) < len(line) * 0.3:
+                continue
+            
+            filtered_lines.append(line)
+        
+        return '\n'.join(filtered_lines)
+    
+    def fetch_with_newspaper3k(self, url: str) -> Dict[str, Any]:
+        """Try fetching using newspaper3k library (handles many news sites)"""
+        global NEWSPAPER_AVAILABLE
+        if NEWSPAPER_AVAILABLE:
+            try:
+                from newspaper import Article
+            except ImportError:
+                # Installed but broken (e.g. newer lxml without lxml.html.clean)
+                NEWSPAPER_AVAILABLE = False
+        if not NEWSPAPER_AVAILABLE:
+            return {"success": False, "error": "newspaper3k not installed"}
+        
+        try:
+            article = Article(url, language='en')
+            # Set longer timeout for Streamlit Cloud
+            article.config.request_timeout = 20
+            article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            
+            article.download()
+            article.parse()
+            
+            # Lower threshold - accept if we have any reasonable content
+            if article.text and len(article.text.strip()) > 50:
+                return {
+                    "success": True,
+                    "title": article.title or "No title found",
+                    "content": article.text.strip(),
+                    "url": url,
+                    "method": "newspaper3k"
+                }
+        except Exception as e:
+            # Don't return error immediately - might still work with other methods
+            pass
+        return {"success": False, "error": "newspaper3k failed to extract content"}
+    
+    def fetch_with_selenium(self, url: str) -> Dict[str, Any]:
+        """Try fetching using Selenium (handles JavaScript-heavy sites)"""
+        if not SELENIUM_AVAILABLE:
+            return {"success": False, "error": "selenium not installed"}
+        
+        driver = None
+        try:
+            chrome_options = Options()
+            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--no-sandbox')
+            chrome_options.add_argument('--disable-dev-shm-usage')
+            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+            chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option('useAutomationExtension', False)
+            
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.get(url)
+            
+            # Wait until the article container exists instead of a fixed sleep
+            try:
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR))
+                )
+            except Exception:
+                pass
+            
+            # Try to find and close cookie/consent banners
+            try:
+                close_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Close') or contains(text(), '×')]")
+                for btn in close_buttons[:3]:  # Try first 3
+                    try:
+                        btn.click()
+                        time.sleep(1)
+                    except:
+                        pass
+            except:
+                pass
+            
+            # Get page source
+            page_source = driver.page_source
+            soup = BeautifulSoup(page_source, 'lxml')
+            
+            # Extract title
+            title = driver.title or soup.find('title')
+            title_text = title if isinstance(title, str) else (title.get_text().strip() if title else "No title found")
+            
+            # Extract content
+            for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
+                script.decompose()
+            
+            article_content = None
+            for pattern in RENDERED_CONTENT_PATTERNS:
+                article = pattern.select_one(soup)
+                if article:
+                    article_content = article.get_text(separator='\n', strip=True)
+                    if len(article_content) > 200:
+                        break
+            
+            if not article_content:
+                article_content = self._paragraph_text(soup)
+            
+            if article_content and len(article_content) > 100:
+                return {
+                    "success": True,
+                    "title": title_text,
+                    "content": article_content[:5000],  # Limit content
+                    "url": url,
+                    "method": "selenium"
+                }
+        except Exception as e:
+            return {"success": False, "error": f"selenium error: {str(e)}"}
+        finally:
+            if driver:
+                driver.quit()
+        return {"success": False, "error": "selenium failed to extract content"}
+    
+    def fetch_with_playwright(self, url: str) -> Dict[str, Any]:
+        """Try fetching using Playwright (modern headless browser)"""
+        if not PLAYWRIGHT_AVAILABLE:
+            return {"success": False, "error": "playwright not installed"}
+        
+        try:
+            with self._browser_lock:
+                if self._browser_worker is None:
+                    self._browser_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+                render = self._browser_worker.submit(self._render_on_browser_thread, url)
+            title, content = render.result()
+            return self._parse_rendered_page(url, title, content)
+        except Exception as e:
+            return {"success": False, "error": f"playwright error: {str(e)}"}
+    
+    def _parse_rendered_page(self, url: str, title: str, content: str) -> Dict[str, Any]:
+        """Extract the article text from browser-rendered HTML"""
+        soup = BeautifulSoup(content, 'lxml')
+        for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
+            script.decompose()
+        
+        article_content = None
+        for pattern in RENDERED_CONTENT_PATTERNS:
+            article = pattern.select_one(soup)
+            if article:
+                article_content = article.get_text(separator='\n', strip=True)
+                if len(article_content) > 200:
+                    break
+        
+        if not article_content:
+            article_content = self._paragraph_text(soup)
+        
+        if article_content and len(article_content) > 100:
+            return {
+                "success": True,
+                "title": title or "No title found",
+                "content": article_content[:5000],
+                "url": url,
+                "method": "playwright"
+            }
+        return {"success": False, "error": "playwright failed to extract content"}
+    
+    def _paragraph_text(self, soup: BeautifulSoup, max_chars: int = 5000) -> str:
+        """Join the page's non-empty <p> texts, stopping once max_chars is reached"""
+        texts = []
+        total = 0
+        for p in soup.find_all('p'):
+            text = p.get_text(strip=True)
+            if text:
+                texts.append(text)
+                total += len(text) + 1
+                if total > max_chars:  # callers keep only the first max_chars anyway
+                    break
+        return '\n'.join(texts)
+    
+    def _render_on_browser_thread(self, url: str) -> Tuple[str, str]:
+        """Render a page on the shared browser, launching it first if needed (browser worker thread only)"""
+        if self._browser is None:
+            playwright = sync_playwright().start()
+            try:
+                self._browser = playwright.chromium.launch(headless=True)
+            except Exception:
+                playwright.stop()
+                raise
+            self._playwright = playwright
+        return self._render_with_playwright(self._browser, url)
+    
+    def _render_with_playwright(self, browser: Any, url: str) -> Tuple[str, str]:
+        """Load a page in a fresh context on an existing browser; returns (title, html)"""
+        context = browser.new_context(user_agent=BROWSER_USER_AGENT)
+        try:
+            page = context.new_page()
+            # Analytics beacons can keep 'networkidle' from ever settling, so wait
+            # for the DOM and then only as long as the article container needs
+            page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            try:
+                page.wait_for_selector(ARTICLE_READY_SELECTOR, timeout=5000)
+            except Exception:
+                pass
+            
+            return page.title(), page.content()
+        finally:
+            context.close()
+    
+    def _extract_with_trafilatura(self, html: bytes, url: str) -> Optional[Dict[str, Any]]:
+        """Extract the article with Trafilatura; None unless it finds a full article (500+ chars)"""
+        global TRAFILATURA_AVAILABLE
+        if not TRAFILATURA_AVAILABLE:
+            return None
+        try:
+            import trafilatura
+        except ImportError:
+            TRAFILATURA_AVAILABLE = False  # installed but not importable
+            return None
+        try:
+            extracted = trafilatura.extract(html, url=url, output_format='json', with_metadata=True,
+                                            favor_precision=True, include_comments=False)
+        except Exception:
+            return None
+        if not extracted:
+            return None
+
+        extracted = json_loads(extracted)
+        content = (extracted.get('text') or '').strip()
+        if len(content) < 500:
+            return None
+        return {
+            "success": True,
+            "title": (extracted.get('title') or '').strip() or "No title found",
+            "content": content,
+            "url": url,
+            "content_length": len(content),
+            "method": "trafilatura"
+        }
+
+    def _looks_like_js_shell(self, soup: BeautifulSoup) -> bool:
+        """True when the raw HTML is an app shell that only renders with JavaScript"""
+        for mount_id in ('root', 'app', '__next', '__nuxt'):
+            mount = soup.find(id=mount_id)
+            if mount is not None and not mount.get_text(strip=True):
+                return True
+        noscript = soup.find('noscript')
+        return bool(noscript and 'javascript' in noscript.get_text().lower())
+    
+    def _fetch_with_browser(self, url: str) -> Dict[str, Any]:
+        """Render the page in a headless browser (Playwright, then Selenium)"""
+        for method_name, method_func in [("playwright", self.fetch_with_playwright),
+                                         ("selenium", self.fetch_with_selenium)]:
+            print(f"   Trying browser: {method_name}...")
+            result = method_func(url)
+            if result.get("success") and len(result.get("content", "")) > 50:
+                self._needs_browser.add(urlparse(url).netloc)
+                return result
+        return {"success": False, "error": "headless browser could not render the article"}
+    
+    def _fetch_all(self, urls: List[str], headers: Optional[Dict[str, str]] = None,
+                   timeout: Union[float, Tuple[float, float]] = FEED_TIMEOUT) -> List[Any]:
+        """Fetch several URLs concurrently; failed requests come back as None (order is kept)"""
+        def fetch(target: str):
+            try:
+                return self.session.get(target, headers=headers, timeout=timeout)
+            except Exception:
+                return None
+        
+        # Network-bound, so threads overlap the round-trips
+        with ThreadPoolExecutor(max_workers=max(1, min(len(urls), 8))) as executor:
+            return list(executor.map(fetch, urls))
+    
+    def _parse_feed(self, content: bytes) -> List[Any]:
+        """Entries of a feed document; plain RSS 2.0 is read straight off the lxml tree"""
+        parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+        try:
+            root = etree.fromstring(content, parser=parser)
+        except Exception:
+            root = None
+        
+        if root is not None and root.tag == 'rss':
+            return [
+                {
+                    "link": (item.findtext('link') or '').strip(),
+                    "title": item.findtext('title') or '',
+                    "summary": item.findtext('description') or '',
+                    "published": item.findtext('pubDate') or ''
+                }
+                for item in root.iter('item')
+            ]
+        
+        # Atom, RDF and anything malformed go through feedparser (imported only when needed)
+        import feedparser
+        return feedparser.parse(content).entries
+    
+    def _get_feed_entries(self, feed_urls: List[str], headers: Optional[Dict[str, str]] = None,
+                          timeout: Union[float, Tuple[float, float]] = FEED_TIMEOUT) -> List[List[Any]]:
+        """Entries for each feed URL (empty if there is no feed), fetched concurrently and cached"""
+        entries = {feed_url: self.fetch_cache.get(("feed", feed_url)) for feed_url in feed_urls}
+        missing = [feed_url for feed_url, cached in entries.items() if cached is None]
+        
+        responses = self._fetch_all(missing, headers=headers, timeout=timeout) if missing else []
+        for feed_url, response in zip(missing, responses):
+            if response is None or response.status_code != 200:
+                entries[feed_url] = []
+                continue
+            try:
+                entries[feed_url] = self._parse_feed(response.content)
+            except Exception:
+                entries[feed_url] = []
+            # Remember the answer - including "no feed here" - for this site's next lookup
+            self.fetch_cache.set(("feed", feed_url), entries[feed_url])
+        
+        return [entries[feed_url] for feed_url in feed_urls]
+    
+    def try_rss_feed(self, url: str) -> Dict[str, Any]:
+        """Try to find and parse RSS feed for the article (successful lookups are cached)"""
+        cache_key = ("rss", url)
+        cached = self.fetch_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        result = self._try_rss_feed(url)
+        if result.get("success"):
+            self.fetch_cache.set(cache_key, result)
+        return result
+    
+    def _try_rss_feed(self, url: str) -> Dict[str, Any]:
+        """Look for the article in the site's RSS feed"""
+        # Extract base domain
+        try:
+            from urllib.parse import urlparse
+            parsed = urlparse(url)
+            base_url = f"{parsed.scheme}://{parsed.netloc}"
+            
+            # Probe every common feed path at once rather than one after another
+            feeds = self._get_feed_entries([base_url + path for path in RSS_PATHS])
+            
+            for feed_entries in feeds:
+                try:
+                    if feed_entries:
+                        # Try to find matching article
+                        for entry in feed_entries[:10]:  # Check first 10 entries
+                            if url in entry.get('link', '') or entry.get('link', '') in url:
+                                return {
+                                    "success": True,
+                                    "title": entry.get('title', 'No title'),
+                                    "content": entry.get('summary', '') or entry.get('description', ''),
+                                    "url": url,
+                                    "method": "rss_feed"
+                                }
+                except:
+                    continue
+        except Exception as e:
+            pass
+        return {"success": False, "error": "RSS feed not found or doesn't contain article"}
+    
+    def find_related_articles(self, url: str, current_title: str, current_content: str, max_articles: int = 5) -> List[Dict[str, Any]]:
+        """Find related articles from the same website"""
+        try:
+            
+            parsed = urlparse(url)
+            base_url = f"{parsed.scheme}://{parsed.netloc}"
+            related_articles = []
+            
+            # Extract keywords from title and content
+            current_lower = current_content.lower()
+            title_words = set(WORD4_RE.findall(current_title.lower()))
+            content_words = set(WORD5_RE.findall(current_lower[:500]))
+            keywords = list(title_words.union(content_words))[:10]  # Top 10 keywords
+            keyword_set = frozenset(keywords)
+            current_topics = COMMON_TOPICS.intersection(WORD4_RE.findall(current_lower))
+            
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            }
+            
+            def rss_related() -> List[Dict[str, Any]]:
+                """Related articles from the site's RSS feeds (cached per feed)"""
+                found = []
+                for feed_entries in self._get_feed_entries([base_url + path for path in RSS_PATHS], headers):
+                    try:
+                        for entry in feed_entries[:20]:  # Check more entries
+                            entry_url = entry.get('link', '')
+                            entry_title = entry.get('title', '').lower()
+                            entry_summary = (entry.get('summary', '') or entry.get('description', '')).lower()
+                            
+                            # Skip if it's the same article
+                            if entry_url == url or url in entry_url:
+                                continue
+                            
+                            # Check relevance by keyword matching, plus common topics
+                            # (India, Modi, Putin, etc.) shared with the current article
+                            entry_tokens = frozenset(WORD4_RE.findall(entry_title + " " + entry_summary))
+                            relevance_score = (len(keyword_set & entry_tokens)
+                                               + 2 * len(current_topics & entry_tokens))
+                            
+                            if relevance_score >= 2:  # Minimum relevance threshold
+                                found.append({
+                                    "url": entry_url,
+                                    "title": entry.get('title', 'No title'),
+                                    "summary": entry.get('summary', '') or entry.get('description', ''),
+                                    "relevance_score": relevance_score,
+                                    "published": entry.get('published', ''),
+                                    "source": "rss_feed"
+                                })
+                                
+                                if len(found) >= max_articles:
+                                    return found
+                    except:
+                        continue
+                return found
+            
+            def page_related() -> List[Dict[str, Any]]:
+                """Related articles linked from the article page itself ("related articles" sections)"""
+                found = []
+                page_response = self._fetch_all([url], headers=headers)[0]
+                if page_response is None or page_response.status_code != 200:
+                    return found
+                soup = BeautifulSoup(page_response.content, 'lxml')
+                
+                # Look for related articles links
+                for pattern in RELATED_LINK_PATTERNS:
+                    links = pattern.select(soup)
+                    for link in links[:10]:
+                        href = link.get('href', '')
+                        if href:
+                            if not href.startswith('http'):
+                                href = urljoin(base_url, href)
+                            
+                            if href != url and base_url in href:
+                                title = link.get_text(strip=True)
+                                if title and len(title) > 10:
+                                    # Check relevance
+                                    title_lower = title.lower()
+                                    relevance = sum(1 for kw in keywords if kw in title_lower)
+                                    
+                                    if relevance >= 1:
+                                        found.append({
+                                            "url": href,
+                                            "title": title,
+                                            "summary": "",
+                                            "relevance_score": relevance,
+                                            "source": "page_links"
+                                        })
+                                        
+                                        if len(found) >= max_articles:
+                                            return found
+                return found
+            
+            # Feed discovery and the page-link scrape are independent - run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(rss_related), executor.submit(page_related)]
+                for future in futures:
+                    try:
+                        related_articles.extend(future.result())
+                    except Exception:
+                        pass
+            
+            # Sort by relevance score, keep the best-scoring copy of each URL (the same story
+            # can come from a feed and a page link, or two selectors) and return top articles
+            related_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+            seen_urls = set()
+            related_articles = [
+                article for article in related_articles
+                if not (article["url"] in seen_urls or seen_urls.add(article["url"]))
+            ]
+            return related_articles[:max_articles]
+            
+        except Exception as e:
+            return []
+    
+    def analyze_related_articles(self, current_article: Dict[str, Any], related_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze related articles and compare with current article"""
+        if not related_articles:
+            return {
+                "related_articles_found": False,
+                "message": "No related articles found on the same website"
+            }
+        
+        analysis = {
+            "related_articles_found": True,
+            "total_found": len(related_articles),
+            "articles": []
+        }
+        
+        current_title = current_article.get('title', '').lower()
+        current_content = current_article.get('content', '').lower()
+        
+        # Topics of the current article are the same for every comparison
+        current_topics = set(WORD5_RE.findall(current_content[:1000]))
+        
+        # The current article's long sentences, joined once: a related sentence is a
+        # duplicate when its opening appears inside any of them. Sentences are split
+        # on '.', so joining on '.' can't create a match across two of them
+        current_sentences_text = '.'.join(
+            sentence for sentence in (s.strip() for s in current_content.split('.')) if len(sentence) > 50
+        )
+        
+        # Fetch every related article's full content up front, concurrently
+        fetched_articles = self.fetch_articles_batch(
+            [article.get('url', '') for article in related_articles], use_fallbacks=False, max_workers=5
+        )
+        
+        for article, fetched in zip(related_articles, fetched_articles):
+            article_analysis = {
+                "url": article.get('url', ''),
+                "title": article.get('title', ''),
+                "relevance_score": article.get('relevance_score', 0),
+                "summary": article.get('summary', '')[:200] if article.get('summary') else "",
+                "comparison": {}
+            }
+            
+            article_title = article.get('title', '').lower()
+            article_summary = (article.get('summary', '') or '').lower()
+            
+            # Compare topics
+            article_topics = set(WORD5_RE.findall(article_summary[:1000]))
+            
+            common_topics = current_topics.intersection(article_topics)
+            unique_to_current = current_topics - article_topics
+            unique_to_related = article_topics - current_topics
+            
+            article_analysis["comparison"] = {
+                "common_topics": list(common_topics)[:5],
+                "topics_in_related_not_in_current": list(unique_to_related)[:5],
+                "topics_in_current_not_in_related": list(unique_to_current)[:5]
+            }
+            
+            # Use the full content (if it could be fetched) for deeper analysis
+            try:
+                if fetched and fetched.get('success'):
+                    article_analysis["full_content_available"] = True
+                    article_analysis["content_length"] = len(fetched.get('content', ''))
+                    
+                    # More detailed comparison
+                    related_content = fetched.get('content', '').lower()
+                    
+                    # Find what's in related article but missing in current
+                    related_sentences = [s.strip() for s in related_content.split('.') if len(s.strip()) > 50]
+                    
+                    # Find unique information in related article
+                    unique_info = []
+                    for rel_sent in related_sentences[:20]:
+                        if rel_sent[:50] not in current_sentences_text:
+                            # Check if it contains important keywords
+                            if any(kw in rel_sent for kw in IMPORTANT_KEYWORDS):
+                                unique_info.append(rel_sent[:150])
+                                if len(unique_info) >= 3:
+                                    break
+                    
+                    article_analysis["comparison"]["information_in_related_not_in_current"] = unique_info
+                else:
+                    article_analysis["full_content_available"] = False
+            except:
+                article_analysis["full_content_available"] = False
+            
+            analysis["articles"].append(article_analysis)
+        
+        return analysis
+    
+    def fetch_articles_batch(self, urls: List[str], use_fallbacks: bool = True, max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """Fetch several articles concurrently over the pooled session (order is kept; None on error)"""
+        def fetch(article_url: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.fetch_article_content(article_url, use_fallbacks=use_fallbacks)
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(urls), max_workers))) as executor:
+            return list(executor.map(fetch, urls))
+    
+    def fetch_article_content(self, url: str, use_fallbacks: bool = True) -> Dict[str, Any]:
+        """
+        Fetch article content with multiple fallback strategies.
+        Tries newspaper3k first (works better on Streamlit Cloud), then requests, then other methods.
+        Successful fetches are cached in memory for an hour and on disk for a day.
+        """
+        cache_key = ("article", url, use_fallbacks)
+        cached = self.fetch_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        disk_key = ResponseCache.make_key(kind="article", url=url, use_fallbacks=use_fallbacks)
+        stored = self.article_cache.get(disk_key, max_age=ARTICLE_CACHE_TTL)
+        if stored is not None:
+            result = json_loads(stored)
+            self.fetch_cache.set(cache_key, result)
+            return dict(result)
+        
+        result = self._fetch_article_content(url, use_fallbacks)
+        if result.get("success"):
+            self.fetch_cache.set(cache_key, result)
+            self.article_cache.set(disk_key, json.dumps(result, ensure_ascii=False))
+        return result
+    
+    def _try_fallbacks(self, url: str, newspaper_result: Optional[Dict[str, Any]] = None, min_content: int = 0) -> Optional[Dict[str, Any]]:
+        """Run the newspaper3k and RSS fallbacks concurrently; the first usable result, in that order, wins"""
+        fallback_methods = [
+            ("newspaper3k", self.fetch_with_newspaper3k),
+            ("RSS feed", self.try_rss_feed),
+        ]
+        
+        executor = ThreadPoolExecutor(max_workers=len(fallback_methods))
+        try:
+            pending = []
+            for method_name, method_func in fallback_methods:
+                if method_name == "newspaper3k" and newspaper_result is not None:
+                    pending.append((method_name, None))  # already tried at the start - don't download again
+                else:
+                    pending.append((method_name, executor.submit(method_func, url)))
+            
+            for method_name, future in pending:
+                print(f"   Trying fallback: {method_name}...")
+                result = newspaper_result if future is None else future.result()
+                if result.get("success") and (not min_content or len(result.get("content") or "") > min_content):
+                    return result
+        finally:
+            # Don't hold the caller for a slower fallback once one has been accepted
+            executor.shutdown(wait=False, cancel_futures=True)
+        return None
+    
+    def _fetch_article_content(self, url: str, use_fallbacks: bool = True) -> Dict[str, Any]:
+        """Fetch and extract content from a news URL with multiple fallback methods"""
+        
+        # Try newspaper3k FIRST (works better on Streamlit Cloud for many sites)
+        newspaper_result = None
+        if use_fallbacks:
+            print("   Trying newspaper3k first (best for Streamlit Cloud)...")
+            newspaper_result = self.fetch_with_newspaper3k(url)
+            if newspaper_result.get("success") and len(newspaper_result.get("content", "")) > 100:
+                return newspaper_result
+        
+        # Sites already known to be JavaScript-only go straight to the browser
+        if use_fallbacks and urlparse(url).netloc in self._needs_browser:
+            browser_result = self._fetch_with_browser(url)
+            if browser_result.get("success"):
+                return browser_result
+        
+        try:
+            # Pooled session already carries the browser-like headers; the body is
+            # streamed so a PDF, image or JSON payload can be turned away unread
+            response = self.session.get(url, timeout=ARTICLE_TIMEOUT, allow_redirects=True, stream=True)
+            
+            content_type = response.headers.get('Content-Type', '')
+            if response.ok and content_type and 'html' not in content_type.lower():
+                response.close()
+                return {
+                    "success": False,
+                    "error": f"Not a web page: the URL returned '{content_type}' content instead of HTML.",
+                    "url": url,
+                    "suggestion": "Use the link to the article's web page, or copy the article content manually."
+                }
+            response.content  # Read the page now so the connection goes back to the pool
+            
+            # Handle common error codes
+            if response.status_code == 401:
+                # Try fallback methods for 401 errors
+                if use_fallbacks:
+                    print(f"   401 Forbidden - trying fallback methods...")
+                    result = self._try_fallbacks(url, newspaper_result)
+                    if result:
+                        return result
+                
+                return {
+                    "success": False,
+                    "error": f"401 Forbidden: This website requires authentication or blocks automated access.",
+                    "url": url,
+                    "suggestion": "Options: 1) Use browser automation (Selenium/Playwright), 2) Try newspaper3k library, 3) Check RSS feed, 4) Copy article content manually."
+                }
+            elif response.status_code == 403:
+                # Try fallback methods for 403 errors
+                if use_fallbacks:
+                    print(f"   403 Forbidden - trying fallback methods...")
+                    result = self._try_fallbacks(url, newspaper_result)
+                    if result:
+                        return result
+                
+                return {
+                    "success": False,
+                    "error": f"403 Forbidden: Access denied. This website may block automated requests.",
+                    "url": url,
+                    "suggestion": "This site blocks automated access. Options: 1) Use browser automation (Selenium/Playwright), 2) Try newspaper3k library, 3) Check for RSS feed, 4) Copy article content manually."
+                }
+            elif response.status_code == 404:
+                return {
+                    "success": False,
+                    "error": f"404 Not Found: The article URL doesn't exist or has been removed.",
+                    "url": url
+                }
+            
+            response.raise_for_status()
+            
+            # Try to detect encoding
+            if response.encoding is None or response.encoding == 'ISO-8859-1':
+                response.encoding = response.apparent_encoding or 'utf-8'
+            
+            # Trafilatura's boilerplate removal handles most well-structured news pages in
+            # one lxml pass; the soup-based cascade below only runs when it comes up short
+            extracted = self._extract_with_trafilatura(response.content, url)
+            if extracted:
+                return extracted
+            
+            soup = BeautifulSoup(response.content, 'lxml')
+            
+            # <script>/<style>/<svg> never hold article text (removed on the parsed tree, where
+            # a self-closing <svg/> can't swallow the content that follows it)
+            for element in soup(NON_CONTENT_BLOCK_TAGS):
+                element.decompose()
+            
+            # Decide now, before <noscript> and friends are stripped below
+            js_shell = self._looks_like_js_shell(soup)
+            
+            # Remove non-content elements more aggressively
+            for element in soup(["script", "style", "nav", "header", "footer", "aside", 
+                               "iframe", "embed", "object", "form", "button", "input",
+                               "select", "textarea", "noscript", "svg", "canvas"]):
+                element.decompose()
+            
+            # Remove common non-content classes/IDs (one pass for all the selectors)
+            try:
+                # Innermost matches go first, so no element is visited after its ancestor is gone
+                for elem in reversed(UNWANTED_PATTERN.select(soup)):
+                    elem.decompose()
+            except:
+                pass
+            
+            # Extract title (try multiple methods)
+            title_text = "No title found"
+            title_selectors = [
+                ('meta', {'property': 'og:title'}),
+                ('meta', {'name': 'twitter:title'}),
+                ('h1', {}),
+                ('title', {})
+            ]
+            
+            for tag, attrs in title_selectors:
+                element = soup.find(tag, attrs) if attrs else soup.find(tag)
+                if element:
+                    title_text = element.get('content') or element.get_text()
+                    if title_text and title_text.strip():
+                        title_text = title_text.strip()
+                        break
+            
+            # Extract main content (try common article selectors - EXPANDED LIST)
+            article_content = None
+            
+            best_content = None
+            best_length = 0
+            
+            # One DOM walk finds every candidate; the selectors' priority order is then
+            # resolved by matching against that short list instead of re-walking the tree
+            candidates = ARTICLE_CONTENT_PATTERN.select(soup)
+            for pattern in ARTICLE_CONTENT_PATTERNS if candidates else ():
+                try:
+                    article = next((el for el in candidates if pattern.match(el)), None)
+                    if article:
+                        # Get text but preserve some structure
+                        content = article.get_text(separator='\n', strip=True)
+                        # Filter out very short or likely non-content text
+                        content = self._filter_news_content(content)
+                        
+                        # Keep the longest/best content found
+                        if len(content) > best_length and len(content) > 100:
+                            best_content = content
+                            best_length = len(content)
+                            if len(content) > 300:  # Good enough, use it
+                                article_content = content
+                                break
+                except:
+                    continue
+            
+            # Use best content found if we didn't break early
+            if not article_content and best_content:
+                article_content = best_content
+            
+            # The paragraph and <div> fallbacks below share a single walk of the tree
+            fallback_blocks = []
+            if not article_content or len(article_content) < 150:
+                fallback_blocks = soup.find_all(['p', 'div'])
+                
+                # Try multiple paragraph extraction strategies
+                paragraphs = [block for block in fallback_blocks if block.name == 'p']
+                if paragraphs:
+                    para_texts = []
+                    for p in paragraphs:
+                        text = p.get_text(strip=True)
+                        # Filter paragraphs - must be substantial and not navigation
+                        if text and len(text) > 20:
+                            # Skip paragraphs that look like navigation/menu items
+                            text_lower = text.lower()
+                            if not any(skip in text_lower for skip in ['cookie', 'subscribe', 'newsletter', 'follow us', 'menu', 'navigation']):
+                                # Skip if it's mostly links or very short
+                                if len([c for c in text if c.isalnum()]) > len(text) * 0.5:
+                                    para_texts.append(text)
+                    
+                    if para_texts:
+                        # Filter the combined content
+                        combined = '\n'.join(para_texts)
+                        article_content = self._filter_news_content(combined)
+            
+            if not article_content or len(article_content) < 100:
+                # Try divs with text content - more targeted search, keeping only the
+                # longest text seen so far as (length, text)
+                best_div = (0, '')
+                
+                # Find divs with content-related classes/IDs. A div nested in a candidate
+                # can't yield longer text than it, so its subtree isn't extracted again
+                covering = None
+                for div in (block for block in fallback_blocks if block.name == 'div'):
+                    if covering is not None and any(parent is covering for parent in div.parents):
+                        continue
+                    
+                    # Check if div looks like content
+                    if (CONTENT_HINT_RE.search(' '.join(div.get('class', [])))
+                            or CONTENT_HINT_RE.search(div.get('id') or '')):
+                        covering = div
+                        text = div.get_text(separator='\n', strip=True)
+                        text = self._filter_news_content(text)
+                        if len(text) > 100:
+                            best_div = max(best_div, (len(text), text))
+                
+                if best_div[1]:
+                    # Use the longest, most substantial div
+                    article_content = best_div[1]
+            
+            if not article_content or len(article_content) < 80:
+                # Last resort: get body text but filter out navigation/menu items
+                body = soup.find('body')
+                if body:
+                    # Remove common non-content elements and elements with navigation-related
+                    # classes more aggressively, finding both kinds in one walk of the body
+                    def is_page_furniture(tag) -> bool:
+                        if tag.name in NAV_TAGS:
+                            return True
+                        return bool(NAV_CLASS_RE.search(' '.join(tag.get('class', []))))
+                    
+                    for elem in reversed(body.find_all(is_page_furniture)):
+                        elem.decompose()
+                    
+                    raw_content = body.get_text(separator='\n', strip=True)
+                    article_content = self._filter_news_content(raw_content)
+            
+            # Lower threshold - accept content if we have at least 80 characters
+            if not article_content or len(article_content) < 80:
+                # Try fallback methods if enabled (more aggressively)
+                if use_fallbacks:
+                    # Accept even if content is shorter than ideal
+                    result = self._try_fallbacks(url, newspaper_result, min_content=50)
+                    if result:
+                        return result
+                    
+                    # Only launch a headless browser when the HTML is a JavaScript shell
+                    if js_shell:
+                        browser_result = self._fetch_with_browser(url)
+                        if browser_result.get("success"):
+                            return browser_result
+                
+                # If we got SOME content but it's short, still return it
+                if article_content and len(article_content) >= 50:
+                    # Clean up the content
+                    lines = (line for line in TEXT_LINE_RE.findall(article_content) if len(line) > 10)
+                    article_content = '\n'.join(islice(lines, 100))  # Limit to first 100 paragraphs
+                    
+                    return {
+                        "success": True,
+                        "title": title_text,
+                        "content": article_content,
+                        "url": url,
+                        "content_length": len(article_content),
+                        "method": "requests (partial extraction)",
+                        "warning": "Content may be incomplete - consider manual paste for full article"
+                    }
+                
+                return {
+                    "success": False,
+                    "error": "Could not extract sufficient content from the article. The page structure may not be supported.",
+                    "url": url,
+                    "suggestion": "Try copying the article content manually, use browser automation (Selenium/Playwright), or use a different news source."
+                }
+            
+            # Clean up the content - be more lenient with filtering
+            # Remove very short lines that are likely navigation/menu items, and lines that look
+            # like navigation (short, all caps, or common menu items)
+            filtered_lines = (
+                line for line in TEXT_LINE_RE.findall(article_content)
+                if len(line) > 8 and not (len(line) < 30 and line.isupper())
+            )
+            
+            article_content = '\n'.join(islice(filtered_lines, 200))  # Limit to first 200 paragraphs
+            
+            # If content is still substantial, return success
+            if len(article_content) >= 80:
+                return {
+                    "success": True,
+                    "title": title_text,
+                    "content": article_content,
+                    "url": url,
+                    "content_length": len(article_content),
+                    "method": "requests"
+                }
+            else:
+                # Content too short, try fallbacks
+                if use_fallbacks:
+                    result = self._try_fallbacks(url, newspaper_result, min_content=50)
+                    if result:
+                        return result
+                
+                # Return partial content if we have something
+                if article_content and len(article_content) >= 50:
+                    return {
+                        "success": True,
+                        "title": title_text,
+                        "content": article_content,
+                        "url": url,
+                        "content_length": len(article_content),
+                        "method": "requests (partial)",
+                        "warning": "Content may be incomplete"
+                    }
+            
+        except requests.exceptions.Timeout:
+            return {
+                "success": False,
+                "error": "Request timed out. The website may be slow or unreachable.",
+                "url": url
+            }
+        except requests.exceptions.ConnectionError:
+            return {
+                "success": False,
+                "error": "Connection error. Please check your internet connection.",
+                "url": url
+            }
+        except requests.exceptions.HTTPError as e:
+            return {
+                "success": False,
+                "error": f"HTTP Error {e.response.status_code}: {str(e)}",
+                "url": url,
+                "status_code": e.response.status_code
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Error fetching article: {str(e)}",
+                "url": url
+            }
+    
+    def load_rules(self) -> str:
+        """Load the news analysis rules document (re-read only when the file changes)"""
+        try:
+            cache_key = (self.rules_path, os.stat(self.rules_path).st_mtime_ns)
+            if self._rules_cache is not None and self._rules_cache[0] == cache_key:
+                return self._rules_cache[1]
+            with open(self.rules_path, 'r', encoding='utf-8') as f:
+                rules = f.read()
+            self._rules_cache = (cache_key, rules)
+            return rules
+        except Exception as e:
+            print(f"Warning: Could not load rules file: {e}")
+            return ""
+    
+    @staticmethod
+    def _section_score(analysis: Dict[str, Any], section: str) -> Any:
+        """Score of one analysis section, 0 when the section is missing or malformed"""
+        details = analysis.get(section)
+        return details.get("score", 0) if isinstance(details, dict) else 0
+    
+    def refine_category_based_on_scores(self, analysis: Dict[str, Any], article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Refine category based on individual section scores and article keywords"""
+        if not isinstance(analysis, dict):
+            return analysis
+        
+        # Extract scores
+        fa_score = self._section_score(analysis, "factual_accuracy")
+        sc_score = self._section_score(analysis, "source_credibility")
+        bl_score = self._section_score(analysis, "bias_level")
+        pi_score = self._section_score(analysis, "propaganda_indicators")
+        overall_score = analysis.get("overall_score", 0)
+        
+        # Extract keywords from article
+        # (only the opening of the content is searched, so only that is lowercased)
+        article_title = article_data.get("title", "").lower()
+        article_head = article_data.get("content", "")[:500].lower()
+        
+        # Find key terms (one scan over title and opening; listed in IMPORTANT_TERMS order)
+        found_terms = set(IMPORTANT_TERMS_RE.findall(article_title + "\n" + article_head))
+        key_terms = [term.title() for term in IMPORTANT_TERMS if term in found_terms]
+        
+        # Determine category based on scores
+        category = analysis.get("category", "UNKNOWN")
+        category_keywords = analysis.get("category_keywords", key_terms[:3])
+        category_reasoning = analysis.get("category_reasoning", "")
+        
+        # Refine category logic: the first matching rule names the category
+        for matches, template, fallback in CATEGORY_RULES:
+            if matches(fa_score, sc_score, bl_score, pi_score, overall_score):
+                category = template.format(category_keywords[0]) if category_keywords else fallback
+                break
+        
+        # Update category reasoning if not provided
+        if not category_reasoning:
+            reasons = []
+            if fa_score < 15:
+                reasons.append("low factual accuracy")
+            if sc_score < 10:
+                reasons.append("poor source credibility")
+            if pi_score < 8:
+                reasons.append("propaganda indicators")
+            if bl_score < 8:
+                reasons.append("high bias")
+            category_reasoning = f"Category determined by: {', '.join(reasons) if reasons else 'overall assessment'}"
+        
+        # Update analysis
+        analysis["category"] = category
+        analysis["category_keywords"] = category_keywords
+        analysis["category_reasoning"] = category_reasoning
+        
+        return analysis
+    
+    def create_condensed_rules(self, full_rules: str) -> str:
+        """Create a condensed version of rules focusing on key criteria"""
+        # The key sections are fixed, so the condensed text is a module constant
+        return CONDENSED_RULES
+    
+    def create_analysis_prompt(self, article_data: Dict[str, Any], rules: str, use_condensed: bool = True) -> str:
+        """Create the prompt for OpenAI analysis with critical questioning approach"""
+        # Use condensed rules if the full rules are too long
+        if use_condensed and len(rules) > 10000:
+            rules = self.create_condensed_rules(rules)
         
-        return prompt
+        # Cap the article text so a very long page can't blow up the token count
+        content = article_data.get('content', 'N/A')
+        if content and len(content) > MAX_PROMPT_CONTENT_CHARS:
+            content = content[:MAX_PROMPT_CONTENT_CHARS] + "\n\n[...content truncated for length...]"
+        
+        # The article goes last: instructions and rules are identical for every article,
+        # so OpenAI can serve that (long) prefix from its prompt cache
+        article_section = (
+            "\n\n---\n\nNEWS ARTICLE TO ANALYZE:\n\n"
+            f"Title: {article_data.get('title', 'N/A')}\n"
+            f"URL: {article_data.get('url', 'N/A')}\n\n"
+            f"Content:\n{content}"
+        )
+        return "".join((ANALYSIS_PROMPT_HEAD, rules, ANALYSIS_PROMPT_TAIL, article_section))
+    
+    def _search_and_compare_related(self, url: str, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find related articles on the same website and compare them with this one"""
+        related_articles = self.find_related_articles(
+            url,
+            article_data.get('title', ''),
+            article_data.get('content', ''),
+            max_articles=5
+        )
+        if not related_articles:
+            print("   ⚠️  No related articles found")
+            return None
+        print(f"   ✅ Found {len(related_articles)} related articles")
+        return self.analyze_related_articles(article_data, related_articles)
+    
+    def _collect_related_articles(self, search: Future, deadline: float) -> Optional[Dict[str, Any]]:
+        """Wait (until deadline) for the background related-articles search and comparison"""
+        try:
+            return search.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FuturesTimeoutError:
+            search.cancel()
+            print("   ⚠️  Related articles search timed out (skipping)")
+        except Exception as e:
+            print(f"   ⚠️  Error in related articles search: {str(e)}")
+        return None
     
     def analyze_news(self, url: str, find_related: bool = True) -> Dict[str, Any]:
         """Main method to analyze a news article"""
@@ -1462,42 +1998,16 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
         print(f"✅ Article fetched: {article_data.get('title', 'N/A')}")
         print(f"📄 Content length: {len(article_data.get('content', ''))} characters")
         
-        # Find related articles from same website (with timeout protection)
-        related_articles_analysis = None
+        # Search for related articles from same website and compare them in the background,
+        # while the article itself is analyzed (the wait for both is bounded by a deadline)
+        related_search = None
+        related_deadline = 0.0
         if find_related:
             print("🔗 Searching for related articles on the same website...")
-            try:
-                import signal
-                
-                def timeout_handler(signum, frame):
-                    raise TimeoutError("Related articles search timed out")
-                
-                # Set 30 second timeout for related articles search
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)
-                
-                try:
-                    related_articles = self.find_related_articles(
-                        url, 
-                        article_data.get('title', ''), 
-                        article_data.get('content', ''),
-                        max_articles=5
-                    )
-                    signal.alarm(0)  # Cancel timeout
-                    
-                    if related_articles:
-                        print(f"   ✅ Found {len(related_articles)} related articles")
-                        related_articles_analysis = self.analyze_related_articles(article_data, related_articles)
-                    else:
-                        print("   ⚠️  No related articles found")
-                except TimeoutError:
-                    signal.alarm(0)
-                    print("   ⚠️  Related articles search timed out (skipping)")
-                except Exception as e:
-                    signal.alarm(0)
-                    print(f"   ⚠️  Error finding related articles: {str(e)}")
-            except Exception as e:
-                print(f"   ⚠️  Error in related articles search: {str(e)}")
+            related_pool = ThreadPoolExecutor(max_workers=1)
+            related_search = related_pool.submit(self._search_and_compare_related, url, article_data)
+            related_pool.shutdown(wait=False)  # the worker exits once the search is done
+            related_deadline = time.monotonic() + RELATED_SEARCH_TIMEOUT
         
         # Load rules
         print("📋 Loading analysis rules...")
@@ -1512,37 +2022,47 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
         print("   ⏳ This may take 30-90 seconds, please wait...")
         try:
             # Use the model that worked during API key test
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a CRITICAL OPPOSITION REPORTER and investigative journalist analyzing Indian news. Your job is to QUESTION EVERYTHING, identify what's MISSING, challenge claims, and demand answers that Indian citizens deserve. Don't accept reports at face value - be skeptical, ask hard questions, and judge based on what answers the report provides. Act like an adversarial journalist who wants the truth, not just what's being told."
-                    },
+            request = {
+                "model": self.model,
+                "messages": [
+                    SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
-                temperature=0.5,  # Higher for more creative comprehensive reporting
-                max_tokens=6000  # Increased significantly to accommodate comprehensive True Report (800-1500 words)
-            )
+                "temperature": 0.5,  # Higher for more creative comprehensive reporting
+                "max_tokens": 6000,  # Increased significantly to accommodate comprehensive True Report (800-1500 words)
+                "extra_body": {"prompt_cache_key": PROMPT_CACHE_KEY}
+            }
             
-            analysis_text = response.choices[0].message.content
+            # Identical prompts (same article, rules and model) reuse the stored response
+            # for a day, so a repeat URL skips the API call entirely
+            cache_key = ResponseCache.make_key(**request)
+            analysis_text = self.response_cache.get(cache_key, max_age=ANALYSIS_CACHE_TTL)
+            if analysis_text is None:
+                # Streamed, so the reply is read while it is generated and progress shows
+                stream = self.client.chat.completions.create(**request, stream=True)
+                self._working_models[self._api_key_id] = self.model
+                parts = []
+                for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    if len(parts) % STREAM_PROGRESS_CHUNKS == 0:
+                        print(".", end="", flush=True)
+                print()
+                analysis_text = "".join(parts)
+                if analysis_text:
+                    self.response_cache.set(cache_key, analysis_text)
+            else:
+                print("   ♻️  Using cached analysis for identical request")
             
             # Try to parse JSON from response
             try:
                 # Extract JSON from markdown code blocks if present
-                if "```json" in analysis_text:
-                    json_start = analysis_text.find("```json") + 7
-                    json_end = analysis_text.find("```", json_start)
-                    analysis_text = analysis_text[json_start:json_end].strip()
-                elif "```" in analysis_text:
-                    json_start = analysis_text.find("```") + 3
-                    json_end = analysis_text.find("```", json_start)
-                    analysis_text = analysis_text[json_start:json_end].strip()
-                
-                analysis_json = json.loads(analysis_text)
+                analysis_json = extract_json(analysis_text)
                 
                 # Refine category based on individual scores
                 analysis_json = self.refine_category_based_on_scores(analysis_json, article_data)
@@ -1563,6 +2083,9 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
             }
             
             # Add related articles analysis if available
+            related_articles_analysis = None
+            if related_search is not None:
+                related_articles_analysis = self._collect_related_articles(related_search, related_deadline)
             if related_articles_analysis:
                 result["related_articles"] = related_articles_analysis
             
@@ -1584,13 +2107,31 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
         analysis = result.get("analysis", {})
         article = result.get("article", {})
         
-        output = []
-        output.append("=" * 80)
-        output.append("📰 NEWS ANALYSIS REPORT")
-        output.append("=" * 80)
-        output.append(f"\n🔗 URL: {result.get('url')}")
-        output.append(f"📌 Title: {article.get('title', 'N/A')}")
-        output.append("\n" + "-" * 80)
+        output = [
+            "=" * 80,
+            "📰 NEWS ANALYSIS REPORT",
+            "=" * 80,
+            f"\n🔗 URL: {result.get('url')}",
+            f"📌 Title: {article.get('title', 'N/A')}",
+            "\n" + "-" * 80
+        ]
+        
+        # Most sections are a heading followed by a numbered list, a bulleted list or a
+        # paragraph, each skipped when the model left that field empty
+        def add_numbered(heading: str, items: Any) -> None:
+            if items:
+                output.append(heading)
+                output.extend(f"   {i}. {item}" for i, item in enumerate(items, 1))
+        
+        def add_bullets(heading: str, items: Any, indent: str = "   ", limit: Optional[int] = None) -> None:
+            if items:
+                output.append(heading)
+                output.extend(f"{indent}• {item}" for item in items[:limit])
+        
+        def add_text(heading: str, text: Any, indent: str = "   ") -> None:
+            if text:
+                output.append(heading)
+                output.append(f"{indent}{text}")
         
         # Overall verdict
         if isinstance(analysis, dict):
@@ -1601,10 +2142,12 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
             output.append(f"📊 Overall Score: {overall_score}/100")
             
             # Category reasoning and keywords
-            if "category_reasoning" in analysis and analysis.get("category_reasoning"):
-                output.append(f"   📝 Category Reasoning: {analysis.get('category_reasoning')}")
-            if "category_keywords" in analysis and analysis.get("category_keywords"):
-                output.append(f"   🔑 Key Terms: {', '.join(analysis['category_keywords'][:5])}")
+            category_reasoning = analysis.get("category_reasoning")
+            if category_reasoning:
+                output.append(f"   📝 Category Reasoning: {category_reasoning}")
+            category_keywords = analysis.get("category_keywords")
+            if category_keywords:
+                output.append(f"   🔑 Key Terms: {', '.join(category_keywords[:5])}")
             
             # Critical Questions Section
             if "critical_questions" in analysis:
@@ -1613,30 +2156,21 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 output.append("-" * 80)
                 cq = analysis["critical_questions"]
                 
-                if "questions_raised" in cq and cq["questions_raised"]:
-                    output.append("\n🔍 Questions That Should Be Asked:")
-                    for i, q in enumerate(cq["questions_raised"], 1):
-                        output.append(f"   {i}. {q}")
+                add_numbered("\n🔍 Questions That Should Be Asked:", cq.get("questions_raised"))
+                add_numbered("\n❌ Questions NOT Answered by This Report:", cq.get("questions_unanswered"))
+                add_numbered("\n👥 Missing Perspectives:", cq.get("missing_perspectives"))
                 
-                if "questions_unanswered" in cq and cq["questions_unanswered"]:
-                    output.append("\n❌ Questions NOT Answered by This Report:")
-                    for i, q in enumerate(cq["questions_unanswered"], 1):
-                        output.append(f"   {i}. {q}")
-                
-                if "missing_perspectives" in cq and cq["missing_perspectives"]:
-                    output.append("\n👥 Missing Perspectives:")
-                    for i, p in enumerate(cq["missing_perspectives"], 1):
-                        output.append(f"   {i}. {p}")
-                
-                if "hidden_agenda" in cq and cq.get("hidden_agenda"):
-                    output.append(f"\n🎭 Possible Hidden Agenda: {cq.get('hidden_agenda')}")
+                hidden_agenda = cq.get("hidden_agenda")
+                if hidden_agenda:
+                    output.append(f"\n🎭 Possible Hidden Agenda: {hidden_agenda}")
             
             # Opposition Viewpoint
-            if "opposition_viewpoint" in analysis and analysis.get("opposition_viewpoint"):
+            opposition_viewpoint = analysis.get("opposition_viewpoint")
+            if opposition_viewpoint:
                 output.append("\n" + "-" * 80)
                 output.append("🗣️  OPPOSITION VIEWPOINT:")
                 output.append("-" * 80)
-                output.append(f"\n{analysis.get('opposition_viewpoint')}")
+                output.append(f"\n{opposition_viewpoint}")
             
             # Beneficiary Analysis Section
             if "beneficiary_analysis" in analysis:
@@ -1648,80 +2182,27 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 
                 ba = analysis["beneficiary_analysis"]
                 
-                if "people_involved" in ba and ba.get("people_involved"):
-                    output.append("\n👥 PEOPLE/ENTITIES INVOLVED:")
-                    for i, person in enumerate(ba["people_involved"], 1):
-                        output.append(f"   {i}. {person}")
-                
-                if "direct_beneficiaries" in ba and ba.get("direct_beneficiaries"):
-                    output.append("\n✅ DIRECT BENEFICIARIES (Who Directly Gains):")
-                    for i, beneficiary in enumerate(ba["direct_beneficiaries"], 1):
-                        output.append(f"   {i}. {beneficiary}")
-                
-                if "indirect_beneficiaries" in ba and ba.get("indirect_beneficiaries"):
-                    output.append("\n🔗 INDIRECT BENEFICIARIES (Who Gains Indirectly):")
-                    for i, beneficiary in enumerate(ba["indirect_beneficiaries"], 1):
-                        output.append(f"   {i}. {beneficiary}")
-                
-                if "political_beneficiaries" in ba and ba.get("political_beneficiaries"):
-                    output.append("\n🏛️  POLITICAL BENEFICIARIES:")
-                    for i, beneficiary in enumerate(ba["political_beneficiaries"], 1):
-                        output.append(f"   {i}. {beneficiary}")
-                
-                if "economic_beneficiaries" in ba and ba.get("economic_beneficiaries"):
-                    output.append("\n💵 ECONOMIC BENEFICIARIES:")
-                    for i, beneficiary in enumerate(ba["economic_beneficiaries"], 1):
-                        output.append(f"   {i}. {beneficiary}")
+                add_numbered("\n👥 PEOPLE/ENTITIES INVOLVED:", ba.get("people_involved"))
+                add_numbered("\n✅ DIRECT BENEFICIARIES (Who Directly Gains):", ba.get("direct_beneficiaries"))
+                add_numbered("\n🔗 INDIRECT BENEFICIARIES (Who Gains Indirectly):", ba.get("indirect_beneficiaries"))
+                add_numbered("\n🏛️  POLITICAL BENEFICIARIES:", ba.get("political_beneficiaries"))
+                add_numbered("\n💵 ECONOMIC BENEFICIARIES:", ba.get("economic_beneficiaries"))
                 
                 if "connections_and_relationships" in ba:
                     connections = ba["connections_and_relationships"]
                     output.append("\n🔗 CONNECTIONS & RELATIONSHIPS:")
                     
-                    if "media_connections" in connections and connections.get("media_connections"):
-                        output.append("\n   📺 Media Connections:")
-                        for conn in connections["media_connections"][:5]:
-                            output.append(f"      • {conn}")
-                    
-                    if "business_relationships" in connections and connections.get("business_relationships"):
-                        output.append("\n   💼 Business Relationships:")
-                        for conn in connections["business_relationships"][:5]:
-                            output.append(f"      • {conn}")
-                    
-                    if "political_affiliations" in connections and connections.get("political_affiliations"):
-                        output.append("\n   🏛️  Political Affiliations:")
-                        for conn in connections["political_affiliations"][:5]:
-                            output.append(f"      • {conn}")
-                    
-                    if "undisclosed_relationships" in connections and connections.get("undisclosed_relationships"):
-                        output.append("\n   ⚠️  UNDISCLOSED RELATIONSHIPS:")
-                        for conn in connections["undisclosed_relationships"][:5]:
-                            output.append(f"      • {conn}")
-                
-                if "conflict_of_interest" in ba and ba.get("conflict_of_interest"):
-                    output.append("\n⚠️  CONFLICTS OF INTEREST:")
-                    for i, conflict in enumerate(ba["conflict_of_interest"], 1):
-                        output.append(f"   {i}. {conflict}")
-                
-                if "real_news_hidden" in ba and ba.get("real_news_hidden"):
-                    output.append("\n🔍 REAL NEWS BEING HIDDEN:")
-                    output.append(f"   {ba.get('real_news_hidden')}")
-                
-                if "agenda_masking" in ba and ba.get("agenda_masking"):
-                    output.append("\n🎭 AGENDA MASKING (What Bigger Story is Hidden):")
-                    output.append(f"   {ba.get('agenda_masking')}")
+                    add_bullets("\n   📺 Media Connections:", connections.get("media_connections"), "      ", 5)
+                    add_bullets("\n   💼 Business Relationships:", connections.get("business_relationships"), "      ", 5)
+                    add_bullets("\n   🏛️  Political Affiliations:", connections.get("political_affiliations"), "      ", 5)
+                    add_bullets("\n   ⚠️  UNDISCLOSED RELATIONSHIPS:", connections.get("undisclosed_relationships"), "      ", 5)
                 
-                if "timing_analysis" in ba and ba.get("timing_analysis"):
-                    output.append("\n⏰ TIMING ANALYSIS (Why Now?):")
-                    output.append(f"   {ba.get('timing_analysis')}")
-                
-                if "distraction_purpose" in ba and ba.get("distraction_purpose"):
-                    output.append("\n🎪 DISTRACTION PURPOSE:")
-                    output.append(f"   {ba.get('distraction_purpose')}")
-                
-                if "who_loses" in ba and ba.get("who_loses"):
-                    output.append("\n❌ WHO STANDS TO LOSE (If Real Story Comes Out):")
-                    for i, entity in enumerate(ba["who_loses"], 1):
-                        output.append(f"   {i}. {entity}")
+                add_numbered("\n⚠️  CONFLICTS OF INTEREST:", ba.get("conflict_of_interest"))
+                add_text("\n🔍 REAL NEWS BEING HIDDEN:", ba.get("real_news_hidden"))
+                add_text("\n🎭 AGENDA MASKING (What Bigger Story is Hidden):", ba.get("agenda_masking"))
+                add_text("\n⏰ TIMING ANALYSIS (Why Now?):", ba.get("timing_analysis"))
+                add_text("\n🎪 DISTRACTION PURPOSE:", ba.get("distraction_purpose"))
+                add_numbered("\n❌ WHO STANDS TO LOSE (If Real Story Comes Out):", ba.get("who_loses"))
             
             # Detailed scores
             output.append("\n" + "-" * 80)
@@ -1732,15 +2213,17 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 fa = analysis["factual_accuracy"]
                 output.append(f"\n✅ Factual Accuracy: {fa.get('score', 'N/A')}/30")
                 output.append(f"   {fa.get('reasoning', 'N/A')}")
-                if "missing_evidence" in fa and fa.get("missing_evidence"):
-                    output.append(f"   ⚠️  Missing Evidence: {', '.join(fa['missing_evidence'][:3])}")
+                missing_evidence = fa.get("missing_evidence")
+                if missing_evidence:
+                    output.append(f"   ⚠️  Missing Evidence: {', '.join(missing_evidence[:3])}")
             
             if "source_credibility" in analysis:
                 sc = analysis["source_credibility"]
                 output.append(f"\n📚 Source Credibility: {sc.get('score', 'N/A')}/20")
                 output.append(f"   {sc.get('reasoning', 'N/A')}")
-                if "sources_missing" in sc and sc.get("sources_missing"):
-                    output.append(f"   ⚠️  Missing Sources: {', '.join(sc['sources_missing'][:3])}")
+                sources_missing = sc.get("sources_missing")
+                if sources_missing:
+                    output.append(f"   ⚠️  Missing Sources: {', '.join(sources_missing[:3])}")
                 if "one_sided" in sc and sc.get("one_sided", "").lower() in ["yes", "true"]:
                     output.append(f"   ⚠️  One-Sided Reporting: {sc.get('one_sided')}")
             
@@ -1758,12 +2241,15 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 ir = analysis["india_relevance"]
                 output.append(f"\n🇮🇳 India Relevance: {ir.get('score', 'N/A')}/20")
                 output.append(f"   {ir.get('reasoning', 'N/A')}")
-                if "claimed_relevance" in ir and ir.get("claimed_relevance"):
-                    output.append(f"   📢 Claimed: {ir.get('claimed_relevance')}")
-                if "actual_relevance" in ir and ir.get("actual_relevance"):
-                    output.append(f"   ✅ Actual: {ir.get('actual_relevance')}")
-                if "citizen_concerns" in ir and ir.get("citizen_concerns"):
-                    output.append(f"   👥 Citizen Concerns: {', '.join(ir['citizen_concerns'][:3])}")
+                claimed_relevance = ir.get("claimed_relevance")
+                if claimed_relevance:
+                    output.append(f"   📢 Claimed: {claimed_relevance}")
+                actual_relevance = ir.get("actual_relevance")
+                if actual_relevance:
+                    output.append(f"   ✅ Actual: {actual_relevance}")
+                citizen_concerns = ir.get("citizen_concerns")
+                if citizen_concerns:
+                    output.append(f"   👥 Citizen Concerns: {', '.join(citizen_concerns[:3])}")
             
             # India-specific analysis
             if "india_specific_analysis" in analysis:
@@ -1774,8 +2260,9 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 output.append(f"\n📌 Relevance: {isa.get('relevance_to_india', 'N/A')}")
                 output.append(f"\n💡 Impact: {isa.get('potential_impact', 'N/A')}")
                 output.append(f"\n⚠️  Harm Assessment: {isa.get('harm_assessment', 'N/A')}")
-                if "citizen_rights" in isa and isa.get("citizen_rights"):
-                    output.append(f"\n⚖️  Citizen Rights: {isa.get('citizen_rights')}")
+                citizen_rights = isa.get("citizen_rights")
+                if citizen_rights:
+                    output.append(f"\n⚖️  Citizen Rights: {citizen_rights}")
                 output.append(f"\n💬 Recommendation: {isa.get('recommendation', 'N/A')}")
             
             # Verdict
@@ -1792,47 +2279,15 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 output.append("=" * 80)
                 ca = analysis["citizen_accountability"]
                 
-                if "questions_citizens_should_ask" in ca and ca["questions_citizens_should_ask"]:
-                    output.append("\n❓ Questions Indian Citizens Should Be Asking:")
-                    for i, q in enumerate(ca["questions_citizens_should_ask"], 1):
-                        output.append(f"   {i}. {q}")
-                
-                if "topics_should_have_covered" in ca and ca["topics_should_have_covered"]:
-                    output.append("\n📋 Topics Article SHOULD Have Covered (For Accountability):")
-                    for i, topic in enumerate(ca["topics_should_have_covered"], 1):
-                        output.append(f"   {i}. {topic}")
-                
-                if "information_citizens_need" in ca and ca["information_citizens_need"]:
-                    output.append("\n📰 Information Citizens NEED (But Article Doesn't Provide):")
-                    for i, info in enumerate(ca["information_citizens_need"], 1):
-                        output.append(f"   {i}. {info}")
-                
-                if "accountability_gaps" in ca and ca["accountability_gaps"]:
-                    output.append("\n⚖️  Accountability Gaps (What Should Have Been Addressed):")
-                    for i, gap in enumerate(ca["accountability_gaps"], 1):
-                        output.append(f"   {i}. {gap}")
-                
-                if "transparency_issues" in ca and ca["transparency_issues"]:
-                    output.append("\n🔍 Transparency Issues (Questions That Should Have Been Asked):")
-                    for i, issue in enumerate(ca["transparency_issues"], 1):
-                        output.append(f"   {i}. {issue}")
-                
-                if "what_should_have_been_investigated" in ca and ca["what_should_have_been_investigated"]:
-                    output.append("\n🔎 What Should Have Been Investigated:")
-                    for i, inv in enumerate(ca["what_should_have_been_investigated"], 1):
-                        output.append(f"   {i}. {inv}")
-                
-                if "real_citizen_impact" in ca and ca.get("real_citizen_impact"):
-                    output.append(f"\n💡 Real Impact on Citizens (Not Covered):")
-                    output.append(f"   {ca.get('real_citizen_impact')}")
-                
-                if "democratic_accountability" in ca and ca.get("democratic_accountability"):
-                    output.append(f"\n🗳️  Democratic Accountability (How It Should Have Been Reported):")
-                    output.append(f"   {ca.get('democratic_accountability')}")
-                
-                if "citizen_right_to_know" in ca and ca.get("citizen_right_to_know"):
-                    output.append(f"\n📜 Citizen's Right to Know (What's Missing):")
-                    output.append(f"   {ca.get('citizen_right_to_know')}")
+                add_numbered("\n❓ Questions Indian Citizens Should Be Asking:", ca.get("questions_citizens_should_ask"))
+                add_numbered("\n📋 Topics Article SHOULD Have Covered (For Accountability):", ca.get("topics_should_have_covered"))
+                add_numbered("\n📰 Information Citizens NEED (But Article Doesn't Provide):", ca.get("information_citizens_need"))
+                add_numbered("\n⚖️  Accountability Gaps (What Should Have Been Addressed):", ca.get("accountability_gaps"))
+                add_numbered("\n🔍 Transparency Issues (Questions That Should Have Been Asked):", ca.get("transparency_issues"))
+                add_numbered("\n🔎 What Should Have Been Investigated:", ca.get("what_should_have_been_investigated"))
+                add_text("\n💡 Real Impact on Citizens (Not Covered):", ca.get("real_citizen_impact"))
+                add_text("\n🗳️  Democratic Accountability (How It Should Have Been Reported):", ca.get("democratic_accountability"))
+                add_text("\n📜 Citizen's Right to Know (What's Missing):", ca.get("citizen_right_to_know"))
             
             # World-Class Comparison Section
             if "world_class_comparison" in analysis:
@@ -1860,34 +2315,23 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                             output.append(f"      This Article: {article_score}/100")
                             output.append(f"      World Standard: {world_std}/100")
                             output.append(f"      Gap: {gap:+.0f} points")
-                            if cat_data.get("assessment"):
-                                output.append(f"      Assessment: {cat_data.get('assessment')}")
+                            assessment = cat_data.get("assessment")
+                            if assessment:
+                                output.append(f"      Assessment: {assessment}")
                 
                 if "world_class_benchmarks" in wcc:
                     benchmarks = wcc["world_class_benchmarks"]
                     output.append("\n🏆 Comparison with World's Best:")
                     output.append("-" * 80)
                     
-                    if "bbc_standard" in benchmarks:
-                        output.append(f"\n   BBC: {benchmarks['bbc_standard']}")
-                    if "reuters_standard" in benchmarks:
-                        output.append(f"\n   Reuters: {benchmarks['reuters_standard']}")
-                    if "guardian_standard" in benchmarks:
-                        output.append(f"\n   The Guardian: {benchmarks['guardian_standard']}")
-                    if "nyt_standard" in benchmarks:
-                        output.append(f"\n   New York Times: {benchmarks['nyt_standard']}")
-                    if "overall_assessment" in benchmarks:
-                        output.append(f"\n   Overall: {benchmarks['overall_assessment']}")
+                    for key, label in (("bbc_standard", "BBC"), ("reuters_standard", "Reuters"),
+                                       ("guardian_standard", "The Guardian"), ("nyt_standard", "New York Times"),
+                                       ("overall_assessment", "Overall")):
+                        if key in benchmarks:
+                            output.append(f"\n   {label}: {benchmarks[key]}")
                 
-                if "strengths" in wcc and wcc.get("strengths"):
-                    output.append("\n✅ Strengths (Matches World-Class):")
-                    for strength in wcc["strengths"]:
-                        output.append(f"   • {strength}")
-                
-                if "improvement_needed" in wcc and wcc.get("improvement_needed"):
-                    output.append("\n⚠️  Areas Needing Improvement:")
-                    for improvement in wcc["improvement_needed"]:
-                        output.append(f"   • {improvement}")
+                add_bullets("\n✅ Strengths (Matches World-Class):", wcc.get("strengths"))
+                add_bullets("\n⚠️  Areas Needing Improvement:", wcc.get("improvement_needed"))
             
             # True Report Section - How It Should Have Been Reported
             if "true_report" in analysis:
@@ -1899,27 +2343,20 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 
                 tr = analysis["true_report"]
                 
-                if "title" in tr and tr.get("title"):
-                    output.append(f"\n📌 PROPER TITLE:")
-                    output.append(f"   {tr.get('title')}")
-                
-                if "lead_paragraph" in tr and tr.get("lead_paragraph"):
-                    output.append(f"\n📝 LEAD PARAGRAPH:")
-                    output.append(f"   {tr.get('lead_paragraph')}")
+                add_text("\n📌 PROPER TITLE:", tr.get("title"))
+                add_text("\n📝 LEAD PARAGRAPH:", tr.get("lead_paragraph"))
                 
-                if "full_report" in tr and tr.get("full_report"):
-                    output.append(f"\n📄 COMPLETE REPORT:")
+                report = tr.get("full_report")
+                if report:
+                    output.append("\n📄 COMPLETE REPORT:")
                     output.append("-" * 80)
                     # Split into paragraphs for readability
-                    report = tr.get("full_report")
-                    paragraphs = [p.strip() for p in report.split('\n\n') if p.strip()]
-                    for para in paragraphs:
-                        output.append(f"\n{para}")
+                    output.extend(f"\n{para.strip()}" for para in report.split('\n\n') if para.strip())
                     output.append("-" * 80)
                 
                 if "sections" in tr:
                     sections = tr["sections"]
-                    output.append(f"\n📋 REPORT SECTIONS:")
+                    output.append("\n📋 REPORT SECTIONS:")
                     
                     section_order = [
                         ("background_context", "Background & Context"),
@@ -1935,72 +2372,34 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                     ]
                     
                     for key, label in section_order:
-                        if key in sections and sections.get(key):
+                        content = sections.get(key)
+                        if content:
                             output.append(f"\n   🔹 {label}:")
-                            content = sections[key]
                             if isinstance(content, list):
-                                for item in content:
-                                    output.append(f"      • {item}")
+                                output.extend(f"      • {item}" for item in content)
                             else:
-                                # Split long content into lines
-                                lines = content.split('. ')
-                                for line in lines[:5]:  # Limit to first 5 points
-                                    if line.strip():
-                                        output.append(f"      • {line.strip()}.")
+                                # Split long content into lines, limited to the first 5 points
+                                output.extend(f"      • {line.strip()}." for line in content.split('. ')[:5] if line.strip())
             
                 if "sources_and_references" in tr:
                     sources = tr["sources_and_references"]
-                    output.append(f"\n📚 SOURCES & REFERENCES (What Should Have Been Used):")
+                    output.append("\n📚 SOURCES & REFERENCES (What Should Have Been Used):")
                     
-                    if "primary_sources" in sources and sources.get("primary_sources"):
-                        output.append(f"\n   📄 Primary Sources:")
-                        for src in sources["primary_sources"][:5]:
-                            output.append(f"      • {src}")
-                    
-                    if "expert_sources" in sources and sources.get("expert_sources"):
-                        output.append(f"\n   👨‍🔬 Expert Sources:")
-                        for src in sources["expert_sources"][:5]:
-                            output.append(f"      • {src}")
-                    
-                    if "official_sources" in sources and sources.get("official_sources"):
-                        output.append(f"\n   🏛️  Official Sources:")
-                        for src in sources["official_sources"][:5]:
-                            output.append(f"      • {src}")
-                    
-                    if "data_sources" in sources and sources.get("data_sources"):
-                        output.append(f"\n   📊 Data Sources:")
-                        for src in sources["data_sources"][:5]:
-                            output.append(f"      • {src}")
-                    
-                    if "independent_sources" in sources and sources.get("independent_sources"):
-                        output.append(f"\n   🔍 Independent Sources:")
-                        for src in sources["independent_sources"][:5]:
-                            output.append(f"      • {src}")
-                    
-                    if "opposition_perspectives" in sources and sources.get("opposition_perspectives"):
-                        output.append(f"\n   ⚖️  Opposition/Alternative Perspectives:")
-                        for src in sources["opposition_perspectives"][:5]:
-                            output.append(f"      • {src}")
+                    add_bullets("\n   📄 Primary Sources:", sources.get("primary_sources"), "      ", 5)
+                    add_bullets("\n   👨‍🔬 Expert Sources:", sources.get("expert_sources"), "      ", 5)
+                    add_bullets("\n   🏛️  Official Sources:", sources.get("official_sources"), "      ", 5)
+                    add_bullets("\n   📊 Data Sources:", sources.get("data_sources"), "      ", 5)
+                    add_bullets("\n   🔍 Independent Sources:", sources.get("independent_sources"), "      ", 5)
+                    add_bullets("\n   ⚖️  Opposition/Alternative Perspectives:", sources.get("opposition_perspectives"), "      ", 5)
                 
                 if "reporting_standards" in tr:
                     standards = tr["reporting_standards"]
-                    output.append(f"\n📋 REPORTING STANDARDS:")
-                    
-                    if "what_was_missing" in standards and standards.get("what_was_missing"):
-                        output.append(f"\n   ❌ What Was Missing in Original:")
-                        output.append(f"      {standards.get('what_was_missing')}")
-                    
-                    if "how_to_improve" in standards and standards.get("how_to_improve"):
-                        output.append(f"\n   ✅ How Reporting Should Be Improved:")
-                        output.append(f"      {standards.get('how_to_improve')}")
-                    
-                    if "journalistic_standards" in standards and standards.get("journalistic_standards"):
-                        output.append(f"\n   📰 Journalistic Standards:")
-                        output.append(f"      {standards.get('journalistic_standards')}")
+                    output.append("\n📋 REPORTING STANDARDS:")
                     
-                    if "citizen_focus" in standards and standards.get("citizen_focus"):
-                        output.append(f"\n   👥 Citizen-Focused Reporting:")
-                        output.append(f"      {standards.get('citizen_focus')}")
+                    add_text("\n   ❌ What Was Missing in Original:", standards.get("what_was_missing"), "      ")
+                    add_text("\n   ✅ How Reporting Should Be Improved:", standards.get("how_to_improve"), "      ")
+                    add_text("\n   📰 Journalistic Standards:", standards.get("journalistic_standards"), "      ")
+                    add_text("\n   👥 Citizen-Focused Reporting:", standards.get("citizen_focus"), "      ")
             
             # Related Articles Section
             if "related_articles" in result:
@@ -2018,21 +2417,24 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                         output.append(f"   🔗 URL: {article.get('url', 'N/A')}")
                         output.append(f"   📊 Relevance Score: {article.get('relevance_score', 0)}")
                         
-                        if article.get('summary'):
-                            output.append(f"   📝 Summary: {article.get('summary', '')[:150]}...")
+                        summary = article.get('summary')
+                        if summary:
+                            output.append(f"   📝 Summary: {summary[:150]}...")
                         
                         comparison = article.get("comparison", {})
                         if comparison:
-                            if comparison.get("common_topics"):
-                                output.append(f"   🔄 Common Topics: {', '.join(comparison['common_topics'][:5])}")
+                            common_topics = comparison.get("common_topics")
+                            if common_topics:
+                                output.append(f"   🔄 Common Topics: {', '.join(common_topics[:5])}")
                             
-                            if comparison.get("topics_in_related_not_in_current"):
-                                output.append(f"   ➕ Topics in Related (Missing in Current): {', '.join(comparison['topics_in_related_not_in_current'][:5])}")
+                            related_topics = comparison.get("topics_in_related_not_in_current")
+                            if related_topics:
+                                output.append(f"   ➕ Topics in Related (Missing in Current): {', '.join(related_topics[:5])}")
                             
-                            if comparison.get("information_in_related_not_in_current"):
-                                output.append(f"   ⚠️  Information in Related Article (Not in Current):")
-                                for info in comparison["information_in_related_not_in_current"]:
-                                    output.append(f"      • {info[:200]}...")
+                            related_info = comparison.get("information_in_related_not_in_current")
+                            if related_info:
+                                output.append("   ⚠️  Information in Related Article (Not in Current):")
+                                output.extend(f"      • {info[:200]}..." for info in related_info)
                         
                         output.append("")  # Empty line between articles
                 else:
@@ -2043,14 +2445,12 @@ CRITICAL INSTRUCTION FOR "true_report.full_report":
                 output.append("\n" + "-" * 80)
                 output.append("🔍 CRITICAL FINDINGS - What's Wrong, What's Missing:")
                 output.append("-" * 80)
-                for i, finding in enumerate(analysis["critical_findings"], 1):
-                    output.append(f"\n{i}. {finding}")
+                output.extend(f"\n{i}. {finding}" for i, finding in enumerate(analysis["critical_findings"], 1))
             elif "key_findings" in analysis:
                 output.append("\n" + "-" * 80)
                 output.append("🔍 KEY FINDINGS:")
                 output.append("-" * 80)
-                for i, finding in enumerate(analysis["key_findings"], 1):
-                    output.append(f"\n{i}. {finding}")
+                output.extend(f"\n{i}. {finding}" for i, finding in enumerate(analysis["key_findings"], 1))
         
         else:
             output.append("\n⚠️  Could not parse analysis. Raw response:")
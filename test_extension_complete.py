@@ -247,9 +247,9 @@ def test_streamlit_integration():
         app_content = f.read()
     
     checks = [
-        ('st.query_params.get("content"', "Content parameter handling"),
-        ('st.query_params.get("url"', "URL parameter handling"),
-        ('base64.b64decode', "Base64 decoding"),
+        ('query_params.get("content"', "Content parameter handling"),
+        ('query_params.get("url"', "URL parameter handling"),
+        ('base64.urlsafe_b64decode', "Base64 decoding"),
         ('json.loads', "JSON parsing"),
         ('auto_analyzed', "Auto-analysis flag"),
         ('display_analysis_result', "Result display function"),